@@ -0,0 +1,77 @@
+import asyncio
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import respx
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt import PyJWK
+from jwt.algorithms import RSAAlgorithm
+from pytest import fixture
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.constants import SUPPORTED_CDI_VERSIONS
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import jwks
+from supertokens_python.recipe.session.jwks import CachedKeys
+
+from .utils import CORE_HOST, KID, StubCore, reset
+
+
+def pytest_configure():
+    import os
+
+    os.environ.setdefault("SUPERTOKENS_ENV", "testing")
+
+
+@fixture(scope="session")
+def signing_key() -> Tuple[Any, PyJWK]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_jwk: Dict[str, Any] = json.loads(
+        RSAAlgorithm.to_jwk(private_key.public_key())
+    )
+    public_jwk.update({"kid": KID, "alg": "RS256", "use": "sig"})
+    return private_key, PyJWK(public_jwk)
+
+
+@fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@fixture
+def stub_core() -> Iterator[StubCore]:
+    core = StubCore(
+        {"/recipe/session/remove": {"sessionHandlesRevoked": ["session-handle"]}}
+    )
+    with respx.mock(assert_all_called=False) as mocker:
+        mocker.route(url__startswith=CORE_HOST).mock(side_effect=core.handle)
+        yield core
+
+
+@fixture
+def init_supertokens(signing_key: Tuple[Any, PyJWK]) -> Iterator[Callable[..., None]]:
+    def _init(
+        supertokens_config: Optional[SupertokensConfig] = None,
+        recipe_list: Optional[List[Any]] = None,
+    ):
+        reset()
+        init(
+            supertokens_config=supertokens_config or SupertokensConfig(CORE_HOST),
+            app_info=InputAppInfo(
+                app_name="SuperTokens Demo",
+                api_domain="https://api.example.com",
+                website_domain="https://example.com",
+                api_base_path="/auth",
+            ),
+            framework="fastapi",
+            recipe_list=recipe_list or [session.init()],
+        )
+        Querier.api_version = SUPPORTED_CDI_VERSIONS[-1]
+        # A warm JWKS cache, as in a process that has already verified a token
+        jwks.cached_keys = CachedKeys([signing_key[1]], 60)
+
+    yield _init
+    reset()
@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Callable, Tuple
+
+from fastapi import Response
+from jwt import PyJWK
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from supertokens_python import Supertokens
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+
+from .utils import StubCore, create_access_token, get_request
+
+
+def test_middleware_passes_through_app_requests(
+    benchmark: BenchmarkFixture,
+    init_supertokens: Callable[..., None],
+    loop: asyncio.AbstractEventLoop,
+):
+    init_supertokens()
+    st = Supertokens.get_instance()
+
+    def run():
+        request = get_request("/api/user")
+        return loop.run_until_complete(
+            st.middleware(request, FastApiResponse(Response()), {})
+        )
+
+    assert benchmark(run) is None
+
+
+def test_middleware_dispatches_sign_out(
+    benchmark: BenchmarkFixture,
+    init_supertokens: Callable[..., None],
+    signing_key: Tuple[Any, PyJWK],
+    stub_core: StubCore,
+    loop: asyncio.AbstractEventLoop,
+):
+    init_supertokens()
+    st = Supertokens.get_instance()
+    headers = {"authorization": f"Bearer {create_access_token(signing_key[0], 5)}"}
+
+    def run():
+        request = get_request("/auth/signout", method="POST", headers=headers)
+        return loop.run_until_complete(
+            st.middleware(request, FastApiResponse(Response()), {})
+        )
+
+    response = benchmark(run)
+    assert response is not None and response.status_code == 200
+    assert stub_core.calls > 0
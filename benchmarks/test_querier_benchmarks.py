@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, Callable, Dict
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from supertokens_python import SupertokensConfig
+from supertokens_python.querier import NormalisedURLPath, Querier
+
+from .utils import CORE_HOST, StubCore
+
+PATH = NormalisedURLPath("/recipe/session")
+
+
+def test_get_round_trip(
+    benchmark: BenchmarkFixture,
+    init_supertokens: Callable[..., None],
+    stub_core: StubCore,
+    loop: asyncio.AbstractEventLoop,
+):
+    init_supertokens(SupertokensConfig(CORE_HOST, disable_core_call_cache=True))
+    q = Querier.get_instance()
+
+    def run():
+        return loop.run_until_complete(
+            q.send_get_request(PATH, {"sessionHandle": "session-handle"}, {})
+        )
+
+    assert benchmark(run)["status"] == "OK"
+    assert stub_core.calls > 0
+
+
+def test_cached_get(
+    benchmark: BenchmarkFixture,
+    init_supertokens: Callable[..., None],
+    stub_core: StubCore,
+    loop: asyncio.AbstractEventLoop,
+):
+    init_supertokens()
+    q = Querier.get_instance()
+    # The same user_context, like repeated lookups while handling one request
+    user_context: Dict[str, Any] = {}
+
+    def run():
+        return loop.run_until_complete(
+            q.send_get_request(PATH, {"sessionHandle": "session-handle"}, user_context)
+        )
+
+    assert benchmark(run)["status"] == "OK"
+    assert stub_core.calls == 1
+
+
+def test_post_round_trip(
+    benchmark: BenchmarkFixture,
+    init_supertokens: Callable[..., None],
+    stub_core: StubCore,
+    loop: asyncio.AbstractEventLoop,
+):
+    init_supertokens()
+    q = Querier.get_instance()
+
+    def run():
+        return loop.run_until_complete(
+            q.send_post_request(PATH, {"userId": "user-id"}, {})
+        )
+
+    assert benchmark(run)["status"] == "OK"
+    assert stub_core.calls > 0
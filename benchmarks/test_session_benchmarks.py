@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any, Callable, Dict, Tuple
+
+from jwt import PyJWK
+from pytest import mark
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from supertokens_python.recipe.emailverification import EmailVerificationClaim
+from supertokens_python.recipe.session import SessionRecipe
+from supertokens_python.recipe.session.asyncio import get_session
+from supertokens_python.recipe.session.cookie_and_header import (
+    _parse_cookie_string_from_request_header_allow_duplicates,
+    build_front_token,
+)
+from supertokens_python.recipe.session.jwt import (
+    parse_jwt_without_signature_verification,
+)
+from supertokens_python.recipe.userroles import PermissionClaim, UserRoleClaim
+from supertokens_python.types import RecipeUserId
+
+from .utils import create_access_token, get_request
+
+COOKIE_HEADER = (
+    "_ga=GA1.1.1234567890.1700000000; theme=dark; "
+    "sAccessToken=eyJraWQiOiJkLTEyMzQiLCJ0eXAiOiJKV1QiLCJ2ZXJzaW9uIjoiNSJ9.e30.c2ln; "
+    "sFrontToken=eyJ1aWQiOiJ1c2VyLWlkIn0%3D; st-last-access-token-update=1700000000000; "
+    "locale=en-GB"
+)
+
+TYPICAL_PAYLOAD: Dict[str, Any] = {
+    "sub": "user-id",
+    "rsub": "user-id",
+    "exp": 1700003600,
+    "iat": 1700000000,
+    "sessionHandle": "session-handle",
+    "refreshTokenHash1": "hash",
+    "parentRefreshTokenHash1": None,
+    "antiCsrfToken": None,
+    "tId": "public",
+    "iss": "https://api.example.com/auth",
+}
+
+
+@mark.parametrize("version", [2, 3, 5])
+def test_get_session_with_cached_jwks(
+    benchmark: BenchmarkFixture,
+    init_supertokens: Callable[..., None],
+    signing_key: Tuple[Any, PyJWK],
+    loop: asyncio.AbstractEventLoop,
+    version: int,
+):
+    init_supertokens()
+    headers = {
+        "authorization": f"Bearer {create_access_token(signing_key[0], version)}"
+    }
+
+    def run():
+        request = get_request("/api/user", headers=headers)
+        return loop.run_until_complete(get_session(request))
+
+    s = benchmark(run)
+    assert s is not None and s.get_user_id() == "user-id"
+
+
+def test_parse_jwt_without_signature_verification(
+    benchmark: BenchmarkFixture, signing_key: Tuple[Any, PyJWK]
+):
+    token = create_access_token(signing_key[0], 5)
+
+    info = benchmark(parse_jwt_without_signature_verification, token)
+    assert info.version == 5
+
+
+def test_cookie_parsing(benchmark: BenchmarkFixture):
+    cookies = benchmark(
+        _parse_cookie_string_from_request_header_allow_duplicates, COOKIE_HEADER
+    )
+    assert len(cookies) == 6
+
+
+def test_validate_claims(
+    benchmark: BenchmarkFixture,
+    init_supertokens: Callable[..., None],
+    loop: asyncio.AbstractEventLoop,
+):
+    init_supertokens()
+    payload = dict(TYPICAL_PAYLOAD)
+    EmailVerificationClaim.add_to_payload_(payload, True)
+    UserRoleClaim.add_to_payload_(payload, ["admin", "user"])
+    PermissionClaim.add_to_payload_(payload, ["read", "write"])
+    validators = [
+        EmailVerificationClaim.validators.is_verified(),
+        UserRoleClaim.validators.includes("admin"),
+        PermissionClaim.validators.includes("read"),
+    ]
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+
+    def run():
+        return loop.run_until_complete(
+            recipe_implementation.validate_claims(
+                "user-id", RecipeUserId("user-id"), payload, validators, {}
+            )
+        )
+
+    result = benchmark(run)
+    assert result.invalid_claims == []
+    assert result.access_token_payload_update is None
+
+
+def test_build_front_token(benchmark: BenchmarkFixture):
+    front_token = benchmark(
+        build_front_token, "user-id", 1700003600000, TYPICAL_PAYLOAD
+    )
+    assert len(front_token) > 0
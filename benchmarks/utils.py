@@ -0,0 +1,136 @@
+import json
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import jwt
+from jwt.algorithms import RSAAlgorithm
+from starlette.requests import Request
+
+from supertokens_python import Supertokens
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.process_state import ProcessState
+from supertokens_python.recipe.accountlinking.recipe import AccountLinkingRecipe
+from supertokens_python.recipe.dashboard import DashboardRecipe
+from supertokens_python.recipe.emailpassword import EmailPasswordRecipe
+from supertokens_python.recipe.emailverification import EmailVerificationRecipe
+from supertokens_python.recipe.jwt import JWTRecipe
+from supertokens_python.recipe.multifactorauth.recipe import MultiFactorAuthRecipe
+from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+from supertokens_python.recipe.passwordless import PasswordlessRecipe
+from supertokens_python.recipe.session import SessionRecipe
+from supertokens_python.recipe.thirdparty import ThirdPartyRecipe
+from supertokens_python.recipe.totp.recipe import TOTPRecipe
+from supertokens_python.recipe.usermetadata import UserMetadataRecipe
+from supertokens_python.recipe.userroles import UserRolesRecipe
+from supertokens_python.utils import utf_base64encode
+
+CORE_HOST = "http://localhost:3567"
+KID = "d-1234"
+
+
+class StubCore:
+    """
+    An in-process core that answers every request with an OK response (plus
+    the fields in `responses` for its path), so that the benchmarks measure the
+    SDK rather than the network or a real core.
+    """
+
+    def __init__(self, responses: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.responses = responses or {}
+        self.calls = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        body = {"status": "OK", **self.responses.get(request.url.path, {})}
+        return httpx.Response(200, json=body)
+
+
+def reset():
+    # Like tests.utils.reset, but without a core to stop
+    ProcessState.get_instance().reset()
+    Supertokens.reset()
+    SessionRecipe.reset()
+    EmailPasswordRecipe.reset()
+    EmailVerificationRecipe.reset()
+    ThirdPartyRecipe.reset()
+    PasswordlessRecipe.reset()
+    JWTRecipe.reset()
+    UserMetadataRecipe.reset()
+    UserRolesRecipe.reset()
+    DashboardRecipe.reset()
+    MultitenancyRecipe.reset()
+    AccountLinkingRecipe.reset()
+    MultiFactorAuthRecipe.reset()
+    TOTPRecipe.reset()
+
+
+def create_access_token(private_key: Any, version: int) -> str:
+    now = int(time.time())
+    if version == 2:
+        # v2 tokens have a fixed header without a kid, and keep the session
+        # data in different claims
+        payload = {
+            "userId": "user-id",
+            "expiryTime": (now + 3600) * 1000,
+            "timeCreated": now * 1000,
+            "sessionHandle": "session-handle",
+            "refreshTokenHash1": "hash",
+            "parentRefreshTokenHash1": None,
+            "antiCsrfToken": None,
+            "userData": {"custom": "value"},
+        }
+        header = utf_base64encode(
+            json.dumps(
+                {"alg": "RS256", "typ": "JWT", "version": "2"},
+                separators=(",", ":"),
+                sort_keys=True,
+            ),
+            urlsafe=False,
+        )
+        body = utf_base64encode(
+            json.dumps(payload, separators=(",", ":")), urlsafe=True
+        ).rstrip("=")
+        signature = RSAAlgorithm(RSAAlgorithm.SHA256).sign(
+            f"{header}.{body}".encode(), private_key
+        )
+        return f"{header}.{body}.{jwt.utils.base64url_encode(signature).decode()}"
+
+    payload: Dict[str, Any] = {
+        "sub": "user-id",
+        "exp": now + 3600,
+        "iat": now,
+        "sessionHandle": "session-handle",
+        "refreshTokenHash1": "hash",
+        "parentRefreshTokenHash1": None,
+        "antiCsrfToken": None,
+        "custom": "value",
+    }
+    if version >= 4:
+        payload["tId"] = "public"
+    if version >= 5:
+        payload["rsub"] = "user-id"
+    return jwt.encode(
+        payload,
+        private_key,
+        algorithm="RS256",
+        headers={"typ": "JWT", "version": str(version), "kid": KID},
+    )
+
+
+def get_request(
+    path: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+) -> FastApiRequest:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+        ],
+    }
+    return FastApiRequest(Request(scope))
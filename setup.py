@@ -59,6 +59,7 @@ extras_require = {
             "tzdata",
         ]
     ),
+    "opentelemetry": (["opentelemetry-api"]),
 }
 
 exclude_list = [
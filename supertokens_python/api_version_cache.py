@@ -0,0 +1,76 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import tempfile
+from hashlib import sha256
+from typing import List, Optional
+
+from supertokens_python.constants import SUPPORTED_CDI_VERSIONS
+from supertokens_python.logger import log_debug_message
+from supertokens_python.utils import get_timestamp_ms
+
+# The core can be upgraded while the file exists, so the negotiated version is
+# checked again after this long
+API_VERSION_FILE_CACHE_TTL_MS = 60 * 60 * 1000
+
+
+class APIVersionFileCache:
+    """
+    Shares the CDI version negotiated with the core between the processes on a
+    host (for example the workers of a prefork server), so that a newly started
+    worker doesn't need to query the core for it.
+    """
+
+    def __init__(self, cache_dir: str, hosts: List[str]):
+        # The negotiated version depends on both the core deployment and the
+        # versions this SDK supports
+        key_source = "\n".join(hosts + SUPPORTED_CDI_VERSIONS)
+        key = sha256(key_source.encode()).hexdigest()[:16]
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, f"supertokens-apiversion-{key}.json")
+
+    def read(self) -> Optional[str]:
+        try:
+            with open(self.path) as f:
+                content = json.load(f)
+            if (
+                get_timestamp_ms() - content["fetchedAt"]
+                > API_VERSION_FILE_CACHE_TTL_MS
+            ):
+                return None
+            api_version = content["apiVersion"]
+        except Exception as e:
+            log_debug_message("Could not read the API version cache file: %s", str(e))
+            return None
+
+        return api_version if api_version in SUPPORTED_CDI_VERSIONS else None
+
+    def write(self, api_version: str):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(
+                        {"fetchedAt": get_timestamp_ms(), "apiVersion": api_version},
+                        f,
+                    )
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            log_debug_message("Could not write the API version cache file: %s", str(e))
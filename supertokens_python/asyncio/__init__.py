@@ -11,7 +11,21 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Dict, List, Optional, Union, Any
+import asyncio
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import Literal
 
 from supertokens_python import Supertokens
 from supertokens_python.interfaces import (
@@ -26,8 +40,14 @@ from supertokens_python.interfaces import (
 )
 from supertokens_python.recipe.accountlinking.recipe import AccountLinkingRecipe
 from supertokens_python.recipe.accountlinking.interfaces import GetUsersResult
+from supertokens_python.querier import Querier
 from supertokens_python.types import AccountInfo, User
 
+_T = TypeVar("_T")
+
+DEFAULT_ITERATE_USERS_PAGE_SIZE = 100
+DEFAULT_ENRICH_USERS_CONCURRENCY = 10
+
 
 async def get_users_oldest_first(
     tenant_id: str,
@@ -71,6 +91,150 @@ async def get_users_newest_first(
     )
 
 
+async def _iterate_user_pages(
+    tenant_id: str,
+    time_joined_order: Literal["ASC", "DESC"],
+    page_size: int,
+    prefetch_pages: int,
+    include_recipe_ids: Union[None, List[str]],
+    query: Union[None, Dict[str, str]],
+    process_page: Callable[[List[User]], Awaitable[List[_T]]],
+    user_context: Dict[str, Any],
+) -> AsyncGenerator[List[_T], None]:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if prefetch_pages < 1:
+        raise ValueError("prefetch_pages must be at least 1")
+
+    recipe_implementation = AccountLinkingRecipe.get_instance().recipe_implementation
+    querier = Querier.get_instance()
+    # At most prefetch_pages processed pages wait here, plus the page being
+    # fetched and the page being consumed
+    queue: "asyncio.Queue[Union[List[_T], Exception, None]]" = asyncio.Queue(
+        maxsize=prefetch_pages
+    )
+
+    async def produce():
+        pagination_token: Optional[str] = None
+        try:
+            while True:
+                result = await recipe_implementation.get_users(
+                    tenant_id,
+                    time_joined_order=time_joined_order,
+                    limit=page_size,
+                    pagination_token=pagination_token,
+                    include_recipe_ids=include_recipe_ids,
+                    query=query,
+                    user_context=user_context,
+                )
+                # Otherwise every page would stay in the core call cache of the
+                # user_context until the iteration finishes
+                querier.invalidate_core_call_cache(user_context, False)
+
+                await queue.put(await process_page(result.users))
+
+                pagination_token = result.next_pagination_token
+                if pagination_token is None:
+                    break
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        producer.cancel()
+        # Wait for the producer to stop, so that it isn't destroyed while
+        # still pending when the iteration is stopped early
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def iterate_users(
+    tenant_id: str,
+    time_joined_order: Literal["ASC", "DESC"] = "ASC",
+    page_size: int = DEFAULT_ITERATE_USERS_PAGE_SIZE,
+    prefetch_pages: int = 1,
+    include_recipe_ids: Union[None, List[str]] = None,
+    query: Union[None, Dict[str, str]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> AsyncGenerator[User, None]:
+    if user_context is None:
+        user_context = {}
+
+    async def process_page(users: List[User]) -> List[User]:
+        return users
+
+    pages = _iterate_user_pages(
+        tenant_id,
+        time_joined_order,
+        page_size,
+        prefetch_pages,
+        include_recipe_ids,
+        query,
+        process_page,
+        user_context,
+    )
+    try:
+        async for page in pages:
+            for user in page:
+                yield user
+    finally:
+        # Stops the prefetching right away if the iteration is stopped early
+        await pages.aclose()
+
+
+async def iterate_users_with_enrichment(
+    tenant_id: str,
+    enrich: Callable[[User, Dict[str, Any]], Awaitable[_T]],
+    enrich_concurrency: int = DEFAULT_ENRICH_USERS_CONCURRENCY,
+    time_joined_order: Literal["ASC", "DESC"] = "ASC",
+    page_size: int = DEFAULT_ITERATE_USERS_PAGE_SIZE,
+    prefetch_pages: int = 1,
+    include_recipe_ids: Union[None, List[str]] = None,
+    query: Union[None, Dict[str, str]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> AsyncGenerator[Tuple[User, _T], None]:
+    if user_context is None:
+        user_context = {}
+    if enrich_concurrency < 1:
+        raise ValueError("enrich_concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(enrich_concurrency)
+
+    async def enrich_user(user: User) -> Tuple[User, _T]:
+        assert user_context is not None
+        async with semaphore:
+            return user, await enrich(user, user_context)
+
+    async def process_page(users: List[User]) -> List[Tuple[User, _T]]:
+        return list(await asyncio.gather(*[enrich_user(user) for user in users]))
+
+    pages = _iterate_user_pages(
+        tenant_id,
+        time_joined_order,
+        page_size,
+        prefetch_pages,
+        include_recipe_ids,
+        query,
+        process_page,
+        user_context,
+    )
+    try:
+        async for page in pages:
+            for item in page:
+                yield item
+    finally:
+        # Stops the prefetching right away if the iteration is stopped early
+        await pages.aclose()
+
+
 async def get_user_count(
     include_recipe_ids: Union[None, List[str]] = None,
     tenant_id: Optional[str] = None,
@@ -16,7 +16,7 @@ from supertokens_python.recipe.multifactorauth.asyncio import (
 )
 from supertokens_python.recipe.multifactorauth.recipe import MultiFactorAuthRecipe
 from supertokens_python.recipe.multifactorauth.utils import (
-    is_valid_first_factor,
+    get_valid_first_factors,
     update_and_get_mfa_related_info_in_session,
 )
 from supertokens_python.recipe.multitenancy.asyncio import associate_user_to_tenant
@@ -871,17 +871,15 @@ async def filter_out_invalid_first_factors_or_throw_if_all_are_invalid(
     has_session: bool,
     user_context: Dict[str, Any],
 ) -> List[str]:
-    valid_factor_ids: List[str] = []
-    for _id in factor_ids:
-        valid_res = await is_valid_first_factor(tenant_id, _id, user_context)
+    valid_factor_ids = await get_valid_first_factors(
+        tenant_id, factor_ids, user_context
+    )
 
-        if valid_res == "TENANT_NOT_FOUND_ERROR":
-            if has_session:
-                raise UnauthorisedError("Tenant not found")
-            else:
-                raise Exception("Tenant not found error.")
-        elif valid_res == "OK":
-            valid_factor_ids.append(_id)
+    if valid_factor_ids == "TENANT_NOT_FOUND_ERROR":
+        if has_session:
+            raise UnauthorisedError("Tenant not found")
+        else:
+            raise Exception("Tenant not found error.")
 
     if len(valid_factor_ids) == 0:
         if not has_session:
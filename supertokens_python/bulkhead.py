@@ -0,0 +1,122 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+from supertokens_python.utils import get_timestamp_ms
+
+
+class BulkheadConfig:
+    def __init__(
+        self, max_in_flight_per_host: int = 100, max_queue_wait_ms: int = 10000
+    ):
+        """
+        :param max_in_flight_per_host: The maximum number of requests that are
+            sent to a core host at the same time. Other requests wait for one of
+            them to finish.
+        :param max_queue_wait_ms: How long a request waits to be sent before
+            failing with `DeadlineExceededError`, if it doesn't have an earlier
+            deadline.
+        """
+        if max_in_flight_per_host < 1:
+            raise ValueError("max_in_flight_per_host must be at least 1")
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self.max_queue_wait_ms = max_queue_wait_ms
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+class Bulkhead:
+    # This doesn't use asyncio.Semaphore since that is bound to the event loop
+    # it is first used in, and the syncio functions can use more than one loop,
+    # each in its own thread
+    def __init__(self, config: BulkheadConfig):
+        self.config = config
+        self.in_flight = 0
+        self.waiters: Deque["asyncio.Future[None]"] = deque()
+        self.lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        with self.lock:
+            return len([w for w in self.waiters if not w.done()])
+
+    async def acquire(self, deadline: Optional[int]):
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            if self.in_flight < self.config.max_in_flight_per_host:
+                self.in_flight += 1
+                return
+
+            max_wait_ms = self.config.max_queue_wait_ms
+            if deadline is not None:
+                max_wait_ms = min(max_wait_ms, deadline - get_timestamp_ms())
+            if max_wait_ms <= 0:
+                raise DeadlineExceededError(
+                    "The request to the SuperTokens core could not be sent before its deadline"
+                )
+
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            self.waiters.append(waiter)
+
+        try:
+            # The slot is handed over by release, so in_flight is not updated here
+            await asyncio.wait_for(waiter, max_wait_ms / 1000)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(
+                "The request to the SuperTokens core could not be sent before its deadline"
+            )
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # We were handed a slot just as we were cancelled
+                self.release()
+            raise
+
+    def release(self):
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            running_loop = None
+
+        with self.lock:
+            while len(self.waiters) > 0:
+                waiter = self.waiters.popleft()
+                if waiter.done():
+                    continue
+                if waiter.get_loop() is running_loop:
+                    waiter.set_result(None)
+                    return
+                try:
+                    # Futures aren't thread safe, so the slot is handed over
+                    # in the thread of the waiter's loop
+                    waiter.get_loop().call_soon_threadsafe(self.__hand_over, waiter)
+                    return
+                except RuntimeError:
+                    # The waiter's loop has been closed
+                    continue
+            self.in_flight -= 1
+
+    def __hand_over(self, waiter: "asyncio.Future[None]"):
+        if waiter.done():
+            # The waiter timed out or was cancelled before the slot reached it
+            self.release()
+        else:
+            waiter.set_result(None)
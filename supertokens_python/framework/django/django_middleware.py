@@ -43,7 +43,9 @@ def middleware(get_response: Any):
             user_context = default_user_context(custom_request)
 
             try:
-                result = await st.middleware(custom_request, response, user_context)
+                result = None
+                if st.can_handle_request_path(custom_request):
+                    result = await st.middleware(custom_request, response, user_context)
                 if result is None:
                     result = await get_response(request)
                     result = DjangoResponse(result)
@@ -76,9 +78,13 @@ def middleware(get_response: Any):
         user_context = default_user_context(custom_request)
 
         try:
-            result: Union[BaseResponse, None] = async_to_sync(st.middleware)(
-                custom_request, response, user_context
-            )
+            result: Union[BaseResponse, None] = None
+            # Requests outside the API base path are never handled by the
+            # middleware, so we don't need to go through async_to_sync for them
+            if st.can_handle_request_path(custom_request):
+                result = async_to_sync(st.middleware)(
+                    custom_request, response, user_context
+                )
 
             if result is None:
                 result = DjangoResponse(get_response(request))
@@ -50,6 +50,9 @@ class Middleware:
             st = Supertokens.get_instance()
 
             request_ = FlaskRequest(request)
+            if not st.can_handle_request_path(request_):
+                return None
+
             response_ = FlaskResponse(Response())
             user_context = default_user_context(request_)
 
@@ -0,0 +1,85 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from collections import deque
+from typing import Deque
+
+
+class HedgingConfig:
+    def __init__(
+        self,
+        delay_percentile: float = 95,
+        initial_delay_ms: int = 100,
+        min_delay_ms: int = 5,
+        max_hedge_ratio: float = 0.05,
+    ):
+        """
+        Hedging sends a GET request that hasn't been answered in time to
+        another core host, and uses whichever response comes first. It only
+        applies when more than one core host is configured.
+
+        :param delay_percentile: A request is hedged once it has taken longer
+            than this percentile of recent GET request latencies.
+        :param initial_delay_ms: The delay used until enough latencies have
+            been recorded.
+        :param min_delay_ms: The minimum delay before a request is hedged.
+        :param max_hedge_ratio: The maximum number of hedged requests, as a
+            fraction of all GET requests. This stops hedging from adding a lot
+            of load on the core when it is slow for every request.
+        """
+        if not 0 < delay_percentile <= 100:
+            raise ValueError("delay_percentile must be between 0 and 100")
+        if not 0 < max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1")
+        self.delay_percentile = delay_percentile
+        self.initial_delay_ms = initial_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.max_hedge_ratio = max_hedge_ratio
+
+
+LATENCY_WINDOW_SIZE = 100
+MIN_LATENCY_SAMPLES = 20
+# How many hedges can be saved up while requests are fast, so that a short
+# slowdown can still be hedged
+MAX_HEDGE_TOKENS = 10
+
+
+class HedgingPolicy:
+    def __init__(self, config: HedgingConfig):
+        self.config = config
+        self.latencies_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW_SIZE)
+        self.hedge_tokens = 0.0
+
+    def record_latency(self, latency_ms: float):
+        self.latencies_ms.append(latency_ms)
+
+    def get_delay_sec(self) -> float:
+        if len(self.latencies_ms) < MIN_LATENCY_SAMPLES:
+            delay_ms = self.config.initial_delay_ms
+        else:
+            latencies = sorted(self.latencies_ms)
+            index = int(len(latencies) * self.config.delay_percentile / 100)
+            delay_ms = latencies[min(index, len(latencies) - 1)]
+        return max(delay_ms, self.config.min_delay_ms) / 1000
+
+    def on_request(self):
+        self.hedge_tokens = min(
+            self.hedge_tokens + self.config.max_hedge_ratio, MAX_HEDGE_TOKENS
+        )
+
+    def try_start_hedge(self) -> bool:
+        if self.hedge_tokens < 1:
+            return False
+        self.hedge_tokens -= 1
+        return True
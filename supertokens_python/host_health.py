@@ -0,0 +1,87 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from typing import Optional
+
+from supertokens_python.utils import get_timestamp_ms
+
+
+class CircuitBreakerConfig:
+    def __init__(self, failure_threshold: int = 3, open_duration_ms: int = 10000):
+        """
+        :param failure_threshold: The number of consecutive connection failures
+            after which a core host is skipped while other hosts are available.
+        :param open_duration_ms: How long a failing core host is skipped before
+            a single request is sent to it to check if it has recovered.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if open_duration_ms < 0:
+            raise ValueError("open_duration_ms must not be negative")
+        self.failure_threshold = failure_threshold
+        self.open_duration_ms = open_duration_ms
+
+
+class HostHealth:
+    """
+    Tracks the requests in flight to a core host and whether it is failing.
+
+    The circuit opens after `failure_threshold` consecutive failures. Once
+    `open_duration_ms` has passed, one probe request is let through (half
+    open): if it succeeds the circuit closes, otherwise it opens again.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig):
+        self.config = config
+        self.outstanding_requests = 0
+        self.consecutive_failures = 0
+        self.opened_at: Optional[int] = None
+        self.probe_in_flight = False
+
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def is_available(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self.probe_in_flight:
+            return False
+        return get_timestamp_ms() - self.opened_at >= self.config.open_duration_ms
+
+    def on_request_start(self):
+        self.outstanding_requests += 1
+        if self.opened_at is not None:
+            self.probe_in_flight = True
+
+    def on_request_success(self):
+        self.outstanding_requests -= 1
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+
+    def on_request_failure(self):
+        self.outstanding_requests -= 1
+        self.consecutive_failures += 1
+        if (
+            self.probe_in_flight
+            or self.consecutive_failures >= self.config.failure_threshold
+        ):
+            self.opened_at = get_timestamp_ms()
+        self.probe_in_flight = False
+
+    def on_request_inconclusive(self):
+        # The request did not tell us anything about the host, but if it was the
+        # probe, another request needs to be let through to check the host
+        self.outstanding_requests -= 1
+        self.probe_in_flight = False
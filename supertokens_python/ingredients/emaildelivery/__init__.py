@@ -12,12 +12,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryConfigWithService,
     EmailDeliveryInterface,
 )
+from supertokens_python.timing import timing_span
 
 _T = TypeVar("_T")
 
@@ -31,3 +32,21 @@ class EmailDeliveryIngredient(Generic[_T]):
             if config.override is None
             else config.override(config.service)
         )
+
+        # Wrapped on the instance, so that the type of the implementation
+        # doesn't change for code that checks it. The same service can be
+        # used by more than one recipe, so it is only wrapped once.
+        send_email = self.ingredient_interface_impl.send_email
+        if getattr(send_email, "_supertokens_timed", False):
+            return
+
+        async def timed_send_email(template_vars: _T, user_context: Dict[str, Any]):
+            with timing_span(
+                "email_delivery",
+                user_context,
+                {"type": getattr(template_vars, "type", type(template_vars).__name__)},
+            ):
+                return await send_email(template_vars, user_context)
+
+        setattr(timed_send_email, "_supertokens_timed", True)
+        self.ingredient_interface_impl.send_email = timed_send_email  # type: ignore
@@ -17,7 +17,6 @@ import ssl
 from email.mime.text import MIMEText
 from typing import Any, Dict, TypeVar
 
-import aiosmtplib
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailContent,
     SMTPSettings,
@@ -32,6 +31,8 @@ class Transporter:
         self.smtp_settings = smtp_settings
 
     async def _connect(self):
+        import aiosmtplib
+
         try:
             tls_context = ssl.create_default_context()
             if self.smtp_settings.secure:
@@ -11,12 +11,37 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import TypeVar
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
 
 from supertokens_python.ingredients.smsdelivery.types import TwilioSettings
 
 _T = TypeVar("_T")
 
+# The twilio client is synchronous, so its requests are run on a dedicated
+# thread pool to keep them from blocking the event loop. This also bounds how
+# many Twilio requests can be in flight at once.
+TWILIO_MAX_CONCURRENT_REQUESTS = 10
+
+_twilio_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_twilio_executor() -> ThreadPoolExecutor:
+    global _twilio_executor
+    if _twilio_executor is None:
+        _twilio_executor = ThreadPoolExecutor(
+            max_workers=TWILIO_MAX_CONCURRENT_REQUESTS,
+            thread_name_prefix="supertokens-twilio",
+        )
+    return _twilio_executor
+
+
+async def run_twilio_request(request: Callable[..., _T], **kwargs: Any) -> _T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_twilio_executor(), partial(request, **kwargs))
+
 
 def normalize_twilio_settings(twilio_settings: TwilioSettings) -> TwilioSettings:
     from_ = twilio_settings.from_
@@ -0,0 +1,143 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+OpenTelemetry integration. After `instrument()` is called, each of the stages
+listed in `supertokens_python.timing` (middleware dispatch, core requests,
+JWKS fetches, email and SMS delivery, third party provider requests, ...) is
+traced as a `supertokens.<stage>` span, and the following metrics are
+recorded:
+
+- `supertokens.stage.duration`: a histogram of the duration of each stage, in
+  milliseconds
+- `supertokens.cache.lookups`: a counter of lookups in the core call cache and
+  the JWKS cache, with a `supertokens.cache.hit` attribute
+
+This needs the `opentelemetry-api` package, and does nothing without it.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from supertokens_python.constants import VERSION
+from supertokens_python.logger import log_debug_message
+from supertokens_python.timing import (
+    SpanWrapper,
+    add_span_wrapper,
+    remove_span_wrapper,
+)
+
+INSTRUMENTATION_NAME = "supertokens_python"
+
+_CLIENT_STAGES = ["core_request", "jwks_refresh", "third_party_request"]
+# Attributes that are used for metrics. The others (like paths and URLs) can
+# have too many different values.
+_METRIC_ATTRIBUTES = ["method", "status", "provider_id", "type", "handled"]
+_CACHE_ATTRIBUTES = {"cache_hit": "core_call", "jwks_cache_hit": "jwks"}
+
+_span_wrapper: Optional[SpanWrapper] = None
+
+
+def instrument(tracer_provider: Any = None, meter_provider: Any = None) -> bool:
+    """
+    Starts tracing the SDK with OpenTelemetry. The global tracer and meter
+    providers are used unless others are passed. Returns False if OpenTelemetry
+    is not installed.
+    """
+    global _span_wrapper
+
+    try:
+        from opentelemetry import metrics, trace
+    except ImportError:
+        log_debug_message(
+            "Not instrumenting since the opentelemetry-api package is not installed"
+        )
+        return False
+
+    uninstrument()
+
+    tracer = trace.get_tracer(
+        INSTRUMENTATION_NAME, VERSION, tracer_provider=tracer_provider
+    )
+    meter = metrics.get_meter(
+        INSTRUMENTATION_NAME, VERSION, meter_provider=meter_provider
+    )
+    duration_histogram = meter.create_histogram(
+        "supertokens.stage.duration",
+        unit="ms",
+        description="The duration of a stage of request handling in the SuperTokens SDK",
+    )
+    cache_lookups_counter = meter.create_counter(
+        "supertokens.cache.lookups",
+        description="Lookups in the SuperTokens SDK caches",
+    )
+
+    @contextmanager
+    def wrapper(name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+        kind = (
+            trace.SpanKind.CLIENT if name in _CLIENT_STAGES else trace.SpanKind.INTERNAL
+        )
+        start = time.monotonic()
+        error = False
+        with tracer.start_as_current_span(f"supertokens.{name}", kind=kind) as span:
+            try:
+                yield
+            except BaseException:
+                error = True
+                raise
+            finally:
+                # The attributes can be added to while the stage is in progress
+                span.set_attributes(_to_otel_attributes(attributes))
+
+                metric_attributes = _to_otel_attributes(
+                    {k: v for k, v in attributes.items() if k in _METRIC_ATTRIBUTES}
+                )
+                metric_attributes["supertokens.stage"] = name
+                metric_attributes["supertokens.error"] = error
+                duration_histogram.record(
+                    (time.monotonic() - start) * 1000, metric_attributes
+                )
+
+                for attribute, cache in _CACHE_ATTRIBUTES.items():
+                    if attribute in attributes:
+                        cache_lookups_counter.add(
+                            1,
+                            {
+                                "supertokens.cache": cache,
+                                "supertokens.cache.hit": bool(attributes[attribute]),
+                            },
+                        )
+
+    add_span_wrapper(wrapper)
+    _span_wrapper = wrapper
+    return True
+
+
+def uninstrument():
+    global _span_wrapper
+
+    if _span_wrapper is not None:
+        remove_span_wrapper(_span_wrapper)
+        _span_wrapper = None
+
+
+def _to_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if not isinstance(value, (str, bool, int, float)):
+            value = str(value)
+        result[f"supertokens.{key}"] = value
+    return result
@@ -14,12 +14,21 @@
 from __future__ import annotations
 
 import asyncio
+from copy import deepcopy
 from json import JSONDecodeError
 from os import environ
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from httpx import AsyncClient, ConnectTimeout, NetworkError, Response
+from httpx import (
+    AsyncClient,
+    ConnectTimeout,
+    NetworkError,
+    Response,
+    TimeoutException,
+)
 
+from .api_version_cache import APIVersionFileCache
+from .bulkhead import Bulkhead, BulkheadConfig, DeadlineExceededError
 from .constants import (
     API_KEY_HEADER,
     API_VERSION,
@@ -28,6 +37,9 @@ from .constants import (
     SUPPORTED_CDI_VERSIONS,
     RATE_LIMIT_STATUS_CODE,
 )
+from .hedging import HedgingConfig, HedgingPolicy
+from .host_health import CircuitBreakerConfig, HostHealth
+from .logger import log_debug_message
 from .normalised_url_path import NormalisedURLPath
 
 if TYPE_CHECKING:
@@ -36,7 +48,14 @@ if TYPE_CHECKING:
 from typing import List, Set, Union
 
 from .process_state import PROCESS_STATE, ProcessState
-from .utils import find_max_version, is_4xx_error, is_5xx_error
+from .rate_limiter import AdaptiveRateLimiter, RateLimiterConfig, RateLimiterMetrics
+from .timing import set_span_attributes, timing_span
+from .utils import (
+    find_max_version,
+    get_core_call_deadline_from_user_context,
+    is_4xx_error,
+    is_5xx_error,
+)
 from sniffio import AsyncLibraryNotFoundError
 from supertokens_python.async_to_sync_wrapper import create_or_get_event_loop
 from supertokens_python.utils import get_timestamp_ms
@@ -70,6 +89,18 @@ class Querier:
     ] = None
     __global_cache_tag = get_timestamp_ms()
     __disable_cache = False
+    __circuit_breaker_config = CircuitBreakerConfig()
+    __host_health: Dict[str, HostHealth] = {}
+    __hedging_policy: Optional[HedgingPolicy] = None
+    __rate_limiter_config: Optional[RateLimiterConfig] = None
+    __rate_limiters: Dict[str, AdaptiveRateLimiter] = {}
+    __bulkhead_config: Optional[BulkheadConfig] = None
+    __bulkheads: Dict[str, Bulkhead] = {}
+    __request_timeout_ms: int = 30000
+    __path_timeouts_ms: Dict[str, int] = {}
+    __api_version_in_flight: Optional[asyncio.Future[str]] = None
+    __api_version_file_cache: Optional[APIVersionFileCache] = None
+    __get_requests_in_flight: Dict[str, asyncio.Future[Response]] = {}
 
     def __init__(self, hosts: List[Host], rid_to_core: Union[None, str] = None):
         self.__hosts = hosts
@@ -84,6 +115,9 @@ class Querier:
         ):
             raise Exception("calling testing function in non testing env")
         Querier.__init_called = False
+        # The rate limiters learn from the core's responses, so they mustn't
+        # carry over to the next test
+        Querier.__rate_limiters = {}
 
     @staticmethod
     def get_hosts_alive_for_testing():
@@ -93,6 +127,25 @@ class Querier:
             raise Exception("calling testing function in non testing env")
         return Querier.__hosts_alive_for_testing
 
+    @staticmethod
+    def get_host_health_for_testing() -> Dict[str, HostHealth]:
+        if ("SUPERTOKENS_ENV" not in environ) or (
+            environ["SUPERTOKENS_ENV"] != "testing"
+        ):
+            raise Exception("calling testing function in non testing env")
+        return Querier.__host_health
+
+    @staticmethod
+    def get_rate_limiter_metrics() -> Dict[str, RateLimiterMetrics]:
+        """
+        Returns the state of the rate limiter of each core host that has been
+        queried, if `rate_limiter` is set in `SupertokensConfig`.
+        """
+        return {
+            host: rate_limiter.get_metrics()
+            for host, rate_limiter in Querier.__rate_limiters.items()
+        }
+
     async def api_request(
         self,
         url: str,
@@ -123,11 +176,52 @@ class Querier:
             )
 
     async def get_api_version(self, user_context: Union[Dict[str, Any], None] = None):
+        if Querier.api_version is not None:
+            return Querier.api_version
+
+        # Concurrent callers on a cold process wait for a single request to the
+        # core instead of each sending their own
+        in_flight = Querier.__api_version_in_flight
+        if in_flight is not None and in_flight.get_loop() is asyncio.get_running_loop():
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # The caller that was fetching it was cancelled, so we fetch it
+                # ourselves
+                if not in_flight.cancelled():
+                    raise
+                return await self.get_api_version(user_context)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        Querier.__api_version_in_flight = future
+        try:
+            api_version = await self.__fetch_api_version(user_context)
+            future.set_result(api_version)
+            return api_version
+        except Exception as e:
+            future.set_exception(e)
+            # Don't warn about an unretrieved exception if nothing else was
+            # waiting for it
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            if Querier.__api_version_in_flight is future:
+                Querier.__api_version_in_flight = None
+
+    async def __fetch_api_version(
+        self, user_context: Union[Dict[str, Any], None]
+    ) -> str:
         if user_context is None:
             user_context = {}
 
-        if Querier.api_version is not None:
-            return Querier.api_version
+        file_cache = Querier.__api_version_file_cache
+        if file_cache is not None:
+            api_version = file_cache.read()
+            if api_version is not None:
+                Querier.api_version = api_version
+                return api_version
 
         ProcessState.get_instance().add_state(
             PROCESS_STATE.CALLING_SERVICE_IN_GET_API_VERSION
@@ -166,12 +260,27 @@ class Querier:
                 )
 
             return await self.api_request(
-                url, method, 2, headers=headers, params=query_params
+                url,
+                method,
+                2,
+                headers=headers,
+                params=query_params,
+                timeout=self.__get_timeout_sec(
+                    NormalisedURLPath(API_VERSION), deadline
+                ),
             )
 
-        response = await self.__send_request_helper(
-            NormalisedURLPath(API_VERSION), "GET", f, len(self.__hosts)
-        )
+        deadline = get_core_call_deadline_from_user_context(user_context)
+        with timing_span(
+            "core_request", user_context, {"path": API_VERSION, "method": "GET"}
+        ):
+            response = await self.__send_request_helper(
+                NormalisedURLPath(API_VERSION),
+                "GET",
+                f,
+                len(self.__hosts),
+                deadline=deadline,
+            )
         cdi_supported_by_server = response["versions"]
         api_version = find_max_version(cdi_supported_by_server, SUPPORTED_CDI_VERSIONS)
 
@@ -183,7 +292,9 @@ class Querier:
             )
 
         Querier.api_version = api_version
-        return Querier.api_version
+        if file_cache is not None:
+            file_cache.write(api_version)
+        return api_version
 
     @staticmethod
     def get_instance(rid_to_core: Union[str, None] = None):
@@ -217,6 +328,13 @@ class Querier:
             ]
         ] = None,
         disable_cache: bool = False,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        hedging: Optional[HedgingConfig] = None,
+        rate_limiter: Optional[RateLimiterConfig] = None,
+        bulkhead: Optional[BulkheadConfig] = None,
+        request_timeout_ms: int = 30000,
+        path_timeouts_ms: Optional[Dict[str, int]] = None,
+        api_version_cache_dir: Optional[str] = None,
     ):
         if not Querier.__init_called:
             Querier.__init_called = True
@@ -227,6 +345,38 @@ class Querier:
             Querier.__hosts_alive_for_testing = set()
             Querier.network_interceptor = network_interceptor
             Querier.__disable_cache = disable_cache
+            Querier.__circuit_breaker_config = (
+                circuit_breaker
+                if circuit_breaker is not None
+                else CircuitBreakerConfig()
+            )
+            Querier.__host_health = {}
+            Querier.__hedging_policy = (
+                HedgingPolicy(hedging) if hedging is not None else None
+            )
+            Querier.__rate_limiter_config = rate_limiter
+            Querier.__rate_limiters = {}
+            Querier.__bulkhead_config = bulkhead
+            Querier.__bulkheads = {}
+            Querier.__request_timeout_ms = request_timeout_ms
+            Querier.__path_timeouts_ms = {
+                NormalisedURLPath(p).get_as_string_dangerous(): t
+                for p, t in (path_timeouts_ms or {}).items()
+            }
+            Querier.__api_version_in_flight = None
+            Querier.__get_requests_in_flight = {}
+            Querier.__api_version_file_cache = (
+                APIVersionFileCache(
+                    api_version_cache_dir,
+                    [
+                        h.domain.get_as_string_dangerous()
+                        + h.base_path.get_as_string_dangerous()
+                        for h in hosts
+                    ],
+                )
+                if api_version_cache_dir is not None
+                else None
+            )
 
     async def __get_headers_with_api_version(
         self, path: NormalisedURLPath, user_context: Union[Dict[str, Any], None]
@@ -248,10 +398,50 @@ class Querier:
             params = {}
 
         async def f(url: str, method: str) -> Response:
-            headers = await self.__get_headers_with_api_version(path, user_context)
-            nonlocal params
+            nonlocal headers, params
+            if Querier.network_interceptor is not None:
+                (
+                    url,
+                    method,
+                    headers,
+                    params,
+                    _,
+                ) = Querier.network_interceptor(  # pylint:disable=not-callable
+                    url, method, headers, params, {}, user_context
+                )
+            return await self.api_request(
+                url,
+                method,
+                2,
+                headers=headers,
+                params=params,
+                timeout=self.__get_timeout_sec(path, deadline),
+            )
 
-            assert params is not None
+        async def send_to_core() -> Dict[str, Any]:
+            # A hedged request sends the same request to another host, so it
+            # doesn't need its own http function
+            return await self.__send_request_helper(
+                path,
+                "GET",
+                f,
+                len(self.__hosts),
+                hedged_http_function=(
+                    f if Querier.__hedging_policy is not None else None
+                ),
+                deadline=deadline,
+            )
+
+        deadline = get_core_call_deadline_from_user_context(user_context)
+        with timing_span(
+            "core_request",
+            user_context,
+            {"path": path.get_as_string_dangerous(), "method": "GET"},
+        ):
+            # The API version is resolved before the request is sent, so that
+            # fetching it doesn't need another rate limiter token or bulkhead
+            # slot for the same host
+            headers = await self.__get_headers_with_api_version(path, user_context)
 
             # Sort the keys for deterministic order
             sorted_keys = sorted(params.keys())
@@ -280,48 +470,37 @@ class Querier:
                 ):
                     self.invalidate_core_call_cache(user_context, False)
 
-                if not Querier.__disable_cache and unique_key in user_context.get(
-                    "_default", {}
-                ).get("core_call_cache", {}):
-                    return user_context["_default"]["core_call_cache"][unique_key]
-
-            if Querier.network_interceptor is not None:
-                (
-                    url,
-                    method,
-                    headers,
-                    params,
-                    _,
-                ) = Querier.network_interceptor(  # pylint:disable=not-callable
-                    url, method, headers, params, {}, user_context
+                if not Querier.__disable_cache:
+                    cache_hit = unique_key in user_context.get("_default", {}).get(
+                        "core_call_cache", {}
+                    )
+                    set_span_attributes(cache_hit=cache_hit)
+                    if cache_hit:
+                        return deepcopy(
+                            user_context["_default"]["core_call_cache"][unique_key]
+                        )
+
+            # The network interceptor can change the request based on the
+            # user_context, so requests are only shared without one
+            if not Querier.__disable_cache and Querier.network_interceptor is None:
+                response = await self.__send_shared_get_request(
+                    unique_key, send_to_core, deadline
                 )
+            else:
+                response = await send_to_core()
 
-            response = await self.api_request(
-                url,
-                method,
-                2,
-                headers=headers,
-                params=params,
-            )
-
-            if (
-                response.status_code == 200
-                and not Querier.__disable_cache
-                and user_context is not None
-            ):
+            if not Querier.__disable_cache and user_context is not None:
                 user_context["_default"] = {
                     **user_context.get("_default", {}),
                     "core_call_cache": {
                         **user_context.get("_default", {}).get("core_call_cache", {}),
-                        unique_key: response,
+                        unique_key: deepcopy(response),
                     },
                     "global_cache_tag": Querier.__global_cache_tag,
                 }
 
             return response
 
-        return await self.__send_request_helper(path, "GET", f, len(self.__hosts))
-
     async def send_post_request(
         self,
         path: NormalisedURLPath,
@@ -361,9 +540,18 @@ class Querier:
                 2,
                 headers=headers,
                 json=data,
+                timeout=self.__get_timeout_sec(path, deadline),
             )
 
-        return await self.__send_request_helper(path, "POST", f, len(self.__hosts))
+        deadline = get_core_call_deadline_from_user_context(user_context)
+        with timing_span(
+            "core_request",
+            user_context,
+            {"path": path.get_as_string_dangerous(), "method": "POST"},
+        ):
+            return await self.__send_request_helper(
+                path, "POST", f, len(self.__hosts), deadline=deadline
+            )
 
     async def send_delete_request(
         self,
@@ -375,9 +563,10 @@ class Querier:
         if params is None:
             params = {}
 
+        headers = await self.__get_headers_with_api_version(path, user_context)
+
         async def f(url: str, method: str) -> Response:
-            headers = await self.__get_headers_with_api_version(path, user_context)
-            nonlocal params
+            nonlocal headers, params
             if Querier.network_interceptor is not None:
                 (
                     url,
@@ -394,9 +583,18 @@ class Querier:
                 2,
                 headers=headers,
                 params=params,
+                timeout=self.__get_timeout_sec(path, deadline),
             )
 
-        return await self.__send_request_helper(path, "DELETE", f, len(self.__hosts))
+        deadline = get_core_call_deadline_from_user_context(user_context)
+        with timing_span(
+            "core_request",
+            user_context,
+            {"path": path.get_as_string_dangerous(), "method": "DELETE"},
+        ):
+            return await self.__send_request_helper(
+                path, "DELETE", f, len(self.__hosts), deadline=deadline
+            )
 
     async def send_put_request(
         self,
@@ -423,9 +621,24 @@ class Querier:
                 ) = Querier.network_interceptor(  # pylint:disable=not-callable
                     url, method, headers, {}, data, user_context
                 )
-            return await self.api_request(url, method, 2, headers=headers, json=data)
+            return await self.api_request(
+                url,
+                method,
+                2,
+                headers=headers,
+                json=data,
+                timeout=self.__get_timeout_sec(path, deadline),
+            )
 
-        return await self.__send_request_helper(path, "PUT", f, len(self.__hosts))
+        deadline = get_core_call_deadline_from_user_context(user_context)
+        with timing_span(
+            "core_request",
+            user_context,
+            {"path": path.get_as_string_dangerous(), "method": "PUT"},
+        ):
+            return await self.__send_request_helper(
+                path, "PUT", f, len(self.__hosts), deadline=deadline
+            )
 
     def invalidate_core_call_cache(
         self,
@@ -444,11 +657,66 @@ class Querier:
             # there can be race conditions here, but i think we can ignore them.
             Querier.__global_cache_tag = get_timestamp_ms()
 
+        if upd_global_cache_tag_if_necessary:
+            # GET requests that were sent before this write must not be
+            # shared with the ones made after it
+            Querier.__get_requests_in_flight = {}
+
         user_context["_default"] = {
             **user_context.get("_default", {}),
             "core_call_cache": {},
         }
 
+    async def __send_shared_get_request(
+        self,
+        unique_key: str,
+        send_to_core: Callable[[], Awaitable[Dict[str, Any]]],
+        deadline: Optional[int],
+    ) -> Dict[str, Any]:
+        # Concurrent identical GET requests (for example, many requests
+        # fetching the same tenant or role) wait for the one that is already in
+        # flight. Nothing is kept once it completes, so a request never gets a
+        # response that was sent before it started. Each request gets its own
+        # copy of the response, since callers can change it.
+        in_flight = Querier.__get_requests_in_flight.get(unique_key)
+        if in_flight is not None and in_flight.get_loop() is asyncio.get_running_loop():
+            timeout = None
+            if deadline is not None:
+                timeout = max(deadline - get_timestamp_ms(), 0) / 1000
+            set_span_attributes(shared_request=True)
+            # Unlike awaiting it, asyncio.wait neither cancels the shared
+            # request nor raises if it was cancelled, so a CancelledError here
+            # always means that this request itself was cancelled
+            done, _ = await asyncio.wait([in_flight], timeout=timeout)
+            if len(done) == 0:
+                raise DeadlineExceededError(
+                    "The request to the SuperTokens core could not be completed before its deadline"
+                )
+            # If the request we were waiting for was cancelled (for example,
+            # because its caller went away), we send it ourselves
+            if not in_flight.cancelled():
+                return deepcopy(in_flight.result())
+
+        future: asyncio.Future[Dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        Querier.__get_requests_in_flight[unique_key] = future
+        try:
+            response = await send_to_core()
+            future.set_result(deepcopy(response))
+            return response
+        except Exception as e:
+            future.set_exception(e)
+            # Don't warn about an unretrieved exception if nothing else was
+            # waiting for this request
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            if Querier.__get_requests_in_flight.get(unique_key) is future:
+                del Querier.__get_requests_in_flight[unique_key]
+
     def get_all_core_urls_for_path(self, path: str) -> List[str]:
         normalized_path = NormalisedURLPath(path)
 
@@ -472,20 +740,20 @@ class Querier:
         http_function: Callable[[str, str], Awaitable[Response]],
         no_of_tries: int,
         retry_info_map: Optional[Dict[str, int]] = None,
+        failed_hosts: Optional[Set[str]] = None,
+        hedged_http_function: Optional[
+            Callable[[str, str], Awaitable[Response]]
+        ] = None,
+        deadline: Optional[int] = None,
     ) -> Dict[str, Any]:
         if no_of_tries == 0:
             raise Exception("No SuperTokens core available to query")
 
+        if failed_hosts is None:
+            failed_hosts = set()
+
+        current_host = self.__select_host(failed_hosts)
         try:
-            current_host_domain = self.__hosts[
-                Querier.__last_tried_index
-            ].domain.get_as_string_dangerous()
-            current_host_base_path = self.__hosts[
-                Querier.__last_tried_index
-            ].base_path.get_as_string_dangerous()
-            current_host: str = current_host_domain + current_host_base_path
-            Querier.__last_tried_index += 1
-            Querier.__last_tried_index %= len(self.__hosts)
             url = current_host + path.get_as_string_dangerous()
 
             max_retries = 5
@@ -499,12 +767,32 @@ class Querier:
             ProcessState.get_instance().add_state(
                 PROCESS_STATE.CALLING_SERVICE_IN_REQUEST_HELPER
             )
-            response = await http_function(url, method)
+            if hedged_http_function is not None and len(self.__hosts) > 1:
+                response = await self.__call_host_with_hedging(
+                    path,
+                    method,
+                    current_host,
+                    failed_hosts,
+                    http_function,
+                    hedged_http_function,
+                    deadline,
+                )
+            else:
+                response = await self.__call_host(
+                    current_host, url, method, http_function, deadline
+                )
             if ("SUPERTOKENS_ENV" in environ) and (
                 environ["SUPERTOKENS_ENV"] == "testing"
             ):
                 Querier.__hosts_alive_for_testing.add(current_host)
 
+            set_span_attributes(
+                host=current_host,
+                status=response.status_code,
+                retries=len(failed_hosts)
+                + sum(max_retries - left for left in retry_info_map.values()),
+            )
+
             if response.status_code == RATE_LIMIT_STATUS_CODE:
                 retries_left = retry_info_map[url]
 
@@ -516,7 +804,14 @@ class Querier:
 
                     await asyncio.sleep(delay)
                     return await self.__send_request_helper(
-                        path, method, http_function, no_of_tries, retry_info_map
+                        path,
+                        method,
+                        http_function,
+                        no_of_tries,
+                        retry_info_map,
+                        failed_hosts,
+                        hedged_http_function,
+                        deadline,
                     )
 
             if is_4xx_error(response.status_code) or is_5xx_error(response.status_code):  # type: ignore
@@ -541,6 +836,195 @@ class Querier:
             return res
 
         except (ConnectionError, NetworkError, ConnectTimeout) as _:
+            failed_hosts.add(current_host)
             return await self.__send_request_helper(
-                path, method, http_function, no_of_tries - 1, retry_info_map
+                path,
+                method,
+                http_function,
+                no_of_tries - 1,
+                retry_info_map,
+                failed_hosts,
+                hedged_http_function,
+                deadline,
             )
+
+    async def __call_host(
+        self,
+        host: str,
+        url: str,
+        method: str,
+        http_function: Callable[[str, str], Awaitable[Response]],
+        deadline: Optional[int] = None,
+    ) -> Response:
+        if deadline is not None and get_timestamp_ms() >= deadline:
+            raise DeadlineExceededError(
+                "The request to the SuperTokens core could not be sent before its deadline"
+            )
+
+        rate_limiter = self.__get_rate_limiter(host)
+        if rate_limiter is not None:
+            await rate_limiter.acquire(deadline)
+
+        bulkhead = self.__get_bulkhead(host)
+        if bulkhead is not None:
+            await bulkhead.acquire(deadline)
+
+        host_health = self.__get_host_health(host)
+        host_health.on_request_start()
+        try:
+            response = await http_function(url, method)
+        except (ConnectionError, NetworkError, TimeoutException):
+            host_health.on_request_failure()
+            raise
+        except BaseException:
+            host_health.on_request_inconclusive()
+            raise
+        finally:
+            if bulkhead is not None:
+                bulkhead.release()
+        host_health.on_request_success()
+
+        if rate_limiter is not None:
+            rate_limiter.on_response(response.status_code == RATE_LIMIT_STATUS_CODE)
+        return response
+
+    def __get_rate_limiter(self, host: str) -> Optional[AdaptiveRateLimiter]:
+        if Querier.__rate_limiter_config is None:
+            return None
+        if host not in Querier.__rate_limiters:
+            Querier.__rate_limiters[host] = AdaptiveRateLimiter(
+                Querier.__rate_limiter_config
+            )
+        return Querier.__rate_limiters[host]
+
+    def __get_bulkhead(self, host: str) -> Optional[Bulkhead]:
+        if Querier.__bulkhead_config is None:
+            return None
+        if host not in Querier.__bulkheads:
+            Querier.__bulkheads[host] = Bulkhead(Querier.__bulkhead_config)
+        return Querier.__bulkheads[host]
+
+    def __get_timeout_sec(self, path: NormalisedURLPath, deadline: Optional[int]):
+        # The longest matching suffix wins, so that an override for
+        # /recipe/session also applies to /<tenant_id>/recipe/session
+        path_str = path.get_as_string_dangerous()
+        timeout_ms = Querier.__request_timeout_ms
+        matched_length = -1
+        for override_path, override_timeout_ms in Querier.__path_timeouts_ms.items():
+            if path_str.endswith(override_path) and len(override_path) > matched_length:
+                timeout_ms = override_timeout_ms
+                matched_length = len(override_path)
+
+        if deadline is not None:
+            timeout_ms = min(timeout_ms, deadline - get_timestamp_ms())
+            if timeout_ms <= 0:
+                raise DeadlineExceededError(
+                    "The request to the SuperTokens core could not be sent before its deadline"
+                )
+        return timeout_ms / 1000
+
+    async def __call_host_with_hedging(
+        self,
+        path: NormalisedURLPath,
+        method: str,
+        primary_host: str,
+        failed_hosts: Set[str],
+        http_function: Callable[[str, str], Awaitable[Response]],
+        hedged_http_function: Callable[[str, str], Awaitable[Response]],
+        deadline: Optional[int],
+    ) -> Response:
+        policy = Querier.__hedging_policy
+        assert policy is not None
+        policy.on_request()
+
+        start_time = get_timestamp_ms()
+        requests = [
+            asyncio.ensure_future(
+                self.__call_host(
+                    primary_host,
+                    primary_host + path.get_as_string_dangerous(),
+                    method,
+                    http_function,
+                    deadline,
+                )
+            )
+        ]
+        try:
+            done, _ = await asyncio.wait(requests, timeout=policy.get_delay_sec())
+            if len(done) == 0 and policy.try_start_hedge():
+                hedge_host = self.__select_host(failed_hosts | {primary_host})
+                if hedge_host != primary_host:
+                    log_debug_message(
+                        "Hedging %s request to %s",
+                        method,
+                        path.get_as_string_dangerous(),
+                    )
+                    requests.append(
+                        asyncio.ensure_future(
+                            self.__call_host(
+                                hedge_host,
+                                hedge_host + path.get_as_string_dangerous(),
+                                method,
+                                hedged_http_function,
+                                deadline,
+                            )
+                        )
+                    )
+
+            pending = set(requests)
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for request in done:
+                    if request.exception() is None:
+                        policy.record_latency(get_timestamp_ms() - start_time)
+                        return request.result()
+
+            # All the requests failed, so we raise the error of the first one
+            return requests[0].result()
+        finally:
+            for request in requests:
+                if not request.done():
+                    request.cancel()
+
+    def __get_host_health(self, host: str) -> HostHealth:
+        if host not in Querier.__host_health:
+            Querier.__host_health[host] = HostHealth(Querier.__circuit_breaker_config)
+        return Querier.__host_health[host]
+
+    def __select_host(self, failed_hosts: Set[str]) -> str:
+        # Hosts are considered in round robin order, skipping the ones that
+        # already failed for this request. Among them, we pick the one with the
+        # fewest requests in flight, ignoring hosts whose circuit is open unless
+        # all of them are (in which case we try anyway rather than failing
+        # without sending the request).
+        hosts: List[Tuple[int, str]] = []
+        for i in range(len(self.__hosts)):
+            index = (Querier.__last_tried_index + i) % len(self.__hosts)
+            host = self.__hosts[index]
+            hosts.append(
+                (
+                    index,
+                    host.domain.get_as_string_dangerous()
+                    + host.base_path.get_as_string_dangerous(),
+                )
+            )
+
+        candidates = [h for h in hosts if h[1] not in failed_hosts]
+        if len(candidates) == 0:
+            # The same host can be in connection_uri more than once
+            candidates = hosts
+
+        available = [
+            c for c in candidates if self.__get_host_health(c[1]).is_available()
+        ]
+        if len(available) == 0:
+            available = candidates
+
+        index, url = min(
+            available,
+            key=lambda c: self.__get_host_health(c[1]).outstanding_requests,
+        )
+        Querier.__last_tried_index = (index + 1) % len(self.__hosts)
+        return url
@@ -0,0 +1,208 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from supertokens_python.utils import get_timestamp_ms
+
+
+class RateLimiterConfig:
+    def __init__(
+        self,
+        min_rate_per_sec: float = 1,
+        max_rate_per_sec: Optional[float] = None,
+        additive_increase_per_sec: float = 10,
+        multiplicative_decrease: float = 0.5,
+        max_queue_wait_ms: int = 5000,
+    ):
+        """
+        The rate limiter sends requests to a core host without a limit until
+        the core responds with a 429. The rate is then set to a fraction
+        (`multiplicative_decrease`) of the rate at which requests were being
+        sent, and grows by `additive_increase_per_sec` every second without a
+        429 (AIMD).
+
+        :param min_rate_per_sec: The rate never goes below this.
+        :param max_rate_per_sec: If set, the rate never goes above this, even
+            before the core responds with a 429.
+        :param max_queue_wait_ms: Requests that would have to wait longer than
+            this to be sent are failed without being sent.
+        """
+        if min_rate_per_sec <= 0:
+            raise ValueError("min_rate_per_sec must be positive")
+        if max_rate_per_sec is not None and max_rate_per_sec < min_rate_per_sec:
+            raise ValueError("max_rate_per_sec must not be less than min_rate_per_sec")
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError("multiplicative_decrease must be between 0 and 1")
+        self.min_rate_per_sec = min_rate_per_sec
+        self.max_rate_per_sec = max_rate_per_sec
+        self.additive_increase_per_sec = additive_increase_per_sec
+        self.multiplicative_decrease = multiplicative_decrease
+        self.max_queue_wait_ms = max_queue_wait_ms
+
+
+class RateLimiterMetrics:
+    def __init__(
+        self,
+        rate_per_sec: Optional[float],
+        queue_depth: int,
+        rate_limited_responses: int,
+        shed_requests: int,
+    ):
+        # None if the core hasn't rate limited requests yet
+        self.rate_per_sec = rate_per_sec
+        self.queue_depth = queue_depth
+        self.rate_limited_responses = rate_limited_responses
+        self.shed_requests = shed_requests
+
+
+class RateLimitExceededError(Exception):
+    pass
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, config: RateLimiterConfig):
+        self.config = config
+        self.rate_per_sec: Optional[float] = config.max_rate_per_sec
+        # Tokens can go negative: each waiting request reserves one
+        self.tokens = 1.0
+        self.last_refill_time = time.monotonic()
+        self.last_decrease_time: Optional[float] = None
+        self.last_increase_time: Optional[float] = None
+        self.queue_depth = 0
+        self.rate_limited_responses = 0
+        self.shed_requests = 0
+
+        # When the requests in the last second were sent, to know the rate
+        # that caused a 429
+        self.created_time = time.monotonic()
+        self.sent_times: Deque[float] = deque()
+        # The syncio functions use the limiter from several event loops, each
+        # in its own thread
+        self.lock = threading.Lock()
+
+    def __refill(self, now: float):
+        if self.rate_per_sec is not None:
+            # Allow a burst of up to one second worth of requests
+            self.tokens = min(
+                self.tokens + (now - self.last_refill_time) * self.rate_per_sec,
+                max(self.rate_per_sec, 1),
+            )
+        self.last_refill_time = now
+
+    def __get_sending_rate(self, now: float) -> float:
+        while len(self.sent_times) > 0 and now - self.sent_times[0] > 1:
+            self.sent_times.popleft()
+        # Right after startup, there is less than a second of history
+        window_sec = max(min(now - self.created_time, 1), 0.1)
+        return len(self.sent_times) / window_sec
+
+    async def acquire(self, deadline: Optional[int] = None):
+        wait_sec = self.__reserve(deadline)
+        if wait_sec > 0:
+            try:
+                await asyncio.sleep(wait_sec)
+            except asyncio.CancelledError:
+                # The request won't be sent (for example, because a hedged
+                # request won), so the token it reserved goes back
+                with self.lock:
+                    self.tokens += 1
+                raise
+            finally:
+                with self.lock:
+                    self.queue_depth -= 1
+
+        with self.lock:
+            now = time.monotonic()
+            self.sent_times.append(now)
+            self.__get_sending_rate(now)
+
+    def __reserve(self, deadline: Optional[int]) -> float:
+        with self.lock:
+            now = time.monotonic()
+            self.__refill(now)
+
+            if self.rate_per_sec is None:
+                return 0
+
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+
+            wait_sec = -self.tokens / self.rate_per_sec
+            max_wait_ms = self.config.max_queue_wait_ms
+            if deadline is not None:
+                max_wait_ms = min(max_wait_ms, deadline - get_timestamp_ms())
+            if wait_sec * 1000 > max_wait_ms:
+                self.tokens += 1
+                self.shed_requests += 1
+                raise RateLimitExceededError(
+                    "Too many requests to the SuperTokens core, the request was not sent"
+                )
+
+            self.queue_depth += 1
+            return wait_sec
+
+    def on_response(self, rate_limited: bool):
+        with self.lock:
+            self.__on_response(rate_limited)
+
+    def __on_response(self, rate_limited: bool):
+        now = time.monotonic()
+        if not rate_limited:
+            if self.rate_per_sec is not None and self.last_increase_time is not None:
+                self.__refill(now)
+                self.rate_per_sec += self.config.additive_increase_per_sec * (
+                    now - self.last_increase_time
+                )
+                if self.config.max_rate_per_sec is not None:
+                    self.rate_per_sec = min(
+                        self.rate_per_sec, self.config.max_rate_per_sec
+                    )
+                self.last_increase_time = now
+            return
+
+        self.rate_limited_responses += 1
+        # The responses to requests sent before the rate was decreased
+        # shouldn't decrease it again
+        if self.last_decrease_time is not None and now - self.last_decrease_time < 1:
+            return
+
+        self.__refill(now)
+        sending_rate = self.__get_sending_rate(now)
+        current_rate = (
+            sending_rate
+            if self.rate_per_sec is None
+            else min(self.rate_per_sec, sending_rate)
+        )
+        self.rate_per_sec = max(
+            current_rate * self.config.multiplicative_decrease,
+            self.config.min_rate_per_sec,
+        )
+        self.tokens = min(self.tokens, 1)
+        self.last_decrease_time = now
+        self.last_increase_time = now
+
+    def get_metrics(self) -> RateLimiterMetrics:
+        with self.lock:
+            return RateLimiterMetrics(
+                self.rate_per_sec,
+                self.queue_depth,
+                self.rate_limited_responses,
+                self.shed_requests,
+            )
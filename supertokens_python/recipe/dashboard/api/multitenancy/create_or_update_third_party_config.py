@@ -142,6 +142,7 @@ async def handle_create_or_update_third_party_config(
                 ).get_as_string_dangerous(),
                 body_params=request_body_input,
                 headers={"Authorization": f"Api-Key {boxy_api_key}"},
+                provider_id=provider_config["thirdPartyId"],
             )
 
             if status != 200:
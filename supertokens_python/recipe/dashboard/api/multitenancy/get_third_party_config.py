@@ -334,6 +334,7 @@ async def get_third_party_config(
                 ).get_as_string_dangerous(),
                 {"clientID": final_clients[0].client_id},
                 {"Authorization": f"Api-Key {boxy_api_key}"},
+                provider_id=third_party_id,
             )
 
             json_response = resp
@@ -25,7 +25,6 @@ from supertokens_python.recipe.passwordless import (
 from supertokens_python.recipe.passwordless.asyncio import signinup
 from supertokens_python.recipe.passwordless.recipe import PasswordlessRecipe
 from supertokens_python.types import APIResponse, User, RecipeUserId
-from phonenumbers import parse as parse_phone_number, format_number, PhoneNumberFormat
 
 
 class CreatePasswordlessUserOkResponse(APIResponse):
@@ -133,6 +132,12 @@ async def create_passwordless_user(
         if validation_error is not None:
             return CreatePasswordlessUserPhoneValidationErrorResponse(validation_error)
 
+        from phonenumbers import (  # type: ignore
+            PhoneNumberFormat,
+            format_number,
+            parse as parse_phone_number,
+        )
+
         try:
             parsed_phone_number = parse_phone_number(phone_number)
             phone_number = format_number(parsed_phone_number, PhoneNumberFormat.E164)
@@ -472,6 +472,8 @@ class EmailVerificationClaimValidators(BooleanClaimValidators):
 
 
 class EmailVerificationClaimClass(BooleanClaim):
+    depends_on_other_claims = False
+
     def __init__(self):
         async def fetch_value(
             _: str,
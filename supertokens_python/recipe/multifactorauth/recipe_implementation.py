@@ -12,6 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
+import asyncio
 import importlib
 
 from typing import TYPE_CHECKING, Any, Awaitable, Dict, Set, Callable, List
@@ -151,10 +152,14 @@ class RecipeImplementation(RecipeInterface):
         required_secondary_factors_for_tenant: Callable[[], Awaitable[List[str]]],
         user_context: Dict[str, Any],
     ) -> MFARequirementList:
+        for_user, for_tenant = await asyncio.gather(
+            required_secondary_factors_for_user(),
+            required_secondary_factors_for_tenant(),
+        )
         all_factors: Set[str] = set()
-        for factor in await required_secondary_factors_for_user():
+        for factor in for_user:
             all_factors.add(factor)
-        for factor in await required_secondary_factors_for_tenant():
+        for factor in for_tenant:
             all_factors.add(factor)
         return [{"oneOf": list(all_factors)}]
 
@@ -12,7 +12,17 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Optional, Union, Dict, Any
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    Dict,
+    Any,
+)
 from supertokens_python.recipe.multifactorauth.multi_factor_auth_claim import (
     MultiFactorAuthClaim,
 )
@@ -27,7 +37,8 @@ from supertokens_python.recipe.multifactorauth.types import (
     MFARequirementList,
     FactorIds,
 )
-from supertokens_python.types import RecipeUserId
+from supertokens_python.types import RecipeUserId, User
+import asyncio
 import math
 import time
 from typing_extensions import Literal
@@ -36,6 +47,8 @@ from supertokens_python.utils import log_debug_message
 if TYPE_CHECKING:
     from .types import OverrideConfig, MultiFactorAuthConfig
 
+_T = TypeVar("_T")
+
 
 # IMPORTANT: If this function signature is modified, please update all tha places where this function is called.
 # There will be no type errors cause we use importLib to dynamically import if to prevent cyclic import issues.
@@ -57,6 +70,25 @@ def validate_and_normalise_user_input(
     )
 
 
+def memoize_async_getter(
+    getter: Callable[[], Awaitable[_T]]
+) -> Callable[[], Awaitable[_T]]:
+    """
+    Returns a getter that calls `getter` at most once. Concurrent calls share
+    the same in-flight call, and later calls get its result (or exception).
+    """
+    result: Optional[asyncio.Future[_T]] = None
+
+    async def memoized_getter() -> _T:
+        nonlocal result
+        if result is None:
+            result = asyncio.ensure_future(getter())
+        # shield so that a cancelled caller does not cancel the shared call
+        return await asyncio.shield(result)
+
+    return memoized_getter
+
+
 class UpdateAndGetMFARelatedInfoInSessionResult:
     def __init__(
         self,
@@ -105,6 +137,7 @@ async def update_and_get_mfa_related_info_in_session(
         session_handle = access_token_payload["sessionHandle"]
 
     updated_claim_val = False
+    session_user: Optional[User] = None
     mfa_claim_value = MultiFactorAuthClaim.get_value_from_payload(access_token_payload)
 
     if input_updated_factor_id is not None:
@@ -119,15 +152,15 @@ async def update_and_get_mfa_related_info_in_session(
             mfa_claim_value.c[input_updated_factor_id] = math.floor(time.time())
 
     if mfa_claim_value is None:
-        session_user = (
-            await AccountLinkingRecipe.get_instance().recipe_implementation.get_user(
+        session_user, session_info = await asyncio.gather(
+            AccountLinkingRecipe.get_instance().recipe_implementation.get_user(
                 session_recipe_user_id.get_as_string(), user_context
-            )
+            ),
+            get_session_information(session_handle, user_context),
         )
         if session_user is None:
             raise UnauthorisedError("Session user not found")
 
-        session_info = await get_session_information(session_handle, user_context)
         if session_info is None:
             raise UnauthorisedError("Session not found")
 
@@ -139,26 +172,12 @@ async def update_and_get_mfa_related_info_in_session(
                 login_method.recipe_user_id.get_as_string()
                 == session_recipe_user_id.get_as_string()
             ):
+                factors_to_check: List[str] = []
                 if login_method.recipe_id == "emailpassword":
-                    valid_res = await is_valid_first_factor(
-                        tenant_id, FactorIds.EMAILPASSWORD, user_context
-                    )
-                    if valid_res == "TENANT_NOT_FOUND_ERROR":
-                        raise UnauthorisedError("Tenant not found")
-                    elif valid_res == "OK":
-                        computed_first_factor_id_for_session = FactorIds.EMAILPASSWORD
-                        break
+                    factors_to_check.append(FactorIds.EMAILPASSWORD)
                 elif login_method.recipe_id == "thirdparty":
-                    valid_res = await is_valid_first_factor(
-                        tenant_id, FactorIds.THIRDPARTY, user_context
-                    )
-                    if valid_res == "TENANT_NOT_FOUND_ERROR":
-                        raise UnauthorisedError("Tenant not found")
-                    elif valid_res == "OK":
-                        computed_first_factor_id_for_session = FactorIds.THIRDPARTY
-                        break
+                    factors_to_check.append(FactorIds.THIRDPARTY)
                 else:
-                    factors_to_check: List[str] = []
                     if login_method.email is not None:
                         factors_to_check.extend(
                             [FactorIds.LINK_EMAIL, FactorIds.OTP_EMAIL]
@@ -168,18 +187,17 @@ async def update_and_get_mfa_related_info_in_session(
                             [FactorIds.LINK_PHONE, FactorIds.OTP_PHONE]
                         )
 
-                    for factor_id in factors_to_check:
-                        valid_res = await is_valid_first_factor(
-                            tenant_id, factor_id, user_context
-                        )
-                        if valid_res == "TENANT_NOT_FOUND_ERROR":
-                            raise UnauthorisedError("Tenant not found")
-                        elif valid_res == "OK":
-                            computed_first_factor_id_for_session = factor_id
-                            break
+                if len(factors_to_check) == 0:
+                    continue
 
-                    if computed_first_factor_id_for_session is not None:
-                        break
+                valid_first_factors = await get_valid_first_factors(
+                    tenant_id, factors_to_check, user_context
+                )
+                if valid_first_factors == "TENANT_NOT_FOUND_ERROR":
+                    raise UnauthorisedError("Tenant not found")
+                if len(valid_first_factors) > 0:
+                    computed_first_factor_id_for_session = valid_first_factors[0]
+                    break
 
         if computed_first_factor_id_for_session is None:
             raise UnauthorisedError("Incorrect login method used")
@@ -192,7 +210,12 @@ async def update_and_get_mfa_related_info_in_session(
 
     completed_factors = mfa_claim_value.c
 
-    async def user_getter():
+    # The getters below are passed to get_mfa_requirements_for_auth, which may
+    # call them in any order and concurrently. Each of them hits the core at
+    # most once, and the user fetched above (if any) is reused.
+    async def get_user() -> User:
+        if session_user is not None:
+            return session_user
         resp = await AccountLinkingRecipe.get_instance().recipe_implementation.get_user(
             session_recipe_user_id.get_as_string(), user_context
         )
@@ -200,9 +223,9 @@ async def update_and_get_mfa_related_info_in_session(
             raise UnauthorisedError("Session user not found")
         return resp
 
-    async def get_required_secondary_factors_for_tenant(
-        tenant_id: str, user_context: Dict[str, Any]
-    ) -> List[str]:
+    user_getter = memoize_async_getter(get_user)
+
+    async def get_required_secondary_factors_for_tenant() -> List[str]:
         tenant_info = await get_tenant(tenant_id, user_context)
         if tenant_info is None:
             raise UnauthorisedError("Tenant not found")
@@ -222,18 +245,17 @@ async def update_and_get_mfa_related_info_in_session(
             user_id=(await user_getter()).id, user_context=user_context
         )
 
-    async def get_required_secondary_factors_for_tenant_helper() -> List[str]:
-        return await get_required_secondary_factors_for_tenant(
-            tenant_id=tenant_id, user_context=user_context
-        )
-
     mfa_requirements_for_auth = await Recipe.get_instance_or_throw_error().recipe_implementation.get_mfa_requirements_for_auth(
         tenant_id=tenant_id,
         access_token_payload=access_token_payload,
         user=user_getter,
-        factors_set_up_for_user=get_factors_setup_for_user,
-        required_secondary_factors_for_user=get_required_secondary_factors_for_user,
-        required_secondary_factors_for_tenant=get_required_secondary_factors_for_tenant_helper,
+        factors_set_up_for_user=memoize_async_getter(get_factors_setup_for_user),
+        required_secondary_factors_for_user=memoize_async_getter(
+            get_required_secondary_factors_for_user
+        ),
+        required_secondary_factors_for_tenant=memoize_async_getter(
+            get_required_secondary_factors_for_tenant
+        ),
         completed_factors=completed_factors,
         user_context=user_context,
     )
@@ -268,7 +290,27 @@ async def update_and_get_mfa_related_info_in_session(
 async def is_valid_first_factor(
     tenant_id: str, factor_id: str, user_context: Dict[str, Any]
 ) -> Literal["OK", "INVALID_FIRST_FACTOR_ERROR", "TENANT_NOT_FOUND_ERROR"]:
+    valid_first_factors = await get_valid_first_factors(
+        tenant_id, [factor_id], user_context
+    )
+    if valid_first_factors == "TENANT_NOT_FOUND_ERROR":
+        return "TENANT_NOT_FOUND_ERROR"
 
+    if factor_id in valid_first_factors:
+        return "OK"
+
+    return "INVALID_FIRST_FACTOR_ERROR"
+
+
+# IMPORTANT: If this function signature is modified, please update all tha places where this function is called.
+# There will be no type errors cause we use importLib to dynamically import if to prevent cyclic import issues.
+async def get_valid_first_factors(
+    tenant_id: str, factor_ids: List[str], user_context: Dict[str, Any]
+) -> Union[List[str], Literal["TENANT_NOT_FOUND_ERROR"]]:
+    """
+    Returns the factor ids from factor_ids (in the same order) that are valid
+    first factors for the tenant. The tenant config is fetched only once.
+    """
     mt_recipe = MultitenancyRecipe.get_instance()
     tenant_info = await get_tenant(tenant_id=tenant_id, user_context=user_context)
     if tenant_info is None:
@@ -279,9 +321,9 @@ async def is_valid_first_factor(
     first_factors_from_mfa = mt_recipe.static_first_factors
 
     log_debug_message(
-        f"is_valid_first_factor got {', '.join(tenant_config.first_factors) if tenant_config.first_factors else None} from tenant config"
+        f"get_valid_first_factors got {', '.join(tenant_config.first_factors) if tenant_config.first_factors else None} from tenant config"
     )
-    log_debug_message(f"is_valid_first_factor got {first_factors_from_mfa} from MFA")
+    log_debug_message(f"get_valid_first_factors got {first_factors_from_mfa} from MFA")
 
     configured_first_factors: Union[List[str], None] = (
         tenant_config.first_factors or first_factors_from_mfa
@@ -290,14 +332,15 @@ async def is_valid_first_factor(
     if configured_first_factors is None:
         configured_first_factors = mt_recipe.all_available_first_factors
 
-    if is_factor_configured_for_tenant(
-        all_available_first_factors=mt_recipe.all_available_first_factors,
-        first_factors=configured_first_factors,
-        factor_id=factor_id,
-    ):
-        return "OK"
-
-    return "INVALID_FIRST_FACTOR_ERROR"
+    return [
+        factor_id
+        for factor_id in factor_ids
+        if is_factor_configured_for_tenant(
+            all_available_first_factors=mt_recipe.all_available_first_factors,
+            first_factors=configured_first_factors,
+            factor_id=factor_id,
+        )
+    ]
 
 
 def is_factor_configured_for_tenant(
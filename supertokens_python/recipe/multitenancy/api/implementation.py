@@ -41,7 +41,7 @@ class APIImplementation(APIInterface):
         )
         from supertokens_python.recipe.thirdparty.providers.config_utils import (
             merge_providers_from_core_and_static,
-            find_and_create_provider_instance,
+            get_provider_instance_for_tenant,
         )
 
         from supertokens_python.recipe.thirdparty.exceptions import (
@@ -68,8 +68,11 @@ class APIImplementation(APIInterface):
 
         for provider_input in merged_providers:
             try:
-                provider_instance = await find_and_create_provider_instance(
-                    merged_providers,
+                provider_instance = await get_provider_instance_for_tenant(
+                    tenant_id,
+                    provider_configs_from_core,
+                    provider_inputs_from_static,
+                    tenant_id == DEFAULT_TENANT_ID,
                     provider_input.config.third_party_id,
                     client_type,
                     user_context,
@@ -92,15 +95,12 @@ class APIImplementation(APIInterface):
         else:
             first_factors = list(set(api_options.all_available_first_factors))
 
-        valid_first_factors: List[str] = []
-        for factor_id in first_factors:
-            valid_res = await module.is_valid_first_factor(
-                tenant_id, factor_id, user_context
-            )
-            if valid_res == "OK":
-                valid_first_factors.append(factor_id)
-            if valid_res == "TENANT_NOT_FOUND_ERROR":
-                raise Exception("Tenant not found")
+        valid_res = await module.get_valid_first_factors(
+            tenant_id, first_factors, user_context
+        )
+        if valid_res == "TENANT_NOT_FOUND_ERROR":
+            raise Exception("Tenant not found")
+        valid_first_factors: List[str] = valid_res
 
         return LoginMethodsGetOkResult(
             email_password=LoginMethodEmailPassword(
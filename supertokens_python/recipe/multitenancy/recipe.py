@@ -206,6 +206,8 @@ class MultitenancyRecipe(RecipeModule):
 
 
 class AllowedDomainsClaimClass(PrimitiveArrayClaim[List[str]]):
+    depends_on_other_claims = False
+
     def __init__(self):
         default_max_age_in_sec = 60 * 60
 
@@ -45,6 +45,14 @@ from supertokens_python.querier import NormalisedURLPath
 from .constants import DEFAULT_TENANT_ID
 
 
+def clear_provider_instance_cache(tenant_id: str):
+    from supertokens_python.recipe.thirdparty.providers.config_utils import (
+        clear_provider_instance_cache as clear_cache,
+    )
+
+    clear_cache(tenant_id)
+
+
 def parse_tenant_config(tenant: Dict[str, Any]) -> TenantConfig:
     from supertokens_python.recipe.thirdparty.provider import (
         UserInfoMap,
@@ -161,6 +169,8 @@ class RecipeImplementation(RecipeInterface):
             {"tenantId": tenant_id},
             user_context=user_context,
         )
+        clear_provider_instance_cache(tenant_id)
+
         return DeleteTenantOkResult(
             did_exist=response["didExist"],
         )
@@ -220,6 +230,8 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
 
+        clear_provider_instance_cache(tenant_id or DEFAULT_TENANT_ID)
+
         return CreateOrUpdateThirdPartyConfigOkResult(
             created_new=response["createdNew"],
         )
@@ -240,6 +252,8 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
 
+        clear_provider_instance_cache(tenant_id or DEFAULT_TENANT_ID)
+
         return DeleteThirdPartyConfigOkResult(
             did_config_exist=response["didConfigExist"],
         )
@@ -13,8 +13,6 @@
 # under the License.
 from typing import Union, Any, Dict
 
-import phonenumbers  # type: ignore
-from phonenumbers import format_number, parse
 from supertokens_python.auth_utils import load_session_in_auth_api_if_needed  # type: ignore
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.passwordless.interfaces import APIInterface, APIOptions
@@ -105,9 +103,15 @@ async def create_code(
                 GeneralErrorResponse(validation_error).to_json()
             )
             return api_options.response
+        from phonenumbers import (  # type: ignore
+            PhoneNumberFormat,
+            format_number,
+            parse,
+        )
+
         try:
             phone_number_formatted: str = format_number(
-                parse(phone_number, None), phonenumbers.PhoneNumberFormat.E164
+                parse(phone_number, None), PhoneNumberFormat.E164
             )  # type: ignore
             phone_number = phone_number_formatted
         except Exception:
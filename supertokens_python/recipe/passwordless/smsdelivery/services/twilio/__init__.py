@@ -28,8 +28,6 @@ from supertokens_python.recipe.passwordless.types import (
     PasswordlessLoginSMSTemplateVars,
 )
 
-from twilio.rest import Client  # type: ignore
-
 from .service_implementation import ServiceImplementation
 
 _T = TypeVar("_T")
@@ -45,6 +43,8 @@ class TwilioService(SMSDeliveryInterface[PasswordlessLoginSMSTemplateVars]):
             Callable[[TwilioServiceInterface[_T]], TwilioServiceInterface[_T]], None
         ] = None,
     ) -> None:
+        from twilio.rest import Client  # type: ignore
+
         self.config = normalize_twilio_settings(twilio_settings)
         otps = twilio_settings.opts if twilio_settings.opts else {}
         self.twilio_client = Client(  # type: ignore
@@ -16,6 +16,9 @@ from __future__ import annotations
 
 from typing import Any, Dict, Union
 
+from supertokens_python.ingredients.smsdelivery.services.twilio import (
+    run_twilio_request,
+)
 from supertokens_python.ingredients.smsdelivery.types import (
     SMSContent,
     TwilioServiceInterface,
@@ -37,13 +40,15 @@ class ServiceImplementation(TwilioServiceInterface[PasswordlessLoginSMSTemplateV
         messaging_service_sid: Union[str, None] = None,
     ) -> None:
         if from_:
-            self.twilio_client.messages.create(  # type: ignore
+            await run_twilio_request(
+                self.twilio_client.messages.create,  # type: ignore
                 to=content.to_phone,
                 body=content.body,
                 from_=from_,
             )
         else:
-            self.twilio_client.messages.create(  # type: ignore
+            await run_twilio_request(
+                self.twilio_client.messages.create,  # type: ignore
                 to=content.to_phone,
                 body=content.body,
                 messaging_service_sid=messaging_service_sid,
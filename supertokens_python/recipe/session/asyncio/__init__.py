@@ -41,7 +41,10 @@ from ..session_request_functions import (
     refresh_session_in_request,
 )
 from ..constants import protected_props
-from ..utils import get_required_claim_validators
+from ..utils import (
+    build_access_token_payload_with_claims,
+    get_required_claim_validators,
+)
 
 from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
 from supertokens_python.asyncio import get_user
@@ -122,11 +125,14 @@ async def create_new_session_without_request_response(
     if user is not None:
         user_id = user.id
 
-    for claim in claims_added_by_other_recipes:
-        update = await claim.build(
-            user_id, recipe_user_id, tenant_id, final_access_token_payload, user_context
-        )
-        final_access_token_payload = {**final_access_token_payload, **update}
+    final_access_token_payload = await build_access_token_payload_with_claims(
+        claims_added_by_other_recipes,
+        user_id,
+        recipe_user_id,
+        tenant_id,
+        final_access_token_payload,
+        user_context,
+    )
 
     return await SessionRecipe.get_instance().recipe_implementation.create_new_session(
         user_id,
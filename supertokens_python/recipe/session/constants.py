@@ -29,6 +29,7 @@ AUTH_MODE_HEADER_KEY = "st-auth-mode"
 AUTHORIZATION_HEADER_KEY = "authorization"
 ACCESS_TOKEN_HEADER_KEY = "st-access-token"
 REFRESH_TOKEN_HEADER_KEY = "st-refresh-token"
+REFRESH_HINT_HEADER_KEY = "st-refresh-hint"
 ACCESS_CONTROL_EXPOSE_HEADERS = "Access-Control-Expose-Headers"
 
 available_token_transfer_methods: List[TokenTransferMethod] = ["cookie", "header"]
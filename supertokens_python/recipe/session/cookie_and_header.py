@@ -13,11 +13,12 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from urllib.parse import quote, unquote
 
 from typing_extensions import Literal
 
+from supertokens_python.framework.response import BaseResponse
 from supertokens_python.recipe.session.exceptions import (
     raise_clear_duplicate_session_cookies_exception,
 )
@@ -31,6 +32,7 @@ from .constants import (
     AUTH_MODE_HEADER_KEY,
     AUTHORIZATION_HEADER_KEY,
     FRONT_TOKEN_HEADER_SET_KEY,
+    REFRESH_HINT_HEADER_KEY,
     REFRESH_TOKEN_COOKIE_KEY,
     REFRESH_TOKEN_HEADER_KEY,
     RID_HEADER_KEY,
@@ -41,7 +43,6 @@ from supertokens_python.constants import ONE_YEAR_IN_MS
 
 if TYPE_CHECKING:
     from supertokens_python.framework.request import BaseRequest
-    from supertokens_python.framework.response import BaseResponse
     from .recipe import SessionRecipe
     from .utils import (
         TokenTransferMethod,
@@ -49,21 +50,12 @@ if TYPE_CHECKING:
         SessionConfig,
     )
 
-from json import dumps
 from typing import Any, Dict
 
-from supertokens_python.utils import get_header, utf_base64encode, get_timestamp_ms
+from supertokens_python.timing import timing_span
+from supertokens_python.utils import get_header, get_timestamp_ms
 
-
-def build_front_token(
-    user_id: str, at_expiry: int, access_token_payload: Optional[Dict[str, Any]] = None
-):
-    if access_token_payload is None:
-        access_token_payload = {}
-    token_info = {"uid": user_id, "ate": at_expiry, "up": access_token_payload}
-    return utf_base64encode(
-        dumps(token_info, separators=(",", ":"), sort_keys=True), urlsafe=False
-    )
+from .front_token import build_front_token  # pylint: disable=unused-import
 
 
 def _set_front_token_in_headers(
@@ -96,6 +88,96 @@ def set_header(response: BaseResponse, key: str, value: str, allow_duplicate: bo
         response.set_header(key, value)
 
 
+class ResponseMutationPlan(BaseResponse):
+    """
+    Collects the headers and cookies set by response mutators, so that they can
+    be applied to the actual response in one pass. The last write wins for each
+    header and for each cookie (by name, path and domain).
+    """
+
+    def __init__(self, response: BaseResponse):  # pylint: disable=super-init-not-called
+        self.__target = response
+        # The framework response, as on the response wrappers that mutators
+        # were given before
+        self.response = getattr(response, "response", None)
+        self.content = response.content
+        self.status_code = response.status_code
+        self.wrapper_used = response.wrapper_used
+        # lower cased header name -> (header name, value or None if removed)
+        self.headers: Dict[str, Tuple[str, Optional[str]]] = {}
+        self.cookies: Dict[Tuple[str, str, Optional[str]], Dict[str, Any]] = {}
+
+    def set_cookie(
+        self,
+        key: str,
+        value: str,
+        expires: int,
+        path: str = "/",
+        domain: Optional[str] = None,
+        secure: bool = False,
+        httponly: bool = False,
+        samesite: Literal["lax", "strict", "none"] = "lax",
+    ):
+        cookie_key = (key, path, domain)
+        # pop so that the cookie is set in the order of the last write
+        self.cookies.pop(cookie_key, None)
+        self.cookies[cookie_key] = {
+            "key": key,
+            "value": value,
+            "expires": expires,
+            "path": path,
+            "domain": domain,
+            "secure": secure,
+            "httponly": httponly,
+            "samesite": samesite,
+        }
+
+    def set_header(self, key: str, value: str) -> None:
+        self.headers[key.lower()] = (key, value)
+
+    def get_header(self, key: str) -> Optional[str]:
+        if key.lower() in self.headers:
+            return self.headers[key.lower()][1]
+        return self.__target.get_header(key)
+
+    def remove_header(self, key: str) -> None:
+        self.headers[key.lower()] = (key, None)
+
+    def set_status_code(self, status_code: int):
+        self.__target.set_status_code(status_code)
+
+    def set_json_content(self, content: Dict[str, Any]):
+        self.__target.set_json_content(content)
+
+    def set_html_content(self, content: str):
+        self.__target.set_html_content(content)
+
+    def apply(self) -> None:
+        for key, value in self.headers.values():
+            if value is not None:
+                self.__target.set_header(key, value)
+            elif self.__target.get_header(key) is not None:
+                self.__target.remove_header(key)
+
+        for cookie in self.cookies.values():
+            self.__target.set_cookie(**cookie)
+
+
+def apply_response_mutators(
+    response: BaseResponse,
+    response_mutators: List[ResponseMutator],
+    user_context: Dict[str, Any],
+):
+    if len(response_mutators) == 0:
+        return
+
+    with timing_span("response_mutators", user_context):
+        plan = ResponseMutationPlan(response)
+        for mutator in response_mutators:
+            mutator(plan, user_context)
+        plan.apply()
+
+
 def remove_header(response: BaseResponse, key: str):
     if response.get_header(key) is not None:
         response.remove_header(key)
@@ -181,6 +263,21 @@ def anti_csrf_response_mutator(value: str):
     return mutator
 
 
+def refresh_hint_response_mutator(expires_in_sec: int):
+    # Lets the frontend refresh the session in the background before the
+    # access token expires, instead of after a 401 on the next request
+    def mutator(
+        response: BaseResponse,
+        _: Dict[str, Any],
+    ):
+        set_header(response, REFRESH_HINT_HEADER_KEY, str(expires_in_sec), False)
+        set_header(
+            response, ACCESS_CONTROL_EXPOSE_HEADERS, REFRESH_HINT_HEADER_KEY, True
+        )
+
+    return mutator
+
+
 def get_anti_csrf_header(request: BaseRequest):
     return get_header(request, ANTI_CSRF_HEADER_KEY)
 
@@ -21,6 +21,9 @@ from supertokens_python.framework.django.django_request import DjangoRequest
 from supertokens_python.framework.django.django_response import DjangoResponse
 from supertokens_python.recipe.session import SessionRecipe, SessionContainer
 from supertokens_python.recipe.session.interfaces import SessionClaimValidator
+from supertokens_python.recipe.session.session_request_functions import (
+    get_session_from_request_without_core,
+)
 from supertokens_python.utils import set_request_in_user_context_if_not_defined
 from supertokens_python.types import MaybeAwaitable
 
@@ -56,16 +59,24 @@ def verify_session(
                 )
 
                 recipe = SessionRecipe.get_instance()
-                session = sync(
-                    recipe.verify_session(
-                        baseRequest,
-                        anti_csrf_check,
-                        session_required,
-                        check_database,
-                        override_global_claim_validators,
-                        user_context,
+                session = None
+                if not check_database and override_global_claim_validators is None:
+                    # Avoids running the event loop if the access token can be
+                    # verified using just the JWKS
+                    session = get_session_from_request_without_core(
+                        baseRequest, recipe, anti_csrf_check, user_context
+                    )
+                if session is None:
+                    session = sync(
+                        recipe.verify_session(
+                            baseRequest,
+                            anti_csrf_check,
+                            session_required,
+                            check_database,
+                            override_global_claim_validators,
+                            user_context,
+                        )
                     )
-                )
                 if session is None:
                     if session_required:
                         raise Exception("Should never come here")
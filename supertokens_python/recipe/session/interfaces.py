@@ -37,6 +37,7 @@ from supertokens_python.types import (
 
 from ...utils import resolve
 from .exceptions import ClaimValidationError
+from .front_token import build_front_token
 from .utils import SessionConfig, TokenTransferMethod
 
 if TYPE_CHECKING:
@@ -429,6 +430,8 @@ ResponseMutator = Callable[[BaseResponse, Dict[str, Any]], None]
 
 
 class TokenInfo:
+    __slots__ = ("token", "expiry", "created_time")
+
     def __init__(self, token: str, expiry: int, created_time: int):
         self.token = token
         self.expiry = expiry
@@ -448,7 +451,7 @@ class SessionContainer(ABC):  # pylint: disable=too-many-public-methods
         recipe_implementation: RecipeInterface,
         config: SessionConfig,
         access_token: str,
-        front_token: str,
+        front_token: Optional[str],
         refresh_token: Optional[TokenInfo],
         anti_csrf_token: Optional[str],
         session_handle: str,
@@ -458,11 +461,19 @@ class SessionContainer(ABC):  # pylint: disable=too-many-public-methods
         req_res_info: Optional[ReqResInfo],
         access_token_updated: bool,
         tenant_id: str,
+        access_token_expiry: Optional[int] = None,
     ):
+        if front_token is None and access_token_expiry is None:
+            raise Exception(
+                "Either front_token or access_token_expiry needs to be provided"
+            )
         self.recipe_implementation = recipe_implementation
         self.config = config
         self.access_token = access_token
-        self.front_token = front_token
+        # If front_token is None, it is built from the access token expiry and
+        # payload the first time it is needed, and then reused.
+        self._front_token = front_token
+        self.access_token_expiry = access_token_expiry
         self.refresh_token = refresh_token
         self.anti_csrf_token = anti_csrf_token
         self.session_handle = session_handle
@@ -474,6 +485,20 @@ class SessionContainer(ABC):  # pylint: disable=too-many-public-methods
         self.recipe_user_id = recipe_user_id
         self.response_mutators: List[ResponseMutator] = []
 
+    @property
+    def front_token(self) -> str:
+        if self._front_token is None:
+            assert self.access_token_expiry is not None
+            self._front_token = build_front_token(
+                self.user_id, self.access_token_expiry, self.user_data_in_access_token
+            )
+        return self._front_token
+
+    @front_token.setter
+    def front_token(self, front_token: Optional[str]) -> None:
+        # Setting this to None rebuilds the front token the next time it is read
+        self._front_token = front_token
+
     @abstractmethod
     async def revoke_session(
         self, user_context: Optional[Dict[str, Any]] = None
@@ -675,6 +700,11 @@ class SessionContainer(ABC):  # pylint: disable=too-many-public-methods
 
 
 class SessionClaim(ABC, Generic[_T]):
+    # Claims that don't read the values of other claims from current_payload
+    # (in fetch_value or build) can set this to False, so that they are built
+    # at the same time as the claims around them when a session is created
+    depends_on_other_claims = True
+
     def __init__(
         self,
         key: str,
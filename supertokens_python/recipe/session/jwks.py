@@ -12,14 +12,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import requests
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from hashlib import sha256
 from os import environ
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
 from typing_extensions import TypedDict
 
 from jwt import PyJWK, PyJWKSet
 
 from supertokens_python.recipe.session.utils import SessionConfig
+from supertokens_python.timing import set_span_attributes, timing_span
 from supertokens_python.utils import RWMutex, RWLockContext, get_timestamp_ms
 from supertokens_python.querier import Querier
 from supertokens_python.logger import log_debug_message
@@ -34,10 +41,23 @@ JWKSConfig: JWKSConfigType = {
 }
 
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
 class CachedKeys:
-    def __init__(self, keys: List[PyJWK], refresh_interval_sec: int):
+    def __init__(
+        self,
+        keys: List[PyJWK],
+        refresh_interval_sec: int,
+        last_refresh_time: Optional[int] = None,
+    ):
         self.keys = keys
-        self.last_refresh_time = get_timestamp_ms()
+        self.last_refresh_time = (
+            get_timestamp_ms() if last_refresh_time is None else last_refresh_time
+        )
         self.refresh_interval_sec = refresh_interval_sec
 
     def is_fresh(self):
@@ -88,6 +108,104 @@ def find_matching_keys(
     return None
 
 
+class JWKSFileCache:
+    """
+    A JWKS cache shared by all the processes on a host (for example the workers
+    of a prefork server) through a file in `cache_dir`. The file is replaced
+    atomically, so readers never see a partial write, and refreshes are
+    serialised with an exclusive lock on a sibling lock file so that only one
+    worker queries the core while the others wait and then read its result.
+    """
+
+    def __init__(self, cache_dir: str, core_paths: List[str]):
+        # Different core deployments (or apps) must not share a cache file
+        key = sha256("\n".join(core_paths).encode()).hexdigest()[:16]
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, f"supertokens-jwks-{key}.json")
+        self.lock_path = self.path + ".lock"
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            lock_file = open(self.lock_path, "a")  # pylint: disable=consider-using-with
+        except OSError as e:
+            # The in-memory cache still works, so refresh without the lock
+            log_debug_message("Could not open the JWKS cache lock file: %s", str(e))
+            yield
+            return
+
+        with lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            except OSError as e:
+                log_debug_message("Could not lock the JWKS cache file: %s", str(e))
+                yield
+                return
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def read(self, refresh_interval_sec: int) -> Optional[CachedKeys]:
+        try:
+            with open(self.path) as f:
+                content = json.load(f)
+            result = CachedKeys(
+                PyJWKSet.from_dict(content["jwks"]).keys,  # type: ignore
+                refresh_interval_sec,
+                content["fetchedAt"],
+            )
+        except Exception as e:
+            log_debug_message("Could not read the JWKS cache file: %s", str(e))
+            return None
+
+        return result if result.is_fresh() else None
+
+    def write(self, jwks: Dict[str, Any]):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"fetchedAt": get_timestamp_ms(), "jwks": jwks}, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            # The in-memory cache still works, so this is not fatal
+            log_debug_message("Could not write the JWKS cache file: %s", str(e))
+
+
+def fetch_jwks(core_paths: List[str]) -> Dict[str, Any]:
+    last_error: Exception = Exception("No valid JWKS found")
+
+    for path in core_paths:
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Attempting to fetch JWKS from path: %s", path)
+
+        try:
+            log_debug_message("Fetching jwk set from the configured uri")
+            with timing_span("jwks_refresh", None, {"url": path}), requests.get(
+                path, timeout=JWKSConfig["request_timeout"] / 1000
+            ) as response:  # 5 second timeout
+                response.raise_for_status()
+                jwks = response.json()
+                # Make sure that the response is a valid JWKS
+                PyJWKSet.from_dict(jwks)
+                return jwks
+        except Exception as e:
+            last_error = e
+
+    raise last_error
+
+
 def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[PyJWK]:
     global cached_keys
 
@@ -96,6 +214,7 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
 
     with RWLockContext(mutex, read=True):
         matching_keys = find_matching_keys(get_cached_keys(), kid)
+        set_span_attributes(jwks_cache_hit=matching_keys is not None)
         if matching_keys is not None:
             if environ.get("SUPERTOKENS_ENV") == "testing":
                 log_debug_message("Returning JWKS from cache")
@@ -111,8 +230,6 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
             "No SuperTokens core available to query. Please pass supertokens > connection_uri to the init function, or override all the functions of the recipe you are using."
         )
 
-    last_error: Exception = Exception("No valid JWKS found")
-
     with RWLockContext(mutex, read=False):
         # check again if the keys are in cache
         # because another thread might have fetched the keys while this one was waiting for the lock
@@ -120,28 +237,30 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
         if matching_keys is not None:
             return matching_keys
 
-        for path in core_paths:
-            if environ.get("SUPERTOKENS_ENV") == "testing":
-                log_debug_message("Attempting to fetch JWKS from path: %s", path)
-
-            cached_jwks: Optional[List[PyJWK]] = None
-            try:
-                log_debug_message("Fetching jwk set from the configured uri")
-                with requests.get(
-                    path, timeout=JWKSConfig["request_timeout"] / 1000
-                ) as response:  # 5 second timeout
-                    response.raise_for_status()
-                    cached_jwks = PyJWKSet.from_dict(response.json()).keys  # type: ignore
-            except Exception as e:
-                last_error = e
-
-            if cached_jwks is not None:  # we found a valid JWKS
-                cached_keys = CachedKeys(cached_jwks, config.jwks_refresh_interval_sec)
-                log_debug_message("Returning JWKS from fetch")
-                matching_keys = find_matching_keys(get_cached_keys(), kid)
-                if matching_keys is not None:
-                    return matching_keys
-
-                raise Exception("No matching JWKS found")
+        if config.jwks_cache_dir is None:
+            jwks = fetch_jwks(core_paths)
+        else:
+            file_cache = JWKSFileCache(config.jwks_cache_dir, core_paths)
+            with file_cache.lock():
+                # Another process might have refreshed the keys while this one was waiting for the lock
+                keys_from_file = file_cache.read(config.jwks_refresh_interval_sec)
+                if keys_from_file is not None:
+                    matching_keys = find_matching_keys(keys_from_file.keys, kid)
+                    if matching_keys is not None:
+                        cached_keys = keys_from_file
+                        log_debug_message("Returning JWKS from the cache file")
+                        return matching_keys
+
+                jwks = fetch_jwks(core_paths)
+                file_cache.write(jwks)
+
+        cached_keys = CachedKeys(
+            PyJWKSet.from_dict(jwks).keys,  # type: ignore
+            config.jwks_refresh_interval_sec,
+        )
+        log_debug_message("Returning JWKS from fetch")
+        matching_keys = find_matching_keys(get_cached_keys(), kid)
+        if matching_keys is not None:
+            return matching_keys
 
-    raise last_error
+        raise Exception("No matching JWKS found")
@@ -61,7 +61,10 @@ from .utils import (
     TokenTransferMethod,
     validate_and_normalise_user_input,
 )
-from .cookie_and_header import clear_session_from_all_token_transfer_methods
+from .cookie_and_header import (
+    apply_response_mutators,
+    clear_session_from_all_token_transfer_methods,
+)
 
 
 class SessionRecipe(RecipeModule):
@@ -93,6 +96,8 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        jwks_cache_dir: Union[str, None] = None,
+        refresh_hint_window_sec: Union[int, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -110,6 +115,8 @@ class SessionRecipe(RecipeModule):
             use_dynamic_access_token_signing_key,
             expose_access_token_to_frontend_in_cookie_based_auth,
             jwks_refresh_interval_sec,
+            jwks_cache_dir,
+            refresh_hint_window_sec,
         )
         self.openid_recipe = OpenIdRecipe(
             recipe_id,
@@ -238,8 +245,7 @@ class SessionRecipe(RecipeModule):
         user_context: Dict[str, Any],
     ) -> BaseResponse:
         if isinstance(err, SuperTokensSessionError):
-            for mutator in err.response_mutators:
-                mutator(response, user_context)
+            apply_response_mutators(response, err.response_mutators, user_context)
 
         if isinstance(err, UnauthorisedError):
             log_debug_message("errorHandler: returning UNAUTHORISED")
@@ -307,6 +313,8 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        jwks_cache_dir: Union[str, None] = None,
+        refresh_hint_window_sec: Union[int, None] = None,
     ):
         def func(app_info: AppInfo):
             if SessionRecipe.__instance is None:
@@ -326,6 +334,8 @@ class SessionRecipe(RecipeModule):
                     use_dynamic_access_token_signing_key,
                     expose_access_token_to_frontend_in_cookie_based_auth,
                     jwks_refresh_interval_sec,
+                    jwks_cache_dir,
+                    refresh_hint_window_sec,
                 )
                 return SessionRecipe.__instance
             raise_general_exception(
@@ -372,6 +382,29 @@ class SessionRecipe(RecipeModule):
     ) -> List[SessionClaimValidator]:
         return self.claim_validators_added_by_other_recipes
 
+    def uses_default_session_verification(self) -> bool:
+        """
+        True if session verification is not overridden and there are no claim
+        validators other than the ones added by the user, so that a valid
+        access token is all that's needed to verify a session.
+        """
+        from .api.implementation import APIImplementation
+
+        return (
+            not _is_overridden(
+                self.api_implementation, "verify_session", APIImplementation
+            )
+            and not _is_overridden(
+                self.recipe_implementation, "get_session", RecipeImplementation
+            )
+            and not _is_overridden(
+                self.recipe_implementation,
+                "get_global_claim_validators",
+                RecipeImplementation,
+            )
+            and len(self.claim_validators_added_by_other_recipes) == 0
+        )
+
     async def verify_session(
         self,
         request: BaseRequest,
@@ -402,3 +435,9 @@ class SessionRecipe(RecipeModule):
             override_global_claim_validators,
             user_context,
         )
+
+
+def _is_overridden(implementation: Any, name: str, original_class: Any) -> bool:
+    return name in vars(implementation) or getattr(
+        type(implementation), name, None
+    ) is not getattr(original_class, name)
@@ -18,12 +18,12 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.timing import timing_span
 from supertokens_python.utils import resolve
 
 from ...types import MaybeAwaitable, RecipeUserId
 from . import session_functions
 from .access_token import validate_access_token_structure
-from .cookie_and_header import build_front_token
 from .exceptions import UnauthorisedError
 from .interfaces import (
     AccessTokenObj,
@@ -89,9 +89,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             self,
             self.config,
             result.accessToken.token,
-            build_front_token(
-                result.session.userId, result.accessToken.expiry, payload
-            ),
+            None,
             result.refreshToken,
             result.antiCsrfToken,
             result.session.handle,
@@ -101,6 +99,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             None,
             True,
             tenant_id,
+            access_token_expiry=result.accessToken.expiry,
         )
 
         return new_session
@@ -112,6 +111,23 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         access_token_payload: Dict[str, Any],
         claim_validators: List[SessionClaimValidator],
         user_context: Dict[str, Any],
+    ) -> ClaimsValidationResult:
+        with timing_span("claim_validation", user_context):
+            return await self.__validate_claims(
+                user_id,
+                recipe_user_id,
+                access_token_payload,
+                claim_validators,
+                user_context,
+            )
+
+    async def __validate_claims(
+        self,
+        user_id: str,
+        recipe_user_id: RecipeUserId,
+        access_token_payload: Dict[str, Any],
+        claim_validators: List[SessionClaimValidator],
+        user_context: Dict[str, Any],
     ) -> ClaimsValidationResult:
         access_token_payload_update = None
         original_access_token_payload = json.dumps(access_token_payload)
@@ -127,15 +143,18 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
                 log_debug_message(
                     "update_claims_in_payload_if_needed refetching for %s", validator.id
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
-                        user_id,
-                        recipe_user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
-                        access_token_payload,
-                        user_context,
+                with timing_span(
+                    "claim_refetch", user_context, {"claim": validator.id}
+                ):
+                    value = await resolve(
+                        validator.claim.fetch_value(
+                            user_id,
+                            recipe_user_id,
+                            access_token_payload.get("tId", DEFAULT_TENANT_ID),
+                            access_token_payload,
+                            user_context,
+                        )
                     )
-                )
                 log_debug_message(
                     "update_claims_in_payload_if_needed %s refetch result %s",
                     validator.id,
@@ -250,7 +269,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             self,
             self.config,
             access_token_str,
-            build_front_token(response.session.userId, expiry_time, payload),
+            None,  # front_token, built from the expiry and payload when needed
             None,  # refresh_token
             anti_csrf_token,
             response.session.handle,
@@ -260,6 +279,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             None,
             access_token_updated,
             response.session.tenant_id,
+            access_token_expiry=expiry_time,
         )
 
         return session
@@ -301,11 +321,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             self,
             self.config,
             response.accessToken.token,
-            build_front_token(
-                response.session.userId,
-                response.accessToken.expiry,
-                payload,
-            ),
+            None,
             response.refreshToken,
             response.antiCsrfToken,
             response.session.handle,
@@ -315,6 +331,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             req_res_info=None,
             access_token_updated=True,
             tenant_id=payload["tId"],
+            access_token_expiry=response.accessToken.expiry,
         )
 
         return session
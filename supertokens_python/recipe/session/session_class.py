@@ -24,7 +24,6 @@ from .utils import TokenTransferMethod
 from .cookie_and_header import (
     clear_session_response_mutator,
     token_response_mutator,
-    build_front_token,
     anti_csrf_response_mutator,
     access_token_mutator,
 )
@@ -34,6 +33,7 @@ from .interfaces import (
     SessionClaimValidator,
     SessionContainer,
     GetSessionTokensDangerouslyDict,
+    ResponseMutator,
 )
 from .constants import protected_props
 from ...framework import BaseRequest
@@ -43,6 +43,17 @@ _T = TypeVar("_T")
 
 
 class Session(SessionContainer):
+    _access_token_response_mutator: Optional[ResponseMutator] = None
+
+    def set_access_token_response_mutator(self, mutator: ResponseMutator) -> None:
+        # Only the latest access token needs to be set in the response, so
+        # this replaces the mutator added for an earlier access token (if any).
+        previous = self._access_token_response_mutator
+        if previous is not None and previous in self.response_mutators:
+            self.response_mutators.remove(previous)
+        self._access_token_response_mutator = mutator
+        self.response_mutators.append(mutator)
+
     async def attach_to_request_response(
         self,
         request: BaseRequest,
@@ -52,7 +63,7 @@ class Session(SessionContainer):
         self.req_res_info = ReqResInfo(request, transfer_method)
 
         if self.access_token_updated:
-            self.response_mutators.append(
+            self.set_access_token_response_mutator(
                 access_token_mutator(
                     self.access_token,
                     self.front_token,
@@ -319,15 +330,19 @@ class Session(SessionContainer):
                 if resp_token.version >= 3
                 else response.session.user_data_in_jwt
             )
+            if (
+                response.access_token.expiry != self.access_token_expiry
+                or payload != self.user_data_in_access_token
+            ):
+                # The front token only depends on the user id, expiry and payload
+                self.front_token = None
             self.user_data_in_access_token = payload
             self.access_token = response.access_token.token
-            self.front_token = build_front_token(
-                self.get_user_id(), response.access_token.expiry, payload
-            )
+            self.access_token_expiry = response.access_token.expiry
             self.access_token_updated = True
             if self.req_res_info is not None:
                 transfer_method: TokenTransferMethod = self.req_res_info.transfer_method  # type: ignore
-                self.response_mutators.append(
+                self.set_access_token_response_mutator(
                     access_token_mutator(
                         self.access_token,
                         self.front_token,
@@ -340,6 +355,10 @@ class Session(SessionContainer):
             # This case means that the access token has expired between the validation and this update
             # We can't update the access token on the FE, as it will need to call refresh anyway but we handle this as a successful update during this request
             # the changes will be reflected on the FE after refresh is called
+
+            # The front token still belongs to the current access token, so we
+            # build it before its payload is changed below.
+            _ = self.front_token
             self.user_data_in_access_token = {
                 **self.get_access_token_payload(),
                 **response.session.user_data_in_jwt,
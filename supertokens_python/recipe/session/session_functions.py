@@ -28,6 +28,7 @@ if TYPE_CHECKING:
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.process_state import PROCESS_STATE, ProcessState
+from supertokens_python.timing import timing_span
 from supertokens_python.recipe.session.interfaces import TokenInfo
 
 from .exceptions import (
@@ -41,6 +42,8 @@ from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
 
 
 class CreateOrRefreshAPIResponseSession:
+    __slots__ = ("handle", "userId", "recipe_user_id", "userDataInJWT", "tenant_id")
+
     def __init__(
         self,
         handle: str,
@@ -57,6 +60,8 @@ class CreateOrRefreshAPIResponseSession:
 
 
 class CreateOrRefreshAPIResponse:
+    __slots__ = ("session", "accessToken", "refreshToken", "antiCsrfToken")
+
     def __init__(
         self,
         session: CreateOrRefreshAPIResponseSession,
@@ -71,6 +76,15 @@ class CreateOrRefreshAPIResponse:
 
 
 class GetSessionAPIResponseSession:
+    __slots__ = (
+        "handle",
+        "userId",
+        "recipe_user_id",
+        "userDataInJWT",
+        "expiryTime",
+        "tenant_id",
+    )
+
     def __init__(
         self,
         handle: str,
@@ -89,6 +103,8 @@ class GetSessionAPIResponseSession:
 
 
 class GetSessionAPIResponseAccessToken:
+    __slots__ = ("token", "expiry", "createdTime")
+
     def __init__(self, token: str, expiry: int, createdTime: int) -> None:
         self.token = token
         self.expiry = expiry
@@ -96,6 +112,8 @@ class GetSessionAPIResponseAccessToken:
 
 
 class GetSessionAPIResponse:
+    __slots__ = ("session", "accessToken")
+
     def __init__(
         self,
         session: GetSessionAPIResponseSession,
@@ -169,11 +187,13 @@ async def get_session(
     access_token_info: Optional[Dict[str, Any]] = None
 
     try:
-        access_token_info = get_info_from_access_token(
-            config,
-            parsed_access_token,
-            config.anti_csrf_function_or_string == "VIA_TOKEN" and do_anti_csrf_check,
-        )
+        with timing_span("access_token_verification", user_context):
+            access_token_info = get_info_from_access_token(
+                config,
+                parsed_access_token,
+                config.anti_csrf_function_or_string == "VIA_TOKEN"
+                and do_anti_csrf_check,
+            )
 
     except Exception as e:
         if not isinstance(e, TryRefreshTokenError):
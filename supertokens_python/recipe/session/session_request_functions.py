@@ -15,7 +15,10 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from typing_extensions import Literal
+
 from supertokens_python.logger import log_debug_message
+from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.recipe.session.access_token import (
     validate_access_token_structure,
 )
@@ -26,6 +29,7 @@ from supertokens_python.recipe.session.cookie_and_header import (
     get_anti_csrf_header,
     get_token,
     has_multiple_cookies_for_token_type,
+    refresh_hint_response_mutator,
     set_cookie_response_mutator,
 )
 from supertokens_python.recipe.session.exceptions import (
@@ -51,6 +55,7 @@ from supertokens_python.recipe.session.jwt import (
 from supertokens_python.recipe.session.utils import (
     SessionConfig,
     TokenTransferMethod,
+    build_access_token_payload_with_claims,
     get_required_claim_validators,
     get_auth_mode_from_header,
 )
@@ -58,14 +63,17 @@ from supertokens_python.types import MaybeAwaitable, RecipeUserId
 from supertokens_python.utils import (
     FRAMEWORKS,
     get_rid_from_header,
+    get_timestamp_ms,
     is_an_ip_address,
     normalise_http_method,
     set_request_in_user_context_if_not_defined,
 )
 from supertokens_python.supertokens import Supertokens
+from supertokens_python.timing import timing_span
 from .constants import protected_props
 
 if TYPE_CHECKING:
+    from supertokens_python.framework import BaseRequest
     from supertokens_python.recipe.session.recipe import SessionRecipe
     from supertokens_python.supertokens import AppInfo
     from .interfaces import ResponseMutator
@@ -73,32 +81,28 @@ if TYPE_CHECKING:
 LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME = "sIdRefreshToken"
 
 
-async def get_session_from_request(
-    request: Any,
-    config: SessionConfig,
-    recipe_interface_impl: SessionRecipeInterface,
-    session_required: Optional[bool] = None,
-    anti_csrf_check: Optional[bool] = None,
-    check_database: Optional[bool] = None,
-    override_global_claim_validators: Optional[
-        Callable[
-            [List[SessionClaimValidator], SessionContainer, Dict[str, Any]],
-            MaybeAwaitable[List[SessionClaimValidator]],
-        ]
-    ] = None,
-    user_context: Optional[Dict[str, Any]] = None,
-) -> Optional[SessionContainer]:
-    log_debug_message("getSession: Started")
-
-    if not hasattr(request, "wrapper_used") or not request.wrapper_used:
-        request = FRAMEWORKS[
-            Supertokens.get_instance().app_info.framework
-        ].wrap_request(request)
-
-    log_debug_message("getSession: Wrapping done")
+class AccessTokenInRequest:
+    def __init__(
+        self,
+        allowed_transfer_method: Union[TokenTransferMethod, Literal["any"]],
+        transfer_method: Optional[TokenTransferMethod],
+        access_token: Optional[ParsedJWTInfo],
+        anti_csrf_token: Optional[str],
+        do_anti_csrf_check: bool,
+    ):
+        self.allowed_transfer_method = allowed_transfer_method
+        self.transfer_method = transfer_method
+        self.access_token = access_token
+        self.anti_csrf_token = anti_csrf_token
+        self.do_anti_csrf_check = do_anti_csrf_check
 
-    user_context = set_request_in_user_context_if_not_defined(user_context, request)
 
+def get_access_token_from_request(
+    request: BaseRequest,
+    config: SessionConfig,
+    anti_csrf_check: Optional[bool],
+    user_context: Dict[str, Any],
+) -> AccessTokenInRequest:
     # This token isn't handled by getToken to limit the scope of this legacy/migration code
     if request.get_cookie(LEGACY_ID_REFRESH_TOKEN_COOKIE_NAME) is not None:
         log_debug_message(
@@ -109,9 +113,6 @@ async def get_session_from_request(
             "using legacy session, please call the refresh API"
         )
 
-    session_optional = not session_required
-    log_debug_message("getSession: optional validation: %s", session_optional)
-
     access_tokens: Dict[TokenTransferMethod, ParsedJWTInfo] = {}
 
     # We check all token transfer methods for available access tokens
@@ -193,6 +194,53 @@ async def get_session_from_request(
 
     log_debug_message("getSession: Value of antiCsrfToken is: %s", do_anti_csrf_check)
 
+    return AccessTokenInRequest(
+        allowed_transfer_method,
+        request_transfer_method,
+        request_access_token,
+        anti_csrf_token,
+        do_anti_csrf_check,
+    )
+
+
+async def get_session_from_request(
+    request: Any,
+    config: SessionConfig,
+    recipe_interface_impl: SessionRecipeInterface,
+    session_required: Optional[bool] = None,
+    anti_csrf_check: Optional[bool] = None,
+    check_database: Optional[bool] = None,
+    override_global_claim_validators: Optional[
+        Callable[
+            [List[SessionClaimValidator], SessionContainer, Dict[str, Any]],
+            MaybeAwaitable[List[SessionClaimValidator]],
+        ]
+    ] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> Optional[SessionContainer]:
+    log_debug_message("getSession: Started")
+
+    if not hasattr(request, "wrapper_used") or not request.wrapper_used:
+        request = FRAMEWORKS[
+            Supertokens.get_instance().app_info.framework
+        ].wrap_request(request)
+
+    log_debug_message("getSession: Wrapping done")
+
+    user_context = set_request_in_user_context_if_not_defined(user_context, request)
+
+    session_optional = not session_required
+    log_debug_message("getSession: optional validation: %s", session_optional)
+
+    token_info = get_access_token_from_request(
+        request, config, anti_csrf_check, user_context
+    )
+    allowed_transfer_method = token_info.allowed_transfer_method
+    request_transfer_method = token_info.transfer_method
+    request_access_token = token_info.access_token
+    anti_csrf_token = token_info.anti_csrf_token
+    do_anti_csrf_check = token_info.do_anti_csrf_check
+
     session = await recipe_interface_impl.get_session(
         access_token=(
             request_access_token.raw_token_string
@@ -229,6 +277,114 @@ async def get_session_from_request(
         await session.attach_to_request_response(
             request, final_transfer_method, user_context
         )
+        add_refresh_hint_if_near_expiry(session, config)
+
+    return session
+
+
+def add_refresh_hint_if_near_expiry(session: SessionContainer, config: SessionConfig):
+    if (
+        config.refresh_hint_window_sec is None
+        or session.access_token_updated
+        or session.access_token_expiry is None
+    ):
+        return
+
+    expires_in_ms = session.access_token_expiry - get_timestamp_ms()
+    if expires_in_ms < config.refresh_hint_window_sec * 1000:
+        log_debug_message("getSession: access token is close to expiry")
+        session.response_mutators.append(
+            refresh_hint_response_mutator(max(expires_in_ms // 1000, 0))
+        )
+
+
+def get_session_from_request_without_core(
+    request: BaseRequest,
+    recipe: SessionRecipe,
+    anti_csrf_check: Optional[bool],
+    user_context: Dict[str, Any],
+) -> Optional[SessionContainer]:
+    """
+    Synchronously verifies the access token in the request using the cached
+    JWKS, without calling the core or running any claim validators.
+
+    This only covers the common case of a valid v3+ access token, with no
+    overrides of session verification and no global claim validators. In all
+    other cases, it returns None and get_session_from_request should be used.
+    It does not return None for a valid session.
+    """
+    from supertokens_python.recipe.session.access_token import (
+        get_info_from_access_token,
+    )
+    from supertokens_python.recipe.session.interfaces import ReqResInfo
+    from supertokens_python.recipe.session.session_class import Session
+
+    config = recipe.config
+    recipe_implementation = recipe.recipe_implementation
+    if not recipe.uses_default_session_verification():
+        return None
+
+    method = normalise_http_method(request.method())
+    if method in ("options", "trace"):
+        return None
+    if method == "post" and NormalisedURLPath(request.get_path()).equals(
+        config.refresh_token_path
+    ):
+        return None
+
+    try:
+        token_info = get_access_token_from_request(
+            request, config, anti_csrf_check, user_context
+        )
+    except SuperTokensSessionError:
+        return None
+
+    access_token = token_info.access_token
+    if (
+        access_token is None
+        or token_info.transfer_method is None
+        or token_info.do_anti_csrf_check
+        or access_token.version < 3
+    ):
+        return None
+
+    try:
+        with timing_span("access_token_verification", user_context):
+            access_token_info = get_info_from_access_token(config, access_token, False)
+    except Exception:
+        return None
+
+    token_uses_dynamic_key = (
+        access_token.kid is not None and access_token.kid.startswith("d-")
+    )
+    if (
+        token_uses_dynamic_key != config.use_dynamic_access_token_signing_key
+        or access_token_info["parentRefreshTokenHash1"] is not None
+    ):
+        return None
+
+    log_debug_message("getSession: verified access token without calling the core")
+
+    session = Session(
+        recipe_implementation,
+        config,
+        access_token.raw_token_string,
+        None,  # front_token, built from the expiry and payload when needed
+        None,  # refresh_token
+        token_info.anti_csrf_token,
+        access_token_info["sessionHandle"],
+        access_token_info["userId"],
+        RecipeUserId(access_token_info["recipeUserId"]),
+        access_token.payload,
+        None,
+        False,  # access_token_updated
+        access_token_info["tenantId"],
+        access_token_expiry=access_token_info["expiryTime"],
+    )
+    # Same as attach_to_request_response, since the access token was not updated
+    session.req_res_info = ReqResInfo(request, token_info.transfer_method)
+    request.set_session(session)
+    add_refresh_hint_if_near_expiry(session, config)
 
     return session
 
@@ -268,11 +424,14 @@ async def create_new_session_in_request(
         if prop in final_access_token_payload:
             del final_access_token_payload[prop]
 
-    for claim in claims_added_by_other_recipes:
-        update = await claim.build(
-            user_id, recipe_user_id, tenant_id, final_access_token_payload, user_context
-        )
-        final_access_token_payload.update(update)
+    final_access_token_payload = await build_access_token_payload_with_claims(
+        claims_added_by_other_recipes,
+        user_id,
+        recipe_user_id,
+        tenant_id,
+        final_access_token_payload,
+        user_context,
+    )
 
     log_debug_message("createNewSession: Access token payload built")
 
@@ -13,6 +13,7 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse
@@ -44,6 +45,7 @@ if TYPE_CHECKING:
     from .interfaces import (
         APIInterface,
         RecipeInterface,
+        SessionClaim,
         SessionContainer,
         SessionClaimValidator,
     )
@@ -391,6 +393,8 @@ class SessionConfig:
         use_dynamic_access_token_signing_key: bool,
         expose_access_token_to_frontend_in_cookie_based_auth: bool,
         jwks_refresh_interval_sec: int,
+        jwks_cache_dir: Optional[str],
+        refresh_hint_window_sec: Optional[int],
     ):
         self.session_expired_status_code = session_expired_status_code
         self.invalid_claim_status_code = invalid_claim_status_code
@@ -411,6 +415,8 @@ class SessionConfig:
         self.framework = framework
         self.mode = mode
         self.jwks_refresh_interval_sec = jwks_refresh_interval_sec
+        self.jwks_cache_dir = jwks_cache_dir
+        self.refresh_hint_window_sec = refresh_hint_window_sec
 
 
 def validate_and_normalise_user_input(
@@ -434,6 +440,8 @@ def validate_and_normalise_user_input(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    jwks_cache_dir: Union[str, None] = None,
+    refresh_hint_window_sec: Union[int, None] = None,
 ):
     _ = cookie_same_site  # we have this otherwise pylint complains that cookie_same_site is unused, but it is being used in the get_cookie_same_site function.
     if anti_csrf not in {"VIA_TOKEN", "VIA_CUSTOM_HEADER", "NONE", None}:
@@ -501,27 +509,15 @@ def validate_and_normalise_user_input(
     def get_cookie_same_site(
         request: Optional[BaseRequest], user_context: Dict[str, Any]
     ) -> Literal["lax", "strict", "none"]:
-        nonlocal cookie_same_site
         if cookie_same_site is not None:
             return normalise_same_site(cookie_same_site)
-        top_level_api_domain = app_info.top_level_api_domain
-        top_level_website_domain = app_info.get_top_level_website_domain(
-            request, user_context
-        )
 
-        api_domain_scheme = get_url_scheme(
-            app_info.api_domain.get_as_string_dangerous()
-        )
-        website_domain_scheme = get_url_scheme(
-            app_info.get_origin(request, user_context).get_as_string_dangerous()
-        )
-        if (top_level_api_domain != top_level_website_domain) or (
-            api_domain_scheme != website_domain_scheme
-        ):
-            cookie_same_site = "none"
-        else:
-            cookie_same_site = "lax"
-        return cookie_same_site
+        # The decision depends on the origin, which may differ per request if
+        # `origin` is a function, so it is not stored in cookie_same_site.
+        origin_info = app_info.get_origin_info(request, user_context)
+        if origin_info.is_same_site_as_api_domain:
+            return "lax"
+        return "none"
 
     def anti_csrf_function(
         request: Optional[BaseRequest], user_context: Dict[str, Any]
@@ -544,6 +540,9 @@ def validate_and_normalise_user_input(
     if jwks_refresh_interval_sec is None:
         jwks_refresh_interval_sec = 4 * 3600  # 4 hours
 
+    if refresh_hint_window_sec is not None and refresh_hint_window_sec <= 0:
+        raise ValueError("refresh_hint_window_sec must be a positive number or None")
+
     return SessionConfig(
         app_info.api_base_path.append(NormalisedURLPath(SESSION_REFRESH)),
         cookie_domain,
@@ -561,9 +560,52 @@ def validate_and_normalise_user_input(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        jwks_cache_dir,
+        refresh_hint_window_sec,
     )
 
 
+async def build_access_token_payload_with_claims(
+    claims: List[SessionClaim[Any]],
+    user_id: str,
+    recipe_user_id: RecipeUserId,
+    tenant_id: str,
+    access_token_payload: Dict[str, Any],
+    user_context: Dict[str, Any],
+) -> Dict[str, Any]:
+    # Each claim is built with the payload left by the claims before it, except
+    # that consecutive claims that don't depend on other claims are built
+    # concurrently. The updates are merged in claim order, so if two claims set
+    # the same key, the later one wins as before.
+    result = {**access_token_payload}
+    batch: List[SessionClaim[Any]] = []
+
+    async def build_batch():
+        updates = await asyncio.gather(
+            *[
+                claim.build(user_id, recipe_user_id, tenant_id, result, user_context)
+                for claim in batch
+            ]
+        )
+        for update in updates:
+            result.update(update)
+        batch.clear()
+
+    for claim in claims:
+        if claim.depends_on_other_claims:
+            await build_batch()
+            result.update(
+                await claim.build(
+                    user_id, recipe_user_id, tenant_id, result, user_context
+                )
+            )
+        else:
+            batch.append(claim)
+    await build_batch()
+
+    return result
+
+
 async def get_required_claim_validators(
     session: SessionContainer,
     override_global_claim_validators: Optional[
@@ -56,6 +56,7 @@ class BitbucketImpl(GenericProvider):
             "https://api.bitbucket.org/2.0/user",
             query_params=None,
             headers=headers,
+            provider_id=self.id,
         )
 
         raw_user_info_from_provider.from_user_info_api = user_info_from_access_token
@@ -64,6 +65,7 @@ class BitbucketImpl(GenericProvider):
             "https://api.bitbucket.org/2.0/user/emails",
             query_params=None,
             headers=headers,
+            provider_id=self.id,
         )
 
         if raw_user_info_from_provider.from_id_token_payload is None:
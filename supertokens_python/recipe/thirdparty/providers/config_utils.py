@@ -1,7 +1,10 @@
-from typing import List, Dict, Optional, Any
+import json
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, Tuple
 
 from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.utils import get_timestamp_ms
 from .active_directory import ActiveDirectory
 from .apple import Apple
 from .bitbucket import Bitbucket
@@ -99,38 +102,39 @@ def merge_config(
         result.user_info_map.from_id_token_payload = UserFields()
 
     if config_from_core.user_info_map is not None:
-        if config_from_core.user_info_map.from_user_info_api is None:
-            config_from_core.user_info_map.from_user_info_api = UserFields()
-        if config_from_core.user_info_map.from_id_token_payload is None:
-            config_from_core.user_info_map.from_id_token_payload = UserFields()
-
-        if config_from_core.user_info_map.from_id_token_payload.user_id is not None:
+        # Not normalising the core config in place so that it stays
+        # comparable across calls (see get_provider_config_fingerprint)
+        core_from_user_info_api = (
+            config_from_core.user_info_map.from_user_info_api or UserFields()
+        )
+        core_from_id_token_payload = (
+            config_from_core.user_info_map.from_id_token_payload or UserFields()
+        )
+
+        if core_from_id_token_payload.user_id is not None:
             result.user_info_map.from_id_token_payload.user_id = (
-                config_from_core.user_info_map.from_id_token_payload.user_id
+                core_from_id_token_payload.user_id
             )
-        if config_from_core.user_info_map.from_id_token_payload.email is not None:
+        if core_from_id_token_payload.email is not None:
             result.user_info_map.from_id_token_payload.email = (
-                config_from_core.user_info_map.from_id_token_payload.email
+                core_from_id_token_payload.email
             )
-        if (
-            config_from_core.user_info_map.from_id_token_payload.email_verified
-            is not None
-        ):
+        if core_from_id_token_payload.email_verified is not None:
             result.user_info_map.from_id_token_payload.email_verified = (
-                config_from_core.user_info_map.from_id_token_payload.email_verified
+                core_from_id_token_payload.email_verified
             )
 
-        if config_from_core.user_info_map.from_user_info_api.user_id is not None:
+        if core_from_user_info_api.user_id is not None:
             result.user_info_map.from_user_info_api.user_id = (
-                config_from_core.user_info_map.from_user_info_api.user_id
+                core_from_user_info_api.user_id
             )
-        if config_from_core.user_info_map.from_user_info_api.email is not None:
+        if core_from_user_info_api.email is not None:
             result.user_info_map.from_user_info_api.email = (
-                config_from_core.user_info_map.from_user_info_api.email
+                core_from_user_info_api.email
             )
-        if config_from_core.user_info_map.from_user_info_api.email_verified is not None:
+        if core_from_user_info_api.email_verified is not None:
             result.user_info_map.from_user_info_api.email_verified = (
-                config_from_core.user_info_map.from_user_info_api.email_verified
+                core_from_user_info_api.email_verified
             )
 
     merged_clients = (config_from_static.clients or [])[:]  # Make a copy
@@ -220,7 +224,7 @@ def create_provider(provider_input: ProviderInput) -> Provider:
 OIDC_INFO_MAP: Dict[str, Any] = {}
 
 
-async def get_oidc_discovery_info(issuer: str):
+async def get_oidc_discovery_info(issuer: str, provider_id: Optional[str] = None):
     if issuer in OIDC_INFO_MAP:
         return OIDC_INFO_MAP[issuer]
 
@@ -228,7 +232,8 @@ async def get_oidc_discovery_info(issuer: str):
     npath = NormalisedURLPath(issuer)
 
     oidc_info = await do_get_request(
-        ndomain.get_as_string_dangerous() + npath.get_as_string_dangerous()
+        ndomain.get_as_string_dangerous() + npath.get_as_string_dangerous(),
+        provider_id=provider_id,
     )
     OIDC_INFO_MAP[issuer] = oidc_info
 
@@ -241,7 +246,9 @@ async def discover_oidc_endpoints(
     if config.oidc_discovery_endpoint is None:
         return config
 
-    oidc_info = await get_oidc_discovery_info(config.oidc_discovery_endpoint)
+    oidc_info = await get_oidc_discovery_info(
+        config.oidc_discovery_endpoint, config.third_party_id
+    )
     if (
         oidc_info.get("authorization_endpoint") is not None
         and config.authorization_endpoint is None
@@ -288,3 +295,95 @@ async def find_and_create_provider_instance(
             return provider_instance
 
     return None
+
+
+PROVIDER_INSTANCE_CACHE_MAX_SIZE = 1000
+# Bounds how long derived secrets (for example Apple's client secret JWT) are
+# reused for
+PROVIDER_INSTANCE_CACHE_MAX_AGE_MS = 24 * 60 * 60 * 1000
+
+
+class CachedProviderInstance:
+    def __init__(self, fingerprint: str, provider: Provider, created_at: int):
+        self.fingerprint = fingerprint
+        self.provider = provider
+        self.created_at = created_at
+
+
+PROVIDER_INSTANCE_CACHE: (
+    "OrderedDict[Tuple[str, str, Optional[str]], CachedProviderInstance]"
+) = OrderedDict()
+
+
+def clear_provider_instance_cache(tenant_id: Optional[str] = None):
+    if tenant_id is None:
+        PROVIDER_INSTANCE_CACHE.clear()
+        return
+
+    for key in [k for k in PROVIDER_INSTANCE_CACHE if k[0] == tenant_id]:
+        del PROVIDER_INSTANCE_CACHE[key]
+
+
+def get_provider_config_fingerprint(
+    provider_configs_from_core: List[ProviderConfig], third_party_id: str
+) -> Optional[str]:
+    # Static providers are only used if the core has no providers for the
+    # tenant, and they do not change after init
+    if len(provider_configs_from_core) == 0:
+        return ""
+
+    for config in provider_configs_from_core:
+        if config.third_party_id == third_party_id:
+            return json.dumps(config.to_json(), sort_keys=True)
+
+    return None
+
+
+async def get_provider_instance_for_tenant(
+    tenant_id: str,
+    provider_configs_from_core: List[ProviderConfig],
+    provider_inputs_from_static: List[ProviderInput],
+    include_all_providers: bool,
+    third_party_id: str,
+    client_type: Optional[str],
+    user_context: Dict[str, Any],
+) -> Optional[Provider]:
+    fingerprint = get_provider_config_fingerprint(
+        provider_configs_from_core, third_party_id
+    )
+    key = (tenant_id, third_party_id, client_type)
+
+    cached = PROVIDER_INSTANCE_CACHE.get(key)
+    if (
+        cached is not None
+        and cached.fingerprint == fingerprint
+        and get_timestamp_ms() - cached.created_at < PROVIDER_INSTANCE_CACHE_MAX_AGE_MS
+    ):
+        PROVIDER_INSTANCE_CACHE.move_to_end(key)
+        return cached.provider
+
+    merged_providers = merge_providers_from_core_and_static(
+        provider_configs_from_core, provider_inputs_from_static, include_all_providers
+    )
+    provider_instance = await find_and_create_provider_instance(
+        merged_providers, third_party_id, client_type, user_context
+    )
+
+    # An overridden get_config_for_client_type may depend on the user_context,
+    # so the resulting config can't be shared across requests
+    if (
+        provider_instance is None
+        or fingerprint is None
+        or "get_config_for_client_type" in vars(provider_instance)
+    ):
+        PROVIDER_INSTANCE_CACHE.pop(key, None)
+        return provider_instance
+
+    PROVIDER_INSTANCE_CACHE[key] = CachedProviderInstance(
+        fingerprint, provider_instance, get_timestamp_ms()
+    )
+    PROVIDER_INSTANCE_CACHE.move_to_end(key)
+    while len(PROVIDER_INSTANCE_CACHE) > PROVIDER_INSTANCE_CACHE_MAX_SIZE:
+        PROVIDER_INSTANCE_CACHE.popitem(last=False)
+
+    return provider_instance
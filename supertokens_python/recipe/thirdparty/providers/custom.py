@@ -1,11 +1,8 @@
 from typing import Any, Callable, Dict, List, Optional, Union
 from urllib.parse import parse_qs, urlencode, urlparse
 
-from httpx import AsyncClient
-
 from jwt import decode  # type: ignore
 from jwt.algorithms import RSAAlgorithm
-import pkce
 
 from supertokens_python.recipe.thirdparty.exceptions import ClientTypeNotFoundError
 from supertokens_python.recipe.thirdparty.providers.utils import (
@@ -13,6 +10,7 @@ from supertokens_python.recipe.thirdparty.providers.utils import (
     DEV_OAUTH_REDIRECT_URL,
     do_get_request,
     do_post_request,
+    do_provider_request,
     get_actual_client_id_from_development_client_id,
     is_using_oauth_development_client_id,
     DEV_KEY_IDENTIFIER,
@@ -153,14 +151,13 @@ def get_supertokens_user_info_result_from_raw_user_info(
 
 
 async def verify_id_token_from_jwks_endpoint_and_get_payload(
-    id_token: str, jwks_uri: str, audience: str
+    id_token: str, jwks_uri: str, audience: str, provider_id: Optional[str] = None
 ):
     public_keys: List[RSAAlgorithm] = []
-    async with AsyncClient(timeout=30.0) as client:
-        response = await client.get(jwks_uri)  # type:ignore
-        key_payload = response.json()
-        for key in key_payload["keys"]:
-            public_keys.append(RSAAlgorithm.from_jwk(key))  # type: ignore
+    response = await do_provider_request("GET", jwks_uri, provider_id)
+    key_payload = response.json()
+    for key in key_payload["keys"]:
+        public_keys.append(RSAAlgorithm.from_jwk(key))  # type: ignore
 
     err = Exception("id token verification failed")
     for key in public_keys:
@@ -303,6 +300,8 @@ class GenericProvider(Provider):
         pkce_code_verifier: Union[str, None] = None
 
         if self.config.client_secret is None or self.config.force_pkce:
+            import pkce
+
             code_verifier, code_challenge = pkce.generate_pkce_pair(64)
             query_params["code_challenge"] = code_challenge
             query_params["code_challenge_method"] = "S256"
@@ -372,7 +371,9 @@ class GenericProvider(Provider):
             access_token_params["redirect_uri"] = DEV_OAUTH_REDIRECT_URL
         # Transformation needed for dev keys END
 
-        _, body = await do_post_request(token_api_url, access_token_params)
+        _, body = await do_post_request(
+            token_api_url, access_token_params, provider_id=self.id
+        )
         return body
 
     async def get_user_info(
@@ -390,6 +391,7 @@ class GenericProvider(Provider):
                     get_actual_client_id_from_development_client_id(
                         self.config.client_id
                     ),
+                    self.id,
                 )
             )
 
@@ -420,7 +422,10 @@ class GenericProvider(Provider):
                 )
 
             raw_user_info_from_provider.from_user_info_api = await do_get_request(
-                self.config.user_info_endpoint, query_params, headers
+                self.config.user_info_endpoint,
+                query_params,
+                headers,
+                provider_id=self.id,
             )
 
         user_info_result = get_supertokens_user_info_result_from_raw_user_info(
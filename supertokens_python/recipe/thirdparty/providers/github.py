@@ -47,8 +47,10 @@ class GithubImpl(GenericProvider):
 
         raw_response = {}
 
-        email_info: List[Any] = await do_get_request("https://api.github.com/user/emails", headers=headers)  # type: ignore
-        user_info = await do_get_request("https://api.github.com/user", headers=headers)
+        email_info: List[Any] = await do_get_request("https://api.github.com/user/emails", headers=headers, provider_id=self.id)  # type: ignore
+        user_info = await do_get_request(
+            "https://api.github.com/user", headers=headers, provider_id=self.id
+        )
 
         raw_response["emails"] = email_info
         raw_response["user"] = user_info
@@ -96,7 +98,9 @@ async def validate_access_token(
         "Content-Type": "application/json",
     }
 
-    status, body = await do_post_request(url, {"access_token": access_token}, headers)
+    status, body = await do_post_request(
+        url, {"access_token": access_token}, headers, provider_id=config.third_party_id
+    )
     if status != 200:
         raise ValueError("Invalid access token")
 
@@ -62,7 +62,7 @@ class LinkedinImpl(GenericProvider):
         raw_user_info_from_provider = RawUserInfoFromProvider({}, {})
         # https://learn.microsoft.com/en-us/linkedin/consumer/integrations/self-serve/sign-in-with-linkedin-v2?context=linkedin%2Fconsumer%2Fcontext#sample-api-response
         user_info = await do_get_request(
-            "https://api.linkedin.com/v2/userinfo", headers=headers
+            "https://api.linkedin.com/v2/userinfo", headers=headers, provider_id=self.id
         )
         raw_user_info_from_provider.from_user_info_api = user_info
 
@@ -88,6 +88,7 @@ class TwitterImpl(GenericProvider):
             self.config.token_endpoint,
             body_params=twitter_oauth_tokens_params,
             headers={"Authorization": f"Basic {auth_token}"},
+            provider_id=self.id,
         )
         return body
 
@@ -1,10 +1,17 @@
-from typing import Any, Dict, Optional, Tuple
+import asyncio
+import time
+from concurrent.futures import Future
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Limits, Response
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.timing import set_span_attributes, timing_span
 
 DEV_OAUTH_CLIENT_IDS = [
     "1060725074195-kmeum4crr01uirfl2op9kd5acmi9jutn.apps.googleusercontent.com",
@@ -16,6 +23,183 @@ DEV_OAUTH_AUTHORIZATION_URL = "https://supertokens.io/dev/oauth/redirect-to-prov
 DEV_OAUTH_REDIRECT_URL = "https://supertokens.io/dev/oauth/redirect-to-app"
 
 
+class ProviderRequestTiming:
+    def __init__(
+        self,
+        provider_id: Optional[str],
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        duration_ms: float,
+    ):
+        self.provider_id = provider_id
+        self.method = method
+        self.endpoint = endpoint
+        self.status_code = status_code
+        self.duration_ms = duration_ms
+
+
+class ProviderHTTPClientConfig:
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        provider_timeouts: Optional[Dict[str, float]] = None,
+        max_connections_per_host: int = 20,
+        max_keepalive_connections_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        on_request_complete: Optional[Callable[[ProviderRequestTiming], None]] = None,
+    ):
+        if provider_timeouts is None:
+            provider_timeouts = {}
+
+        self.timeout = timeout
+        self.provider_timeouts = provider_timeouts
+        self.max_connections_per_host = max_connections_per_host
+        self.max_keepalive_connections_per_host = max_keepalive_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.on_request_complete = on_request_complete
+
+    def get_timeout(self, provider_id: Optional[str]) -> float:
+        if provider_id is not None and provider_id in self.provider_timeouts:
+            return self.provider_timeouts[provider_id]
+        return self.timeout
+
+
+_http_client_config = ProviderHTTPClientConfig()
+
+# httpx clients are bound to the event loop they were first used on, so the
+# pool is kept per loop and, within a loop, per provider host so that
+# connection limits apply to each host separately.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncClient]]" = (
+    WeakKeyDictionary()
+)
+
+
+# Keeps the tasks closing clients on other loops alive until they finish
+_closing: "Set[Future[None]]" = set()
+
+
+def set_provider_http_client_config(config: ProviderHTTPClientConfig):
+    global _http_client_config
+    _http_client_config = config
+    # Existing clients were built with the old limits
+    reset_provider_http_clients()
+
+
+def reset_provider_http_clients():
+    """
+    Closes the pooled clients of all event loops, without waiting for the
+    clients of running loops to finish closing.
+    """
+    clients = list(_clients.items())
+    _clients.clear()
+    for loop, clients_for_loop in clients:
+        for client in clients_for_loop.values():
+            _close_client(loop, client)
+
+
+def _close_client(loop: asyncio.AbstractEventLoop, client: AsyncClient):
+    if loop.is_closed():
+        # The connections were closed along with the loop
+        return
+
+    coro = client.aclose()
+    try:
+        if loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+            _closing.add(future)
+            future.add_done_callback(_closing.discard)
+        else:
+            loop.run_until_complete(coro)
+    except Exception as e:
+        coro.close()
+        log_debug_message("Could not close a provider HTTP client: %s", str(e))
+
+
+def get_provider_http_client_config() -> ProviderHTTPClientConfig:
+    return _http_client_config
+
+
+def get_provider_http_client(url: str) -> AsyncClient:
+    loop = asyncio.get_running_loop()
+    clients_for_loop = _clients.get(loop)
+    if clients_for_loop is None:
+        clients_for_loop = {}
+        _clients[loop] = clients_for_loop
+
+    parsed = urlparse(url)
+    host_key = f"{parsed.scheme}://{parsed.netloc}"
+    client = clients_for_loop.get(host_key)
+    if client is None:
+        config = _http_client_config
+        client = AsyncClient(
+            timeout=config.timeout,
+            # The client is shared by the requests of all users, so cookies
+            # set by a provider must not be sent on anyone's next request
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            limits=Limits(
+                max_connections=config.max_connections_per_host,
+                max_keepalive_connections=config.max_keepalive_connections_per_host,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+        )
+        clients_for_loop[host_key] = client
+
+    return client
+
+
+async def close_provider_http_clients():
+    """
+    Closes the pooled clients of the running event loop. Call this when
+    shutting down the app.
+    """
+    loop = asyncio.get_running_loop()
+    clients_for_loop = _clients.pop(loop, {})
+    for client in clients_for_loop.values():
+        await client.aclose()
+
+
+async def do_provider_request(
+    method: str,
+    url: str,
+    provider_id: Optional[str] = None,
+    **kwargs: Any,
+) -> Response:
+    config = _http_client_config
+    client = get_provider_http_client(url)
+    parsed = urlparse(url)
+    url_without_query = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    start = time.monotonic()
+    status_code: Optional[int] = None
+    try:
+        with timing_span(
+            "third_party_request",
+            None,
+            {"provider_id": provider_id, "method": method, "url": url_without_query},
+        ):
+            res = await client.request(  # type: ignore
+                method, url, timeout=config.get_timeout(provider_id), **kwargs
+            )
+            status_code = res.status_code
+            set_span_attributes(status=status_code)
+        return res
+    finally:
+        if config.on_request_complete is not None:
+            try:
+                config.on_request_complete(
+                    ProviderRequestTiming(
+                        provider_id,
+                        method,
+                        url_without_query,
+                        status_code,
+                        (time.monotonic() - start) * 1000,
+                    )
+                )
+            except Exception as e:
+                # Timing must never break sign in
+                log_debug_message("Provider request timing hook failed: %s", str(e))
+
+
 def is_using_oauth_development_client_id(client_id: str):
     return client_id.startswith(DEV_KEY_IDENTIFIER) or client_id in DEV_OAUTH_CLIENT_IDS
 
@@ -30,26 +214,29 @@ async def do_get_request(
     url: str,
     query_params: Optional[Dict[str, str]] = None,
     headers: Optional[Dict[str, str]] = None,
+    provider_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     if query_params is None:
         query_params = {}
     if headers is None:
         headers = {}
 
-    async with AsyncClient(timeout=30.0) as client:
-        res = await client.get(url, params=query_params, headers=headers)  # type:ignore
+    res = await do_provider_request(
+        "GET", url, provider_id, params=query_params, headers=headers
+    )
 
-        log_debug_message(
-            "Received response with status %s and body %s", res.status_code, res.text
-        )
+    log_debug_message(
+        "Received response with status %s and body %s", res.status_code, res.text
+    )
 
-        return res.json()
+    return res.json()
 
 
 async def do_post_request(
     url: str,
     body_params: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
+    provider_id: Optional[str] = None,
 ) -> Tuple[int, Dict[str, Any]]:
     if body_params is None:
         body_params = {}
@@ -59,15 +246,16 @@ async def do_post_request(
     headers["content-type"] = "application/x-www-form-urlencoded"
     headers["accept"] = "application/json"
 
-    async with AsyncClient(timeout=30.0) as client:
-        res = await client.post(url, data=body_params, headers=headers)  # type:ignore
-        log_debug_message(
-            "Received response with status %s and body %s", res.status_code, res.text
-        )
-        try:
-            return res.status_code, res.json()
-        except Exception:
-            return res.status_code, {"message": res.text}
+    res = await do_provider_request(
+        "POST", url, provider_id, data=body_params, headers=headers
+    )
+    log_debug_message(
+        "Received response with status %s and body %s", res.status_code, res.text
+    )
+    try:
+        return res.status_code, res.json()
+    except Exception:
+        return res.status_code, {"message": res.text}
 
 
 def normalise_oidc_endpoint_to_include_well_known(url: str) -> str:
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from supertokens_python.framework.response import BaseResponse
     from supertokens_python.supertokens import AppInfo
     from .utils import SignInAndUpFeature, InputOverrideConfig
+    from .providers.utils import ProviderHTTPClientConfig
 
 from supertokens_python.exceptions import SuperTokensError, raise_general_exception
 from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
@@ -41,6 +42,8 @@ from .api import (
 )
 from .constants import APPLE_REDIRECT_HANDLER, AUTHORISATIONURL, SIGNINUP
 from .exceptions import SuperTokensThirdPartyError
+from .providers.config_utils import clear_provider_instance_cache
+from .providers.utils import set_provider_http_client_config
 from .types import ThirdPartyIngredients
 from .utils import validate_and_normalise_user_input
 
@@ -56,12 +59,16 @@ class ThirdPartyRecipe(RecipeModule):
         sign_in_and_up_feature: SignInAndUpFeature,
         _ingredients: ThirdPartyIngredients,
         override: Union[InputOverrideConfig, None] = None,
+        http_client_config: Union[ProviderHTTPClientConfig, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
             sign_in_and_up_feature,
             override,
+            http_client_config,
         )
+        set_provider_http_client_config(self.config.http_client_config)
+        clear_provider_instance_cache()
         self.providers = self.config.sign_in_and_up_feature.providers
         recipe_implementation = RecipeImplementation(
             Querier.get_instance(recipe_id), self.providers
@@ -165,6 +172,7 @@ class ThirdPartyRecipe(RecipeModule):
     def init(
         sign_in_and_up_feature: SignInAndUpFeature,
         override: Union[InputOverrideConfig, None] = None,
+        http_client_config: Union[ProviderHTTPClientConfig, None] = None,
     ):
         def func(app_info: AppInfo):
             if ThirdPartyRecipe.__instance is None:
@@ -175,6 +183,7 @@ class ThirdPartyRecipe(RecipeModule):
                     sign_in_and_up_feature,
                     ingredients,
                     override,
+                    http_client_config,
                 )
                 return ThirdPartyRecipe.__instance
             raise_general_exception(
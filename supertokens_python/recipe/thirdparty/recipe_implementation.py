@@ -23,8 +23,7 @@ from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
 from supertokens_python.recipe.session import SessionContainer
 from supertokens_python.recipe.thirdparty.provider import ProviderInput
 from supertokens_python.recipe.thirdparty.providers.config_utils import (
-    find_and_create_provider_instance,
-    merge_providers_from_core_and_static,
+    get_provider_instance_for_tenant,
 )
 from supertokens_python.types import AccountInfo, User, RecipeUserId
 
@@ -208,14 +207,14 @@ class RecipeImplementation(RecipeInterface):
         if tenant_config is None:
             raise Exception("Tenant not found")
 
-        merged_providers = merge_providers_from_core_and_static(
+        provider = await get_provider_instance_for_tenant(
+            tenant_id=tenant_id,
             provider_configs_from_core=tenant_config.third_party_providers,
             provider_inputs_from_static=self.providers,
             include_all_providers=tenant_id == DEFAULT_TENANT_ID,
-        )
-
-        provider = await find_and_create_provider_instance(
-            merged_providers, third_party_id, client_type, user_context
+            third_party_id=third_party_id,
+            client_type=client_type,
+            user_context=user_context,
         )
 
         return provider
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
 
 
 class ThirdPartyInfo:
+    __slots__ = ("user_id", "id")
+
     def __init__(self, third_party_user_id: str, third_party_id: str):
         self.user_id = third_party_user_id
         self.id = third_party_id
@@ -17,6 +17,9 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set, Union, Optiona
 
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.thirdparty.provider import ProviderInput
+from supertokens_python.recipe.thirdparty.providers.utils import (
+    ProviderHTTPClientConfig,
+)
 
 from .interfaces import APIInterface, RecipeInterface
 
@@ -71,14 +74,17 @@ class ThirdPartyConfig:
         self,
         sign_in_and_up_feature: SignInAndUpFeature,
         override: OverrideConfig,
+        http_client_config: ProviderHTTPClientConfig,
     ):
         self.sign_in_and_up_feature = sign_in_and_up_feature
         self.override = override
+        self.http_client_config = http_client_config
 
 
 def validate_and_normalise_user_input(
     sign_in_and_up_feature: SignInAndUpFeature,
     override: Union[InputOverrideConfig, None] = None,
+    http_client_config: Union[ProviderHTTPClientConfig, None] = None,
 ) -> ThirdPartyConfig:
     if not isinstance(sign_in_and_up_feature, SignInAndUpFeature):  # type: ignore
         raise ValueError(
@@ -88,12 +94,21 @@ def validate_and_normalise_user_input(
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
 
+    if http_client_config is not None and not isinstance(http_client_config, ProviderHTTPClientConfig):  # type: ignore
+        raise ValueError(
+            "http_client_config must be an instance of ProviderHTTPClientConfig or None"
+        )
+
     if override is None:
         override = InputOverrideConfig()
 
+    if http_client_config is None:
+        http_client_config = ProviderHTTPClientConfig()
+
     return ThirdPartyConfig(
         sign_in_and_up_feature,
         OverrideConfig(functions=override.functions, apis=override.apis),
+        http_client_config,
     )
 
 
@@ -1,7 +1,11 @@
-from typing import Any, Dict, Union
+import asyncio
+from typing import Any, Dict, List, Union
 
+from supertokens_python.recipe.usermetadata.interfaces import MetadataResult
 from supertokens_python.recipe.usermetadata.recipe import UserMetadataRecipe
 
+DEFAULT_GET_USERS_METADATA_CONCURRENCY = 50
+
 
 async def get_user_metadata(
     user_id: str, user_context: Union[Dict[str, Any], None] = None
@@ -15,6 +19,31 @@ async def get_user_metadata(
     )
 
 
+async def get_users_metadata(
+    user_ids: List[str],
+    max_concurrency: int = DEFAULT_GET_USERS_METADATA_CONCURRENCY,
+    user_context: Union[Dict[str, Any], None] = None,
+) -> Dict[str, MetadataResult]:
+    if user_context is None:
+        user_context = {}
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    recipe_implementation = UserMetadataRecipe.get_instance().recipe_implementation
+    # The core has no bulk metadata endpoint, so this fans out one request per
+    # unique user id. The requests share the user_context, which lets the
+    # querier's core call cache serve repeated lookups within a request.
+    unique_user_ids = list(dict.fromkeys(user_ids))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(user_id: str) -> MetadataResult:
+        async with semaphore:
+            return await recipe_implementation.get_user_metadata(user_id, user_context)
+
+    results = await asyncio.gather(*[fetch(user_id) for user_id in unique_user_ids])
+    return dict(zip(unique_user_ids, results))
+
+
 async def update_user_metadata(
     user_id: str,
     metadata_update: Dict[str, Any],
@@ -147,6 +147,8 @@ class UserRolesRecipe(RecipeModule):
 
 
 class PermissionClaimClass(PrimitiveArrayClaim[List[str]]):
+    depends_on_other_claims = False
+
     def __init__(self) -> None:
         key = "st-perm"
         default_max_age_in_sec = 300
@@ -186,6 +188,8 @@ PermissionClaim = PermissionClaimClass()
 
 
 class UserRoleClaimClass(PrimitiveArrayClaim[List[str]]):
+    depends_on_other_claims = False
+
     def __init__(self) -> None:
         key = "st-role"
         default_max_age_in_sec = 300
@@ -14,8 +14,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import OrderedDict
 from os import environ
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union, Tuple
+from urllib.parse import urlparse
 
 from typing_extensions import Literal
 
@@ -27,7 +31,11 @@ from supertokens_python.logger import (
 
 
 from .constants import FDI_KEY_HEADER, RID_KEY_HEADER, USER_COUNT
+from .bulkhead import BulkheadConfig
 from .exceptions import SuperTokensError
+from .hedging import HedgingConfig
+from .host_health import CircuitBreakerConfig
+from .rate_limiter import RateLimiterConfig
 from .interfaces import (
     CreateUserIdMappingOkResult,
     DeleteUserIdMappingOkResult,
@@ -41,7 +49,9 @@ from .interfaces import (
 from .normalised_url_domain import NormalisedURLDomain
 from .normalised_url_path import NormalisedURLPath
 from .post_init_callbacks import PostSTInitCallbacks
+from .async_to_sync_wrapper import sync
 from .querier import Querier
+from .timing import set_span_attributes, timing_span
 from .utils import (
     get_rid_from_header,
     get_top_level_domain_for_same_site_resolution,
@@ -86,11 +96,27 @@ class SupertokensConfig:
             ]
         ] = None,
         disable_core_call_cache: bool = False,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        hedging: Optional[HedgingConfig] = None,
+        rate_limiter: Optional[RateLimiterConfig] = None,
+        bulkhead: Optional[BulkheadConfig] = None,
+        request_timeout_ms: int = 30000,
+        path_timeouts_ms: Optional[Dict[str, int]] = None,
+        warm_api_version_on_init: bool = False,
+        api_version_cache_dir: Optional[str] = None,
     ):  # We keep this = None here because this is directly used by the user.
         self.connection_uri = connection_uri
         self.api_key = api_key
         self.network_interceptor = network_interceptor
         self.disable_core_call_cache = disable_core_call_cache
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.rate_limiter = rate_limiter
+        self.bulkhead = bulkhead
+        self.request_timeout_ms = request_timeout_ms
+        self.path_timeouts_ms = path_timeouts_ms
+        self.warm_api_version_on_init = warm_api_version_on_init
+        self.api_version_cache_dir = api_version_cache_dir
 
 
 class Host:
@@ -121,6 +147,31 @@ class InputAppInfo:
         self.website_base_path = website_base_path
 
 
+# Max number of origins for which the top level domain and scheme are cached
+# when `origin` is a function.
+ORIGIN_INFO_CACHE_MAX_SIZE = 1000
+# Guards the origin info caches, which can be used by many threads at once
+# under a threaded WSGI server
+_origin_info_cache_lock = threading.Lock()
+# The event loop only keeps weak references to tasks, so background tasks are
+# kept here until they are done
+_background_tasks: "Set[asyncio.Task[Any]]" = set()
+
+
+class OriginInfo:
+    def __init__(
+        self,
+        origin: NormalisedURLDomain,
+        top_level_domain: str,
+        scheme: str,
+        is_same_site_as_api_domain: bool,
+    ):
+        self.origin = origin
+        self.top_level_domain = top_level_domain
+        self.scheme = scheme
+        self.is_same_site_as_api_domain = is_same_site_as_api_domain
+
+
 class AppInfo:
     def __init__(
         self,
@@ -142,12 +193,16 @@ class AppInfo:
         self.top_level_api_domain = get_top_level_domain_for_same_site_resolution(
             self.api_domain.get_as_string_dangerous()
         )
+        self.api_domain_scheme = urlparse(
+            self.api_domain.get_as_string_dangerous()
+        ).scheme
         if website_domain is None and origin is None:
             raise_general_exception(
                 "Please provide at least one of website_domain or origin"
             )
         self.__origin = origin
         self.__website_domain = website_domain
+        self.__origin_info_cache: OrderedDict[str, OriginInfo] = OrderedDict()
         self.api_base_path = self.api_gateway_path.append(
             NormalisedURLPath(api_base_path)
         )
@@ -164,11 +219,14 @@ class AppInfo:
     def get_top_level_website_domain(
         self, request: Optional[BaseRequest], user_context: Dict[str, Any]
     ) -> str:
-        return get_top_level_domain_for_same_site_resolution(
-            self.get_origin(request, user_context).get_as_string_dangerous()
-        )
+        return self.get_origin_info(request, user_context).top_level_domain
 
     def get_origin(self, request: Optional[BaseRequest], user_context: Dict[str, Any]):
+        return self.get_origin_info(request, user_context).origin
+
+    def get_origin_info(
+        self, request: Optional[BaseRequest], user_context: Dict[str, Any]
+    ) -> OriginInfo:
         origin = self.__origin
         if origin is None:
             origin = self.__website_domain
@@ -180,7 +238,34 @@ class AppInfo:
         if callable(origin):
             origin = origin(request, user_context)
 
-        return NormalisedURLDomain(origin)
+        # Resolving the top level domain needs a public suffix list lookup, so we
+        # cache it per origin. This matters when `origin` is a function since it
+        # is resolved for every request that sets session cookies.
+        cache = self.__origin_info_cache
+        with _origin_info_cache_lock:
+            origin_info = cache.get(origin)
+            if origin_info is not None:
+                cache.move_to_end(origin)
+                return origin_info
+
+        normalised_origin = NormalisedURLDomain(origin)
+        origin_str = normalised_origin.get_as_string_dangerous()
+        top_level_domain = get_top_level_domain_for_same_site_resolution(origin_str)
+        scheme = urlparse(origin_str).scheme
+        origin_info = OriginInfo(
+            normalised_origin,
+            top_level_domain,
+            scheme,
+            top_level_domain == self.top_level_api_domain
+            and scheme == self.api_domain_scheme,
+        )
+
+        with _origin_info_cache_lock:
+            cache[origin] = origin_info
+            cache.move_to_end(origin)
+            if len(cache) > ORIGIN_INFO_CACHE_MAX_SIZE:
+                cache.popitem(last=False)
+        return origin_info
 
     def toJSON(self):
         def defaultImpl(o: Any):
@@ -194,9 +279,12 @@ class AppInfo:
 def manage_session_post_response(
     session: SessionContainer, response: BaseResponse, user_context: Dict[str, Any]
 ):
+    from supertokens_python.recipe.session.cookie_and_header import (
+        apply_response_mutators,
+    )
+
     # Something similar happens in handle_error of session/recipe.py
-    for mutator in session.response_mutators:
-        mutator(response, user_context)
+    apply_response_mutators(response, session.response_mutators, user_context)
 
 
 class Supertokens:
@@ -248,6 +336,13 @@ class Supertokens:
             supertokens_config.api_key,
             supertokens_config.network_interceptor,
             supertokens_config.disable_core_call_cache,
+            supertokens_config.circuit_breaker,
+            supertokens_config.hedging,
+            supertokens_config.rate_limiter,
+            supertokens_config.bulkhead,
+            supertokens_config.request_timeout_ms,
+            supertokens_config.path_timeouts_ms,
+            supertokens_config.api_version_cache_dir,
         )
 
         if len(recipe_list) == 0:
@@ -313,6 +408,36 @@ class Supertokens:
                 debug,
             )
             PostSTInitCallbacks.run_post_init_callbacks()
+            if supertokens_config.warm_api_version_on_init:
+                Supertokens.__instance.warm_api_version()
+
+    def warm_api_version(self):
+        # When init is called with an event loop running (for example in an
+        # ASGI lifespan handler), the version is fetched in the background.
+        # Otherwise, init waits for it.
+        querier = Querier.get_instance()
+
+        def on_error(e: BaseException):
+            # The version is fetched again on the first request to the core
+            log_debug_message("Could not warm the core API version: %s", str(e))
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                sync(querier.get_api_version())
+            except Exception as e:
+                on_error(e)
+            return
+
+        def on_done(task: asyncio.Task[str]):
+            _background_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                on_error(task.exception())  # type: ignore
+
+        task = loop.create_task(querier.get_api_version())
+        _background_tasks.add(task)
+        task.add_done_callback(on_done)
 
     @staticmethod
     def reset():
@@ -320,10 +445,14 @@ class Supertokens:
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        from supertokens_python.recipe.thirdparty.providers.utils import (
+            reset_provider_http_clients,
+        )
         from supertokens_python.recipe.usermetadata.recipe import UserMetadataRecipe
 
         UserMetadataRecipe.reset()
         Querier.reset()
+        reset_provider_http_clients()
         Supertokens.__instance = None
 
     @staticmethod
@@ -505,8 +634,35 @@ class Supertokens:
 
         raise_general_exception("Please upgrade the SuperTokens core to >= 3.15.0")
 
+    def can_handle_request_path(self, request: BaseRequest) -> bool:
+        """
+        Returns False if the middleware will not handle the request because its
+        path is not under the API base path. This is synchronous, so frameworks
+        can skip calling the async middleware for such requests.
+        """
+        try:
+            path = self.app_info.api_gateway_path.append(
+                NormalisedURLPath(request.get_path())
+            )
+        except Exception:
+            # Let the middleware decide (and raise) for paths we can't normalise
+            return True
+        return path.startswith(self.app_info.api_base_path)
+
     async def middleware(
         self, request: BaseRequest, response: BaseResponse, user_context: Dict[str, Any]
+    ) -> Union[BaseResponse, None]:
+        with timing_span(
+            "middleware",
+            user_context,
+            {"method": normalise_http_method(request.method())},
+        ):
+            result = await self.__handle_request(request, response, user_context)
+            set_span_attributes(handled=result is not None)
+            return result
+
+    async def __handle_request(
+        self, request: BaseRequest, response: BaseResponse, user_context: Dict[str, Any]
     ) -> Union[BaseResponse, None]:
         log_debug_message("middleware: Started")
         path = Supertokens.get_instance().app_info.api_gateway_path.append(
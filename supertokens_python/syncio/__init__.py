@@ -11,7 +11,21 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Dict, List, Optional, Union, Any
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import Literal
 
 from supertokens_python import Supertokens
 from supertokens_python.async_to_sync_wrapper import sync
@@ -27,6 +41,25 @@ from supertokens_python.interfaces import (
 )
 from supertokens_python.types import AccountInfo, User
 
+_T = TypeVar("_T")
+
+
+def _iterate_sync(agen: AsyncGenerator[_T, None]) -> Generator[_T, None, None]:
+    async def next_item() -> Tuple[bool, Optional[_T]]:
+        try:
+            return True, await agen.asend(None)
+        except StopAsyncIteration:
+            return False, None
+
+    try:
+        while True:
+            has_item, item = sync(next_item())
+            if not has_item:
+                return
+            yield item  # type: ignore
+    finally:
+        sync(agen.aclose())
+
 
 def get_users_oldest_first(
     tenant_id: str,
@@ -72,6 +105,71 @@ def get_users_newest_first(
     )
 
 
+def iterate_users(
+    tenant_id: str,
+    time_joined_order: Literal["ASC", "DESC"] = "ASC",
+    page_size: Optional[int] = None,
+    prefetch_pages: int = 1,
+    include_recipe_ids: Union[None, List[str]] = None,
+    query: Union[None, Dict[str, str]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> Generator[User, None, None]:
+    from supertokens_python.asyncio import (
+        DEFAULT_ITERATE_USERS_PAGE_SIZE,
+        iterate_users,
+    )
+
+    # The next page is only prefetched while the event loop runs, that is,
+    # while the caller is waiting for the next user
+    return _iterate_sync(
+        iterate_users(
+            tenant_id,
+            time_joined_order,
+            DEFAULT_ITERATE_USERS_PAGE_SIZE if page_size is None else page_size,
+            prefetch_pages,
+            include_recipe_ids,
+            query,
+            user_context,
+        )
+    )
+
+
+def iterate_users_with_enrichment(
+    tenant_id: str,
+    enrich: Callable[[User, Dict[str, Any]], Awaitable[_T]],
+    enrich_concurrency: Optional[int] = None,
+    time_joined_order: Literal["ASC", "DESC"] = "ASC",
+    page_size: Optional[int] = None,
+    prefetch_pages: int = 1,
+    include_recipe_ids: Union[None, List[str]] = None,
+    query: Union[None, Dict[str, str]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> Generator[Tuple[User, _T], None, None]:
+    from supertokens_python.asyncio import (
+        DEFAULT_ENRICH_USERS_CONCURRENCY,
+        DEFAULT_ITERATE_USERS_PAGE_SIZE,
+        iterate_users_with_enrichment,
+    )
+
+    return _iterate_sync(
+        iterate_users_with_enrichment(
+            tenant_id,
+            enrich,
+            (
+                DEFAULT_ENRICH_USERS_CONCURRENCY
+                if enrich_concurrency is None
+                else enrich_concurrency
+            ),
+            time_joined_order,
+            DEFAULT_ITERATE_USERS_PAGE_SIZE if page_size is None else page_size,
+            prefetch_pages,
+            include_recipe_ids,
+            query,
+            user_context,
+        )
+    )
+
+
 def get_user_count(
     include_recipe_ids: Union[None, List[str]] = None,
     tenant_id: Optional[str] = None,
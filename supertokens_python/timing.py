@@ -0,0 +1,181 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Timing of the stages of request handling, to find out where a slow request
+spent its time.
+
+Timing is off until a hook is added with `add_timing_hook`. Once it is on,
+every finished stage is passed to the hooks as a `TimingSpan`, and is recorded
+in the user_context of the request (see `get_timing_spans`). The stages are:
+
+- `access_token_verification`: verifying the access token with the JWKS
+- `jwks_refresh`: fetching the JWKS from the core (not tied to a user_context)
+- `claim_validation`: `validate_claims`, including any claim refetches
+- `claim_refetch`: fetching the value of a single claim (`claim` attribute)
+- `core_request`: a request to the core, including retries (`path` and
+  `method` attributes)
+- `response_mutators`: setting the session cookies and headers on the response
+- `middleware`: handling a request in `Supertokens.middleware`
+- `email_delivery` and `sms_delivery`: sending an email or SMS
+- `third_party_request`: a request to a third party provider
+
+Span wrappers (see `add_span_wrapper`) run around each stage while it is in
+progress, which integrations such as `supertokens_python.instrumentation` use
+to start their own spans.
+"""
+
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from logging import Logger
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+from supertokens_python.logger import _logger, log_debug_message
+
+
+class TimingSpan:
+    def __init__(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        # start and end are time.monotonic() values, in seconds
+        self.name = name
+        self.start = start
+        self.end = end
+        self.attributes = attributes if attributes is not None else {}
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000
+
+    def __repr__(self) -> str:
+        return f"TimingSpan({self.name}, {self.duration_ms:.2f}ms, {self.attributes})"
+
+
+TimingHook = Callable[[TimingSpan, Optional[Dict[str, Any]]], None]
+
+# Called with the name and attributes of a stage when it starts. The attributes
+# can still change until the returned context manager exits.
+SpanWrapper = Callable[[str, Dict[str, Any]], ContextManager[Any]]
+
+_hooks: List[TimingHook] = []
+_span_wrappers: List[SpanWrapper] = []
+_current_attributes: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "supertokens_timing_attributes", default=None
+)
+
+
+def add_timing_hook(hook: TimingHook):
+    """
+    `hook` is called with each finished span and the user_context of the
+    request it belongs to (None if it isn't tied to one). It must not block.
+    """
+    _hooks.append(hook)
+
+
+def remove_timing_hook(hook: TimingHook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def add_span_wrapper(wrapper: SpanWrapper):
+    _span_wrappers.append(wrapper)
+
+
+def remove_span_wrapper(wrapper: SpanWrapper):
+    if wrapper in _span_wrappers:
+        _span_wrappers.remove(wrapper)
+
+
+def set_span_attributes(**attributes: Any):
+    """
+    Adds attributes to the innermost stage in progress, if timing is on.
+    """
+    current = _current_attributes.get()
+    if current is not None:
+        current.update(attributes)
+
+
+def get_timing_spans(user_context: Dict[str, Any]) -> List[TimingSpan]:
+    default = user_context.get("_default")
+    if not isinstance(default, dict):
+        return []
+    return default.get("timing_spans", [])  # type: ignore
+
+
+@contextmanager
+def timing_span(
+    name: str,
+    user_context: Optional[Dict[str, Any]],
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Iterator[None]:
+    if len(_hooks) == 0 and len(_span_wrappers) == 0:
+        yield
+        return
+
+    attributes = dict(attributes) if attributes is not None else {}
+    token = _current_attributes.set(attributes)
+    start = time.monotonic()
+    try:
+        with ExitStack() as stack:
+            for wrapper in list(_span_wrappers):
+                stack.enter_context(wrapper(name, attributes))
+            yield
+    finally:
+        end = time.monotonic()
+        _current_attributes.reset(token)
+        if len(_hooks) > 0:
+            _record(TimingSpan(name, start, end, attributes), user_context)
+
+
+def _record(span: TimingSpan, user_context: Optional[Dict[str, Any]]):
+    if user_context is not None:
+        if "_default" not in user_context:
+            user_context["_default"] = {}
+        if isinstance(user_context["_default"], dict):
+            user_context["_default"].setdefault("timing_spans", []).append(span)
+
+    for hook in list(_hooks):
+        try:
+            hook(span, user_context)
+        except Exception as e:
+            # Timing must never break request handling
+            log_debug_message("Timing hook failed: %s", str(e))
+
+
+class SlowRequestLogger:
+    """
+    A timing hook that logs a warning when a stage takes longer than
+    `threshold_ms`, along with the stages recorded so far for the same
+    request. Use it with `add_timing_hook(SlowRequestLogger(500))`.
+    """
+
+    def __init__(self, threshold_ms: float, logger: Optional[Logger] = None):
+        self.threshold_ms = threshold_ms
+        self.logger = logger if logger is not None else _logger
+
+    def __call__(self, span: TimingSpan, user_context: Optional[Dict[str, Any]]):
+        if span.duration_ms < self.threshold_ms:
+            return
+
+        spans = get_timing_spans(user_context) if user_context is not None else []
+        breakdown = ", ".join(
+            f"{s.name}={s.duration_ms:.1f}ms" for s in (spans or [span])
+        )
+        self.logger.warning(
+            "Slow %s (%.1fms): %s", span.name, span.duration_ms, breakdown
+        )
@@ -14,8 +14,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any, Awaitable, Dict, List, TypeVar, Union, Optional, TYPE_CHECKING
-from phonenumbers import format_number, parse  # type: ignore
-import phonenumbers  # type: ignore
 from typing_extensions import Literal
 
 _T = TypeVar("_T")
@@ -25,6 +23,8 @@ if TYPE_CHECKING:
 
 
 class RecipeUserId:
+    __slots__ = ("recipe_user_id",)
+
     def __init__(self, recipe_user_id: str):
         self.recipe_user_id = recipe_user_id
 
@@ -38,6 +38,8 @@ class RecipeUserId:
 
 
 class AccountInfo:
+    __slots__ = ("email", "phone_number", "third_party")
+
     def __init__(
         self,
         email: Optional[str] = None,
@@ -63,6 +65,8 @@ class AccountInfo:
 
 
 class LoginMethod(AccountInfo):
+    __slots__ = ("recipe_id", "recipe_user_id", "tenant_ids", "time_joined", "verified")
+
     def __init__(
         self,
         recipe_id: Literal["emailpassword", "thirdparty", "passwordless"],
@@ -109,10 +113,16 @@ class LoginMethod(AccountInfo):
         if phone_number is None:
             return False
 
+        from phonenumbers import (  # type: ignore
+            PhoneNumberFormat,
+            format_number,
+            parse,
+        )
+
         cleaned_phone = phone_number.strip()
         try:
             cleaned_phone = format_number(
-                parse(phone_number, None), phonenumbers.PhoneNumberFormat.E164
+                parse(phone_number, None), PhoneNumberFormat.E164
             )
         except Exception:
             pass  # here we just use the stripped version
@@ -150,24 +160,17 @@ class LoginMethod(AccountInfo):
     def from_json(json: Dict[str, Any]) -> "LoginMethod":
         from supertokens_python.recipe.thirdparty.types import ThirdPartyInfo as TPI
 
+        third_party = json.get("thirdParty")
         return LoginMethod(
             recipe_id=json["recipeId"],
             recipe_user_id=json["recipeUserId"],
             tenant_ids=json["tenantIds"],
-            email=(
-                json["email"] if "email" in json and json["email"] is not None else None
-            ),
-            phone_number=(
-                json["phoneNumber"]
-                if "phoneNumber" in json and json["phoneNumber"] is not None
-                else None
-            ),
+            email=json.get("email"),
+            phone_number=json.get("phoneNumber"),
             third_party=(
-                (
-                    TPI(json["thirdParty"]["userId"], json["thirdParty"]["id"])
-                    if "thirdParty" in json and json["thirdParty"] is not None
-                    else None
-                )
+                TPI(third_party["userId"], third_party["id"])
+                if third_party is not None
+                else None
             ),
             time_joined=json["timeJoined"],
             verified=json["verified"],
@@ -175,6 +178,19 @@ class LoginMethod(AccountInfo):
 
 
 class User:
+    # Users are materialised in large numbers when paginating, so they (and
+    # their login methods) don't carry a per-instance __dict__
+    __slots__ = (
+        "id",
+        "is_primary_user",
+        "tenant_ids",
+        "emails",
+        "phone_numbers",
+        "third_party",
+        "login_methods",
+        "time_joined",
+    )
+
     def __init__(
         self,
         user_id: str,
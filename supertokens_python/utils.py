@@ -35,7 +35,6 @@ from typing import (
 from urllib.parse import urlparse
 
 from httpx import HTTPStatusError, Response
-from tldextract import extract  # type: ignore
 
 from supertokens_python.framework.django.framework import DjangoFramework
 from supertokens_python.framework.fastapi.framework import FastapiFramework
@@ -266,6 +265,31 @@ def set_request_in_user_context_if_not_defined(
     return user_context
 
 
+def set_core_call_deadline_in_user_context(
+    user_context: Dict[str, Any], timeout_ms: int
+) -> Dict[str, Any]:
+    """
+    Core requests made with this user_context after `timeout_ms` has passed
+    fail with `DeadlineExceededError` without being sent, and the ones sent
+    before that only wait for the time that is left.
+    """
+    if "_default" not in user_context:
+        user_context["_default"] = {}
+
+    if isinstance(user_context["_default"], dict):
+        user_context["_default"]["core_call_deadline"] = get_timestamp_ms() + timeout_ms
+
+    return user_context
+
+
+def get_core_call_deadline_from_user_context(
+    user_context: Optional[Dict[str, Any]]
+) -> Optional[int]:
+    if user_context is None or not isinstance(user_context.get("_default"), dict):
+        return None
+    return user_context["_default"].get("core_call_deadline")
+
+
 def default_user_context(request: BaseRequest) -> Dict[str, Any]:
     return set_request_in_user_context_if_not_defined({}, request)
 
@@ -277,6 +301,25 @@ async def resolve(obj: MaybeAwaitable[_T]) -> _T:
     return obj  # type: ignore
 
 
+_tld_extractor: Optional[Callable[[str], Any]] = None
+
+
+def get_tld_extractor() -> Callable[[str], Any]:
+    global _tld_extractor
+    if _tld_extractor is None:
+        from tldextract import TLDExtract  # type: ignore
+
+        # Only use the public suffix list snapshot bundled with tldextract, so
+        # that we never fetch the list over the network or write it to disk.
+        _tld_extractor = TLDExtract(
+            cache_dir=None,
+            suffix_list_urls=(),
+            fallback_to_snapshot=True,
+            include_psl_private_domains=True,
+        )
+    return _tld_extractor
+
+
 def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     url_obj = urlparse(url)
     hostname = url_obj.hostname
@@ -287,7 +330,7 @@ def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     if hostname.startswith("localhost") or is_an_ip_address(hostname):
         return "localhost"
 
-    parsed_url: Any = extract(hostname, include_psl_private_domains=True)
+    parsed_url: Any = get_tld_extractor()(hostname)
     if parsed_url.domain == "":  # type: ignore
         # We need to do this because of https://github.com/supertokens/supertokens-python/issues/394
         if hostname.endswith(".amazonaws.com") and parsed_url.suffix == hostname:
@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Dict, List
+
+from pytest import mark, raises
+
+from supertokens_python.recipe.multifactorauth.recipe_implementation import (
+    RecipeImplementation,
+)
+from supertokens_python.recipe.multifactorauth.utils import memoize_async_getter
+from supertokens_python.types import User
+
+pytestmark = mark.asyncio
+
+
+async def test_memoized_getter_is_called_once():
+    calls: List[int] = []
+
+    async def getter() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    memoized = memoize_async_getter(getter)
+    assert await asyncio.gather(memoized(), memoized(), memoized()) == [1, 1, 1]
+    assert await memoized() == 1
+    assert len(calls) == 1
+
+    async def failing_getter() -> int:
+        calls.append(1)
+        raise ValueError("failed")
+
+    memoized = memoize_async_getter(failing_getter)
+    for _ in range(2):
+        with raises(ValueError):
+            await memoized()
+    assert len(calls) == 2
+
+
+async def test_default_mfa_requirements_resolve_inputs_concurrently():
+    in_flight: List[str] = []
+    max_in_flight = 0
+
+    def getter(name: str, result: List[str]):
+        async def get() -> List[str]:
+            nonlocal max_in_flight
+            in_flight.append(name)
+            max_in_flight = max(max_in_flight, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(name)
+            return result
+
+        return get
+
+    async def user() -> User:
+        raise Exception("should not be called")
+
+    user_context: Dict[str, Any] = {}
+    recipe_implementation = RecipeImplementation(None, None)  # type: ignore
+    requirements = await recipe_implementation.get_mfa_requirements_for_auth(
+        tenant_id="public",
+        access_token_payload={},
+        completed_factors={},
+        user=user,
+        factors_set_up_for_user=getter("set_up", []),
+        required_secondary_factors_for_user=getter("user", ["totp"]),
+        required_secondary_factors_for_tenant=getter("tenant", ["otp-email", "totp"]),
+        user_context=user_context,
+    )
+
+    assert len(requirements) == 1
+    assert sorted(requirements[0]["oneOf"]) == ["otp-email", "totp"]  # type: ignore
+    assert max_in_flight == 2
@@ -14,7 +14,7 @@
 from fastapi import FastAPI
 from pytest import mark, fixture
 from starlette.testclient import TestClient
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from supertokens_python import init
 from supertokens_python.asyncio import get_user
@@ -312,3 +312,53 @@ async def test_user_association_and_disassociation_with_tenants():
     user = await get_user(user_id)
     assert user is not None
     assert len(user.tenant_ids) == 1  # public only
+
+
+async def test_get_valid_first_factors_fetches_tenant_once():
+    from supertokens_python.recipe.multifactorauth.utils import (
+        get_valid_first_factors,
+    )
+    from supertokens_python.recipe.multitenancy.interfaces import RecipeInterface
+    from supertokens_python.recipe.multitenancy.utils import InputOverrideConfig
+
+    get_tenant_calls: List[str] = []
+
+    def override_functions(original_implementation: RecipeInterface):
+        original_get_tenant = original_implementation.get_tenant
+
+        async def get_tenant_(tenant_id: str, user_context: Dict[str, Any]):
+            get_tenant_calls.append(tenant_id)
+            return await original_get_tenant(tenant_id, user_context)
+
+        original_implementation.get_tenant = get_tenant_
+        return original_implementation
+
+    args = get_st_init_args(
+        [
+            session.init(),
+            emailpassword.init(),
+            multitenancy.init(
+                override=InputOverrideConfig(functions=override_functions)
+            ),
+        ]
+    )
+    init(**args)
+    start_st()
+    setup_multitenancy_feature()
+
+    await create_or_update_tenant(
+        "t1",
+        TenantConfigCreateOrUpdate(first_factors=["emailpassword", "custom-factor"]),
+    )
+    get_tenant_calls.clear()
+
+    valid_first_factors = await get_valid_first_factors(
+        "t1", ["otp-email", "custom-factor", "thirdparty", "emailpassword"], {}
+    )
+    assert valid_first_factors == ["custom-factor", "emailpassword"]
+    assert get_tenant_calls == ["t1"]
+
+    assert (
+        await get_valid_first_factors("non-existent", ["emailpassword"], {})
+        == "TENANT_NOT_FOUND_ERROR"
+    )
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+from typing import Any, List
+
+from pytest import mark
+
+from supertokens_python.ingredients.smsdelivery.types import SMSContent, TwilioSettings
+from supertokens_python.recipe.passwordless.smsdelivery.services.twilio import (
+    TwilioService,
+)
+
+pytestmark = mark.asyncio
+
+
+class SlowTwilioMessages:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.sent: List[Any] = []
+        self.threads: List[str] = []
+
+    def create(self, **kwargs: Any):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        self.sent.append(kwargs)
+
+
+class SlowTwilioClient:
+    def __init__(self, delay: float):
+        self.messages = SlowTwilioMessages(delay)
+
+
+async def test_send_raw_sms_does_not_block_event_loop():
+    service = TwilioService(
+        twilio_settings=TwilioSettings(
+            account_sid="ACTWILIO_ACCOUNT_SID",
+            auth_token="test-token",
+            from_="+919909909999",
+        )
+    )
+    twilio_client = SlowTwilioClient(delay=0.5)
+    service.service_implementation.twilio_client = twilio_client
+    messages = twilio_client.messages
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.ensure_future(ticker())
+    try:
+        await service.service_implementation.send_raw_sms(
+            SMSContent(body="123456", to_phone="+919909909998"),
+            {},
+            from_="+919909909999",
+        )
+    finally:
+        ticker_task.cancel()
+
+    assert messages.sent == [
+        {"to": "+919909909998", "body": "123456", "from_": "+919909909999"}
+    ]
+    assert messages.threads[0].startswith("supertokens-twilio")
+    # The ticker would not have run at all if the send blocked the loop
+    assert ticks >= 10
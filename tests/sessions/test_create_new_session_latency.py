@@ -0,0 +1,219 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+import respx
+from pytest import mark
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.constants import SUPPORTED_CDI_VERSIONS
+from supertokens_python.recipe import emailverification, session, userroles
+from supertokens_python.recipe.session.asyncio import (
+    create_new_session_without_request_response,
+)
+from supertokens_python.recipe.session.claim_base_classes.primitive_claim import (
+    PrimitiveClaim,
+)
+from supertokens_python.recipe.session.utils import (
+    build_access_token_payload_with_claims,
+)
+from supertokens_python.types import RecipeUserId
+from supertokens_python.utils import utf_base64encode
+from tests.utils import reset
+
+pytestmark = mark.asyncio
+
+CORE_URL = "http://localhost:3567"
+# Delay added to every stub core call, to make sequential calls show up in the
+# sign in latency
+CORE_CALL_DELAY_SEC = 0.1
+
+
+def get_user_json() -> Dict[str, Any]:
+    return {
+        "id": "user-id",
+        "isPrimaryUser": False,
+        "tenantIds": ["public"],
+        "emails": ["user@example.com"],
+        "phoneNumbers": [],
+        "thirdParty": [],
+        "loginMethods": [
+            {
+                "recipeId": "emailpassword",
+                "recipeUserId": "user-id",
+                "tenantIds": ["public"],
+                "email": "user@example.com",
+                "timeJoined": 1700000000000,
+                "verified": True,
+            }
+        ],
+        "timeJoined": 1700000000000,
+    }
+
+
+def get_access_token(payload: Dict[str, Any]) -> str:
+    # The signature is not verified when creating a session
+    header = {"alg": "RS256", "typ": "JWT", "version": "5", "kid": "d-1"}
+    return ".".join(
+        [
+            utf_base64encode(json.dumps(header), True),
+            utf_base64encode(json.dumps(payload), True),
+            "sig",
+        ]
+    )
+
+
+def get_session_json(request: httpx.Request) -> Dict[str, Any]:
+    body = httpx.Response(200, content=request.content).json()
+    token = {"token": "token", "expiry": 4102444800000, "createdTime": 1700000000000}
+    return {
+        "status": "OK",
+        "session": {
+            "handle": "session-handle",
+            "userId": body["userId"],
+            "recipeUserId": body["userId"],
+            "userDataInJWT": body["userDataInJWT"],
+            "tenantId": "public",
+        },
+        "accessToken": {**token, "token": get_access_token(body["userDataInJWT"])},
+        "refreshToken": token,
+    }
+
+
+class StubCore:
+    def __init__(self):
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls.append(path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(CORE_CALL_DELAY_SEC)
+        finally:
+            self.in_flight -= 1
+
+        if path == "/apiversion":
+            return httpx.Response(200, json={"versions": SUPPORTED_CDI_VERSIONS})
+        if path == "/user/id":
+            return httpx.Response(200, json={"status": "OK", "user": get_user_json()})
+        if path == "/public/recipe/user/roles":
+            return httpx.Response(200, json={"status": "OK", "roles": ["admin"]})
+        if path == "/recipe/role/permissions":
+            return httpx.Response(200, json={"status": "OK", "permissions": ["read"]})
+        if path == "/recipe/user/email/verify":
+            return httpx.Response(200, json={"status": "OK", "isVerified": True})
+        if path == "/public/recipe/session":
+            return httpx.Response(200, json=get_session_json(request))
+        return httpx.Response(404)
+
+
+async def test_sign_in_latency_with_claims_from_other_recipes():
+    reset()
+    init(
+        supertokens_config=SupertokensConfig(CORE_URL),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.example.com",
+            website_domain="https://example.com",
+            api_base_path="/auth",
+        ),
+        framework="fastapi",
+        recipe_list=[
+            session.init(),
+            emailverification.init(mode="REQUIRED"),
+            userroles.init(),
+        ],
+    )
+    stub_core = StubCore()
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mocker.route(url__startswith=CORE_URL).mock(side_effect=stub_core.handle)
+
+        s = await create_new_session_without_request_response(
+            "public", RecipeUserId("user-id")
+        )
+
+    payload = s.get_access_token_payload()
+    assert payload["st-role"]["v"] == ["admin"]
+    assert payload["st-perm"]["v"] == ["read"]
+    assert payload["st-ev"]["v"] is True
+
+    # Every core call is made once. The user fetched by create_new_session is
+    # reused by the email verification claim, and the user roles and permission
+    # claims share the roles request.
+    assert sorted(stub_core.calls) == sorted(
+        [
+            "/apiversion",
+            "/user/id",
+            "/public/recipe/user/roles",
+            "/recipe/role/permissions",
+            "/recipe/user/email/verify",
+            "/public/recipe/session",
+        ]
+    )
+    # The email verification and user roles claims were fetched concurrently
+    assert stub_core.max_in_flight == 2
+
+
+def slow_claim(key: str, value: Any, delay_sec: float) -> PrimitiveClaim[Any]:
+    async def fetch_value(*_: Any) -> Any:
+        await asyncio.sleep(delay_sec)
+        return value
+
+    claim = PrimitiveClaim(key, fetch_value)
+    claim.depends_on_other_claims = False
+    return claim
+
+
+async def test_independent_claims_are_built_concurrently():
+    claims = [slow_claim("a", 1, 0.2), slow_claim("b", 2, 0.2)]
+
+    start = time.perf_counter()
+    payload = await build_access_token_payload_with_claims(
+        claims, "user-id", RecipeUserId("user-id"), "public", {"custom": 0}, {}
+    )
+    duration = time.perf_counter() - start
+
+    assert {k: v["v"] for k, v in payload.items() if k != "custom"} == {
+        "a": 1,
+        "b": 2,
+    }
+    assert payload["custom"] == 0
+    # The builds overlapped
+    assert duration < 0.4
+
+
+async def test_claims_see_the_claims_built_before_them():
+    seen_payloads: List[Dict[str, Any]] = []
+
+    async def fetch_value(
+        _: str,
+        __: RecipeUserId,
+        ___: str,
+        current_payload: Dict[str, Any],
+        ____: Dict[str, Any],
+    ) -> int:
+        seen_payloads.append(dict(current_payload))
+        return current_payload["a"]["v"] + 1
+
+    claims = [
+        slow_claim("a", 1, 0.01),
+        PrimitiveClaim("depends-on-a", fetch_value),
+        slow_claim("b", 2, 0.01),
+    ]
+    payload = await build_access_token_payload_with_claims(
+        claims, "user-id", RecipeUserId("user-id"), "public", {}, {}
+    )
+
+    assert list(seen_payloads[0].keys()) == ["a"]
+    assert {k: v["v"] for k, v in payload.items()} == {
+        "a": 1,
+        "depends-on-a": 2,
+        "b": 2,
+    }
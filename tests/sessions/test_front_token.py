@@ -0,0 +1,97 @@
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from pytest import mark
+
+from supertokens_python.recipe.session import interfaces
+from supertokens_python.recipe.session.interfaces import (
+    AccessTokenObj,
+    RegenerateAccessTokenOkResult,
+    ReqResInfo,
+)
+from supertokens_python.recipe.session.session_class import Session
+from supertokens_python.types import RecipeUserId
+from tests.utils import AsyncMock, MagicMock
+
+pytestmark = mark.asyncio
+
+
+def get_session(payload: Dict[str, Any]) -> Session:
+    recipe_implementation_mock = AsyncMock()
+    session = Session(
+        recipe_implementation_mock,
+        MagicMock(),
+        "test_access_token",
+        None,  # front token
+        None,  # refresh token
+        None,  # anti csrf token
+        "test_session_handle",
+        "test_user_id",
+        RecipeUserId("test_user_id"),
+        payload,
+        ReqResInfo(MagicMock(), "header"),
+        False,  # access_token_updated
+        "public",
+        access_token_expiry=1000,
+    )
+    return session
+
+
+def mock_regenerated_access_token(
+    session: Session, payload: Dict[str, Any], expiry: int
+):
+    session.recipe_implementation.regenerate_access_token.return_value = (  # type: ignore
+        RegenerateAccessTokenOkResult(
+            MagicMock(), AccessTokenObj("new_access_token", expiry, 0)
+        )
+    )
+    parsed_token = MagicMock()
+    parsed_token.version = 3
+    parsed_token.payload = payload
+    return patch(
+        "supertokens_python.recipe.session.session_class.parse_jwt_without_signature_verification",
+        return_value=parsed_token,
+    )
+
+
+async def test_front_token_is_built_once_per_payload_and_expiry():
+    built: List[Dict[str, Any]] = []
+    original_build_front_token = interfaces.build_front_token
+
+    def build_front_token(user_id: str, at_expiry: int, payload: Any) -> str:
+        built.append(payload)
+        return original_build_front_token(user_id, at_expiry, payload)
+
+    with patch.object(interfaces, "build_front_token", build_front_token):
+        session = get_session({"a": 1})
+        assert not built
+
+        front_token = session.front_token
+        assert session.front_token == front_token
+        assert front_token == original_build_front_token("test_user_id", 1000, {"a": 1})
+        assert len(built) == 1
+
+        # Same payload and expiry in the new access token
+        with mock_regenerated_access_token(session, {"a": 1}, 1000):
+            await session.merge_into_access_token_payload({})
+        assert session.front_token == front_token
+        assert len(built) == 1
+
+        with mock_regenerated_access_token(session, {"a": 2}, 1000):
+            await session.merge_into_access_token_payload({"a": 2})
+        assert session.front_token == original_build_front_token(
+            "test_user_id", 1000, {"a": 2}
+        )
+        assert len(built) == 2
+
+
+async def test_only_latest_access_token_is_set_in_response():
+    session = get_session({"a": 1})
+
+    for i in range(3):
+        with mock_regenerated_access_token(session, {"a": i}, 1000 + i):
+            await session.merge_into_access_token_payload({"a": i})
+
+    assert len(session.response_mutators) == 1
+    assert session.access_token == "new_access_token"
+    assert session.access_token_expiry == 1002
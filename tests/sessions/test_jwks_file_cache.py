@@ -0,0 +1,123 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from pytest import fixture
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import SessionRecipe
+from supertokens_python.recipe.session.jwks import (
+    JWKSFileCache,
+    get_latest_keys,
+    reset_jwks_cache,
+)
+from tests.utils import reset
+
+
+def generate_jwk(kid: str) -> Dict[str, Any]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk: Dict[str, Any] = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return jwk
+
+
+@fixture(scope="module")
+def jwks() -> Dict[str, Any]:
+    return {"keys": [generate_jwk("d-1"), generate_jwk("d-2")]}
+
+
+@fixture(autouse=True)
+def init_session(tmp_path: Path):
+    reset()
+    reset_jwks_cache()
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.example.com",
+            website_domain="https://example.com",
+            api_base_path="/auth",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init(jwks_cache_dir=str(tmp_path))],
+    )
+    yield
+    reset_jwks_cache()
+
+
+def mock_core_jwks(jwks_responses: List[Dict[str, Any]]) -> MagicMock:
+    def get(*_: Any, **__: Any):
+        response = MagicMock()
+        response.json.return_value = jwks_responses[0]
+        response.__enter__.return_value = response
+        return response
+
+    return MagicMock(side_effect=get)
+
+
+def test_other_workers_read_keys_from_the_cache_file(jwks: Dict[str, Any]):
+    config = SessionRecipe.get_instance().config
+    requests_get = mock_core_jwks([jwks])
+
+    with patch("supertokens_python.recipe.session.jwks.requests.get", requests_get):
+        assert [k.key_id for k in get_latest_keys(config, "d-1")] == ["d-1"]
+        assert requests_get.call_count == 1
+
+        # A new worker starts with an empty in-memory cache
+        reset_jwks_cache()
+        assert [k.key_id for k in get_latest_keys(config, "d-2")] == ["d-2"]
+        assert requests_get.call_count == 1
+
+
+def test_unknown_kid_or_stale_file_refreshes_from_core(jwks: Dict[str, Any]):
+    config = SessionRecipe.get_instance().config
+    rotated_jwks = {"keys": [generate_jwk("d-3")]}
+    responses = [jwks]
+    requests_get = mock_core_jwks(responses)
+
+    with patch("supertokens_python.recipe.session.jwks.requests.get", requests_get):
+        get_latest_keys(config, "d-1")
+        assert requests_get.call_count == 1
+
+        reset_jwks_cache()
+        responses[0] = rotated_jwks
+        assert [k.key_id for k in get_latest_keys(config, "d-3")] == ["d-3"]
+        assert requests_get.call_count == 2
+
+        # Make the file stale
+        assert config.jwks_cache_dir is not None
+        file_cache = JWKSFileCache(
+            config.jwks_cache_dir, [requests_get.call_args[0][0]]
+        )
+        with open(file_cache.path) as f:
+            content = json.load(f)
+        content["fetchedAt"] -= config.jwks_refresh_interval_sec * 1000
+        with open(file_cache.path, "w") as f:
+            json.dump(content, f)
+
+        reset_jwks_cache()
+        get_latest_keys(config, "d-3")
+        assert requests_get.call_count == 3
+        assert [
+            f for f in os.listdir(config.jwks_cache_dir) if f.endswith(".tmp")
+        ] == []
+
+
+def test_unwritable_cache_dir_falls_back_to_the_in_memory_cache(
+    jwks: Dict[str, Any], tmp_path: Path
+):
+    config = SessionRecipe.get_instance().config
+    # A directory can't be created under a regular file, even by root
+    (tmp_path / "not-a-dir").write_text("")
+    config.jwks_cache_dir = str(tmp_path / "not-a-dir" / "jwks")
+    requests_get = mock_core_jwks([jwks])
+
+    with patch("supertokens_python.recipe.session.jwks.requests.get", requests_get):
+        assert [k.key_id for k in get_latest_keys(config, "d-1")] == ["d-1"]
+        assert [k.key_id for k in get_latest_keys(config, "d-2")] == ["d-2"]
+        assert requests_get.call_count == 1
@@ -0,0 +1,82 @@
+from typing import Any, Dict, List
+
+from fastapi import Response
+
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.recipe.session.cookie_and_header import (
+    apply_response_mutators,
+    remove_header,
+    set_header,
+)
+from supertokens_python.recipe.session.interfaces import ResponseMutator
+from supertokens_python.utils import get_timestamp_ms
+
+
+def header_mutator(key: str, value: str, allow_duplicate: bool = False):
+    def mutator(response: Any, _: Dict[str, Any]):
+        set_header(response, key, value, allow_duplicate)
+
+    return mutator
+
+
+def cookie_mutator(key: str, value: str, domain: Any = None):
+    def mutator(response: Any, _: Dict[str, Any]):
+        response.set_cookie(
+            key, value, get_timestamp_ms() + 60_000, path="/", domain=domain
+        )
+
+    return mutator
+
+
+def remove_header_mutator(key: str):
+    def mutator(response: Any, _: Dict[str, Any]):
+        remove_header(response, key)
+
+    return mutator
+
+
+def test_response_mutators_are_coalesced():
+    fastapi_response = Response()
+    fastapi_response.headers["x-existing"] = "1"
+    fastapi_response.headers["anti-csrf"] = "old"
+    response = FastApiResponse(fastapi_response)
+    framework_responses: List[Any] = []
+
+    def framework_response_mutator(response: Any, _: Dict[str, Any]):
+        framework_responses.append(response.response)
+
+    mutators: List[ResponseMutator] = [
+        framework_response_mutator,
+        header_mutator("st-access-token", "token-1"),
+        header_mutator("Access-Control-Expose-Headers", "st-access-token", True),
+        header_mutator("front-token", "front-1"),
+        header_mutator("Access-Control-Expose-Headers", "front-token", True),
+        cookie_mutator("sAccessToken", "token-1"),
+        cookie_mutator("sAccessToken", "old", domain=".example.com"),
+        remove_header_mutator("anti-csrf"),
+        header_mutator("st-access-token", "token-2"),
+        header_mutator("Access-Control-Expose-Headers", "st-access-token", True),
+        header_mutator("FRONT-TOKEN", "front-2"),
+        header_mutator("Access-Control-Expose-Headers", "front-token", True),
+        cookie_mutator("sAccessToken", "token-2"),
+    ]
+    apply_response_mutators(response, mutators, {})
+
+    headers = fastapi_response.raw_headers
+    assert [k for k, _ in headers].count(b"st-access-token") == 1
+    assert fastapi_response.headers["st-access-token"] == "token-2"
+    assert fastapi_response.headers["front-token"] == "front-2"
+    # Values are appended as before, even when already there
+    assert (
+        fastapi_response.headers["access-control-expose-headers"]
+        == "st-access-token,front-token,st-access-token,front-token"
+    )
+    assert fastapi_response.headers["x-existing"] == "1"
+    assert framework_responses == [fastapi_response]
+    assert "anti-csrf" not in fastapi_response.headers
+
+    cookies = fastapi_response.headers.getlist("set-cookie")
+    assert len(cookies) == 2
+    assert cookies[0].startswith("sAccessToken=old;")
+    assert "Domain=.example.com" in cookies[0]
+    assert cookies[1].startswith("sAccessToken=token-2;")
@@ -0,0 +1,255 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import Response
+import jwt
+from jwt import PyJWK
+from jwt.algorithms import RSAAlgorithm
+from pytest import fixture
+from starlette.requests import Request
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import SessionRecipe
+from supertokens_python.recipe.session.cookie_and_header import (
+    apply_response_mutators,
+)
+from supertokens_python.recipe.session.session_request_functions import (
+    get_session_from_request_without_core,
+)
+from supertokens_python.timing import (
+    TimingSpan,
+    add_timing_hook,
+    get_timing_spans,
+    remove_timing_hook,
+)
+from tests.utils import reset
+
+KID = "d-1234"
+
+
+@fixture(scope="module")
+def signing_key() -> Tuple[Any, PyJWK]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_jwk: Dict[str, Any] = json.loads(
+        RSAAlgorithm.to_jwk(private_key.public_key())
+    )
+    public_jwk.update({"kid": KID, "alg": "RS256", "use": "sig"})
+    return private_key, PyJWK(public_jwk)
+
+
+@fixture(autouse=True)
+def patch_latest_keys(signing_key: Tuple[Any, PyJWK]):
+    with patch(
+        "supertokens_python.recipe.session.access_token.get_latest_keys",
+        return_value=[signing_key[1]],
+    ):
+        yield
+
+
+def init_session(**kwargs: Any):
+    reset()
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.example.com",
+            website_domain="https://example.com",
+            api_base_path="/auth",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init(**kwargs)],
+    )
+
+
+def create_access_token(private_key: Any, expiry_in_seconds: int = 3600) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": "user-id",
+        "rsub": "user-id",
+        "exp": now + expiry_in_seconds,
+        "iat": now,
+        "sessionHandle": "session-handle",
+        "refreshTokenHash1": "hash",
+        "parentRefreshTokenHash1": None,
+        "antiCsrfToken": None,
+        "tId": "public",
+        "custom": "value",
+    }
+    return jwt.encode(
+        payload,
+        private_key,
+        algorithm="RS256",
+        headers={"typ": "JWT", "version": "5", "kid": KID},
+    )
+
+
+def get_request(access_token: str, path: str = "/api/user") -> FastApiRequest:
+    headers: List[Tuple[bytes, bytes]] = [
+        (b"authorization", f"Bearer {access_token}".encode())
+    ]
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+    }
+    return FastApiRequest(Request(scope))
+
+
+def test_valid_access_token_is_verified_without_core(signing_key: Tuple[Any, PyJWK]):
+    init_session()
+    request = get_request(create_access_token(signing_key[0]))
+
+    s = get_session_from_request_without_core(
+        request, SessionRecipe.get_instance(), None, {}
+    )
+
+    assert s is not None
+    assert s.get_user_id() == "user-id"
+    assert s.get_handle() == "session-handle"
+    assert s.get_tenant_id() == "public"
+    assert s.get_access_token_payload()["custom"] == "value"
+    assert s.access_token_updated is False
+    assert not s.response_mutators
+    assert request.get_session() is s
+
+    # Same result as the full verification, which doesn't call the core either
+    # for this token
+    full_request = get_request(s.get_access_token())
+    full = asyncio.run(
+        SessionRecipe.get_instance().verify_session(
+            full_request, None, True, False, None, {}
+        )
+    )
+    assert full is not None
+    assert full.get_access_token_payload() == s.get_access_token_payload()
+    assert full.front_token == s.front_token
+    assert full.req_res_info is not None and s.req_res_info is not None
+    assert full.req_res_info.transfer_method == s.req_res_info.transfer_method
+
+
+def test_falls_back_when_token_cannot_be_verified_without_core(
+    signing_key: Tuple[Any, PyJWK]
+):
+    init_session()
+    recipe = SessionRecipe.get_instance()
+
+    expired_token = create_access_token(signing_key[0], expiry_in_seconds=-10)
+    assert (
+        get_session_from_request_without_core(
+            get_request(expired_token), recipe, None, {}
+        )
+        is None
+    )
+    assert (
+        get_session_from_request_without_core(
+            get_request("not-a-jwt"), recipe, None, {}
+        )
+        is None
+    )
+
+
+def test_falls_back_when_verification_is_overridden(signing_key: Tuple[Any, PyJWK]):
+    def override_functions(original_implementation: Any):
+        original_implementation.get_session = original_implementation.get_session
+        return original_implementation
+
+    init_session(override=session.InputOverrideConfig(functions=override_functions))
+    request = get_request(create_access_token(signing_key[0]))
+
+    assert (
+        get_session_from_request_without_core(
+            request, SessionRecipe.get_instance(), None, {}
+        )
+        is None
+    )
+
+
+def test_refresh_hint_is_set_close_to_expiry(signing_key: Tuple[Any, PyJWK]):
+    init_session(refresh_hint_window_sec=60)
+    recipe = SessionRecipe.get_instance()
+
+    s = get_session_from_request_without_core(
+        get_request(create_access_token(signing_key[0])), recipe, None, {}
+    )
+    assert s is not None
+    assert not s.response_mutators
+
+    near_expiry_token = create_access_token(signing_key[0], expiry_in_seconds=30)
+    for s in [
+        get_session_from_request_without_core(
+            get_request(near_expiry_token), recipe, None, {}
+        ),
+        asyncio.run(
+            recipe.verify_session(
+                get_request(near_expiry_token), None, True, False, None, {}
+            )
+        ),
+    ]:
+        assert s is not None
+        response = Response()
+        apply_response_mutators(FastApiResponse(response), s.response_mutators, {})
+        assert 25 <= int(response.headers["st-refresh-hint"]) <= 30
+        assert response.headers["access-control-expose-headers"] == "st-refresh-hint"
+
+
+def test_middleware_path_check():
+    init_session()
+    st = Supertokens.get_instance()
+
+    assert st.can_handle_request_path(get_request("", "/auth/session/refresh"))
+    assert st.can_handle_request_path(get_request("", "/AUTH/signout/"))
+    assert not st.can_handle_request_path(get_request("", "/api/user"))
+
+
+def test_session_verification_stages_are_timed(signing_key: Tuple[Any, PyJWK]):
+    init_session(refresh_hint_window_sec=60)
+    recipe = SessionRecipe.get_instance()
+    spans: List[TimingSpan] = []
+
+    def hook(span: TimingSpan, _: Optional[Dict[str, Any]]):
+        spans.append(span)
+
+    # Nothing is recorded without a hook
+    user_context: Dict[str, Any] = {}
+    get_session_from_request_without_core(
+        get_request(create_access_token(signing_key[0])), recipe, None, user_context
+    )
+    assert get_timing_spans(user_context) == []
+
+    add_timing_hook(hook)
+    try:
+        user_context = {}
+        s = asyncio.run(
+            recipe.verify_session(
+                get_request(create_access_token(signing_key[0], 30)),
+                None,
+                True,
+                False,
+                None,
+                user_context,
+            )
+        )
+        assert s is not None
+        apply_response_mutators(
+            FastApiResponse(Response()), s.response_mutators, user_context
+        )
+    finally:
+        remove_timing_hook(hook)
+
+    assert [span.name for span in get_timing_spans(user_context)] == [
+        "access_token_verification",
+        "claim_validation",
+        "response_mutators",
+    ]
+    assert spans == get_timing_spans(user_context)
+    assert all(span.end >= span.start for span in spans)
@@ -1,6 +1,12 @@
-from pytest import mark
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from pytest import MonkeyPatch, mark
 
 from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python import supertokens as supertokens_module
+from supertokens_python.framework import BaseRequest
 from supertokens_python.recipe import session
 from supertokens_python.recipe.session import SessionRecipe
 from tests.utils import reset
@@ -51,3 +57,89 @@ def test_same_site_cookie_values(
 
     s = SessionRecipe.get_instance()
     assert s.config.get_cookie_same_site(None, {}) == cookie_same_site
+
+
+def test_same_site_cookie_value_is_resolved_per_origin():
+    reset()
+
+    origins = ["https://bar.com", "https://api.foo.com", "http://app.foo.com"]
+    calls: List[str] = []
+
+    def get_origin(_: Optional[BaseRequest], user_context: Dict[str, Any]) -> str:
+        return user_context["origin"]
+
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.foo.com",
+            origin=get_origin,
+            api_base_path="/auth",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init()],
+    )
+
+    s = SessionRecipe.get_instance()
+    original_get_top_level_domain = (
+        supertokens_module.get_top_level_domain_for_same_site_resolution
+    )
+
+    def get_top_level_domain(url: str) -> str:
+        calls.append(url)
+        return original_get_top_level_domain(url)
+
+    supertokens_module.get_top_level_domain_for_same_site_resolution = (
+        get_top_level_domain
+    )
+    try:
+        for _ in range(3):
+            assert [
+                s.config.get_cookie_same_site(None, {"origin": origin})
+                for origin in origins
+            ] == ["none", "lax", "none"]
+    finally:
+        supertokens_module.get_top_level_domain_for_same_site_resolution = (
+            original_get_top_level_domain
+        )
+
+    # The public suffix lookup is done once per origin
+    assert calls == origins
+
+
+def test_origin_info_cache_is_safe_to_use_from_many_threads(
+    monkeypatch: MonkeyPatch,
+):
+    reset()
+
+    def get_origin(_: Optional[BaseRequest], user_context: Dict[str, Any]) -> str:
+        return user_context["origin"]
+
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.foo.com",
+            origin=get_origin,
+            api_base_path="/auth",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init()],
+    )
+    # Evictions happen all the time with a small cache
+    monkeypatch.setattr(supertokens_module, "ORIGIN_INFO_CACHE_MAX_SIZE", 4)
+    app_info = supertokens_module.Supertokens.get_instance().app_info
+
+    def resolve(i: int) -> str:
+        return app_info.get_origin_info(
+            None, {"origin": f"https://app{i % 16}.foo.com"}
+        ).top_level_domain
+
+    # Switch threads as often as possible to make races likely
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert set(executor.map(resolve, range(5000))) == {"foo.com"}
+    finally:
+        sys.setswitchinterval(switch_interval)
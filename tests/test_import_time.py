@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+
+from pytest import mark
+
+HEAVY_OPTIONAL_MODULES = [
+    "phonenumbers",
+    "twilio",
+    "tldextract",
+    "aiosmtplib",
+    "pkce",
+    "pyotp",
+]
+
+IMPORT_RECIPES = """
+import json, sys, time
+start = time.perf_counter()
+import supertokens_python
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    passwordless,
+    session,
+    thirdparty,
+    totp,
+)
+duration_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"duration_ms": duration_ms, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_recipes_in_subprocess():
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_RECIPES])
+    return json.loads(output)
+
+
+def test_heavy_optional_dependencies_are_imported_lazily():
+    result = import_recipes_in_subprocess()
+
+    loaded = [
+        module
+        for module in result["modules"]
+        if module.split(".")[0] in HEAVY_OPTIONAL_MODULES
+    ]
+    assert loaded == []
+
+
+@mark.skipif(
+    os.environ.get("SUPERTOKENS_IMPORT_TIME_BUDGET_MS") is None,
+    reason="set SUPERTOKENS_IMPORT_TIME_BUDGET_MS to check the import time budget",
+)
+def test_import_time_is_within_budget():
+    budget_ms = float(os.environ["SUPERTOKENS_IMPORT_TIME_BUDGET_MS"])
+
+    # Take the best of a few runs to reduce noise from the machine
+    duration_ms = min(import_recipes_in_subprocess()["duration_ms"] for _ in range(3))
+    assert duration_ms < budget_ms
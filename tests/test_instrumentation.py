@@ -0,0 +1,141 @@
+import sys
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import respx
+from fastapi import Response
+from pytest import MonkeyPatch, fixture, importorskip, mark
+from starlette.requests import Request
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.constants import SUPPORTED_CDI_VERSIONS
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.instrumentation import instrument, uninstrument
+from supertokens_python.querier import NormalisedURLPath, Querier
+from supertokens_python.recipe import session
+from tests.utils import reset
+
+pytestmark = mark.asyncio
+
+HOST = "http://localhost:3567"
+
+
+@fixture(autouse=True)
+def setup():
+    reset()
+    init(
+        supertokens_config=SupertokensConfig(HOST),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.example.com",
+            website_domain="https://example.com",
+            api_base_path="/auth",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init()],
+    )
+    Querier.api_version = SUPPORTED_CDI_VERSIONS[-1]
+    yield
+    uninstrument()
+
+
+@fixture
+def otel() -> Tuple[Any, Any]:
+    importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    metric_reader = InMemoryMetricReader()
+    assert instrument(tracer_provider, MeterProvider(metric_readers=[metric_reader]))
+    return exporter, metric_reader
+
+
+def get_metric_points(metric_reader: Any, name: str) -> List[Any]:
+    metrics_data = metric_reader.get_metrics_data()
+    return [
+        point
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+        if metric.name == name
+        for point in metric.data.data_points
+    ]
+
+
+async def test_core_requests_are_traced(otel: Tuple[Any, Any]):
+    exporter, metric_reader = otel
+    q = Querier.get_instance()
+    user_context: Dict[str, Any] = {}
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST).mock(
+            return_value=httpx.Response(200, json={"status": "OK"})
+        )
+        await q.send_get_request(NormalisedURLPath("/recipe/user"), None, user_context)
+        await q.send_get_request(NormalisedURLPath("/recipe/user"), None, user_context)
+        await q.send_post_request(NormalisedURLPath("/recipe/user"), {}, user_context)
+
+    spans = exporter.get_finished_spans()
+    assert [s.name for s in spans] == ["supertokens.core_request"] * 3
+    assert dict(spans[0].attributes) == {
+        "supertokens.path": "/recipe/user",
+        "supertokens.method": "GET",
+        "supertokens.cache_hit": False,
+        "supertokens.host": HOST,
+        "supertokens.status": 200,
+        "supertokens.retries": 0,
+    }
+    assert spans[1].attributes["supertokens.cache_hit"] is True
+    assert spans[2].attributes["supertokens.method"] == "POST"
+
+    cache_lookups = {
+        p.attributes["supertokens.cache.hit"]: p.value
+        for p in get_metric_points(metric_reader, "supertokens.cache.lookups")
+    }
+    assert cache_lookups == {True: 1, False: 1}
+    durations = get_metric_points(metric_reader, "supertokens.stage.duration")
+    assert sum(p.count for p in durations) == 3
+
+
+async def test_middleware_is_traced(otel: Tuple[Any, Any]):
+    exporter, _ = otel
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/user",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+    }
+
+    result = await Supertokens.get_instance().middleware(
+        FastApiRequest(Request(scope)), FastApiResponse(Response()), {}
+    )
+
+    assert result is None
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "supertokens.middleware"
+    assert dict(span.attributes) == {
+        "supertokens.method": "get",
+        "supertokens.handled": False,
+    }
+
+    uninstrument()
+    await Supertokens.get_instance().middleware(
+        FastApiRequest(Request(scope)), FastApiResponse(Response()), {}
+    )
+    assert len(exporter.get_finished_spans()) == 1
+
+
+def test_instrument_does_nothing_without_opentelemetry(monkeypatch: MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+    assert instrument() is False
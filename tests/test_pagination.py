@@ -12,11 +12,24 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import asyncio
+from typing import Any, Dict
+
 from pytest import mark
 from supertokens_python import InputAppInfo, SupertokensConfig, init
-from supertokens_python.asyncio import get_users_newest_first, get_users_oldest_first
+from supertokens_python.asyncio import (
+    get_users_newest_first,
+    get_users_oldest_first,
+    iterate_users,
+    iterate_users_with_enrichment,
+)
 from supertokens_python.recipe import emailpassword, session
 from supertokens_python.recipe.emailpassword.asyncio import sign_up
+from supertokens_python.syncio import iterate_users as iterate_users_sync
+from supertokens_python.syncio import (
+    iterate_users_with_enrichment as iterate_users_with_enrichment_sync,
+)
+from supertokens_python.types import User
 
 from tests.utils import clean_st, reset, setup_st, start_st
 
@@ -64,3 +77,84 @@ async def test_get_users_pagination():
         "public", limit=1, pagination_token=response.next_pagination_token
     )
     assert [user.emails[0] for user in response.users] == ["dummy1@gmail.com"]
+
+
+@mark.asyncio
+async def test_iterate_users():
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.supertokens.io",
+            website_domain="supertokens.io",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init(anti_csrf="VIA_TOKEN"), emailpassword.init()],
+    )
+    start_st()
+
+    for i in range(5):
+        await sign_up("public", f"dummy{i}@gmail.com", "validpass123")
+
+    emails = [user.emails[0] async for user in iterate_users("public", page_size=2)]
+    assert emails == [f"dummy{i}@gmail.com" for i in range(5)]
+
+    emails = [
+        user.emails[0]
+        async for user in iterate_users(
+            "public", time_joined_order="DESC", page_size=2, prefetch_pages=2
+        )
+    ]
+    assert emails == [f"dummy{i}@gmail.com" for i in range(5)][::-1]
+
+    async def enrich(user: User, _: Dict[str, Any]) -> str:
+        return user.emails[0].split("@")[0]
+
+    items = [
+        (user.emails[0], name)
+        async for user, name in iterate_users_with_enrichment(
+            "public", enrich, enrich_concurrency=2, page_size=3
+        )
+    ]
+    assert items == [(f"dummy{i}@gmail.com", f"dummy{i}") for i in range(5)]
+
+
+def test_sync_iterate_users_stops_the_producer_when_closed_early():
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.supertokens.io",
+            website_domain="supertokens.io",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init(anti_csrf="VIA_TOKEN"), emailpassword.init()],
+    )
+    start_st()
+
+    loop = asyncio.get_event_loop()
+    for i in range(5):
+        loop.run_until_complete(
+            sign_up("public", f"dummy{i}@gmail.com", "validpass123")
+        )
+
+    users = iterate_users_sync("public", page_size=1, prefetch_pages=2)
+    assert next(users).emails[0] == "dummy0@gmail.com"
+    users.close()
+
+    assert all(task.done() for task in asyncio.all_tasks(loop))
+
+
+def test_sync_iterate_users_validates_like_the_async_one():
+    async def enrich(user: User, _: Dict[str, Any]) -> str:
+        return user.id
+
+    for users in [
+        iterate_users_sync("public", page_size=0),
+        iterate_users_with_enrichment_sync("public", enrich, enrich_concurrency=0),
+    ]:
+        try:
+            next(users)
+            assert False
+        except ValueError as e:
+            assert "must be at least 1" in str(e)
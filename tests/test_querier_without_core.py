@@ -0,0 +1,759 @@
+import asyncio
+import gc
+import heapq
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import respx
+from pytest import LogCaptureFixture, MonkeyPatch, fixture, mark
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init, rate_limiter
+from supertokens_python.bulkhead import (
+    Bulkhead,
+    BulkheadConfig,
+    DeadlineExceededError,
+)
+from supertokens_python.constants import SUPPORTED_CDI_VERSIONS
+from supertokens_python.hedging import HedgingConfig
+from supertokens_python.host_health import CircuitBreakerConfig
+from supertokens_python.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiterConfig,
+    RateLimitExceededError,
+)
+from supertokens_python.querier import NormalisedURLPath, Querier
+from supertokens_python.recipe import session
+from supertokens_python.timing import (
+    SlowRequestLogger,
+    add_timing_hook,
+    get_timing_spans,
+    remove_timing_hook,
+)
+from supertokens_python.utils import set_core_call_deadline_in_user_context
+from tests.utils import reset
+
+pytestmark = mark.asyncio
+
+HOST_1 = "http://localhost:3567"
+HOST_2 = "http://localhost:3568"
+
+
+def init_with_hosts(
+    supertokens_config: SupertokensConfig, negotiate_api_version: bool = False
+):
+    reset()
+    init(
+        supertokens_config=supertokens_config,
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.example.com",
+            website_domain="https://example.com",
+            api_base_path="/auth",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init()],
+    )
+    if not negotiate_api_version:
+        Querier.api_version = SUPPORTED_CDI_VERSIONS[-1]
+
+
+class StubCores:
+    def __init__(
+        self, down_hosts: List[str], delays_sec: Optional[Dict[str, float]] = None
+    ):
+        self.down_hosts = down_hosts
+        self.delays_sec = delays_sec or {}
+        self.calls: Dict[str, int] = {HOST_1: 0, HOST_2: 0}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        host = f"{request.url.scheme}://{request.url.host}:{request.url.port}"
+        self.calls[host] += 1
+        if host in self.down_hosts:
+            raise httpx.ConnectError("connection refused", request=request)
+        await asyncio.sleep(self.delays_sec.get(host, 0))
+        return httpx.Response(200, json={"status": "OK", "host": host})
+
+
+async def test_failing_host_is_skipped_until_it_recovers():
+    init_with_hosts(
+        SupertokensConfig(
+            f"{HOST_1};{HOST_2}",
+            circuit_breaker=CircuitBreakerConfig(
+                failure_threshold=2, open_duration_ms=500
+            ),
+        )
+    )
+    q = Querier.get_instance()
+    stub_cores = StubCores(down_hosts=[HOST_2])
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_cores.handle)
+        mocker.route(url__startswith=HOST_2).mock(side_effect=stub_cores.handle)
+
+        for _ in range(5):
+            res = await q.send_get_request(NormalisedURLPath("/api"), None, None)
+            assert res["status"] == "OK"
+
+        # Round robin until the circuit opens after 2 failures
+        assert stub_cores.calls == {HOST_1: 5, HOST_2: 2}
+        assert Querier.get_host_health_for_testing()[HOST_2].is_open()
+
+        # After the open duration, a single probe is sent, which fails
+        time.sleep(0.5)
+        await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        assert stub_cores.calls[HOST_2] == 3
+
+        # Once the host is back, the next probe closes the circuit
+        stub_cores.down_hosts = []
+        time.sleep(0.5)
+        for _ in range(4):
+            await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        assert not Querier.get_host_health_for_testing()[HOST_2].is_open()
+        assert stub_cores.calls[HOST_2] == 5
+
+
+async def test_open_circuit_does_not_stop_the_only_host_from_being_tried():
+    init_with_hosts(
+        SupertokensConfig(
+            HOST_1,
+            circuit_breaker=CircuitBreakerConfig(
+                failure_threshold=1, open_duration_ms=60000
+            ),
+        )
+    )
+    q = Querier.get_instance()
+    stub_cores = StubCores(down_hosts=[HOST_1])
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_cores.handle)
+
+        for _ in range(2):
+            try:
+                await q.send_get_request(NormalisedURLPath("/api"), None, None)
+                assert False
+            except Exception as e:
+                assert str(e) == "No SuperTokens core available to query"
+
+        stub_cores.down_hosts = []
+        res = await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        assert res["status"] == "OK"
+        assert stub_cores.calls[HOST_1] == 3
+
+
+async def test_failed_api_version_request_is_counted_once_by_the_circuit_breaker():
+    init_with_hosts(
+        SupertokensConfig(
+            HOST_1,
+            circuit_breaker=CircuitBreakerConfig(
+                failure_threshold=2, open_duration_ms=60000
+            ),
+        ),
+        negotiate_api_version=True,
+    )
+    q = Querier.get_instance()
+    calls = 0
+
+    async def time_out(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=time_out)
+
+        try:
+            await q.send_get_request(NormalisedURLPath("/api"), None, None)
+            assert False
+        except httpx.ReadTimeout:
+            pass
+
+    # Only the /apiversion request was sent
+    assert calls == 1
+    host_health = Querier.get_host_health_for_testing()[HOST_1]
+    assert host_health.consecutive_failures == 1
+    assert not host_health.is_open()
+
+
+class FirstAttemptSlowStubCore:
+    """
+    Answers the first attempt of each request (identified by its "n" param)
+    after `delay_sec`, and any hedged attempt right away.
+    """
+
+    def __init__(self, delay_sec: float):
+        self.delay_sec = delay_sec
+        self.hosts_by_request: Dict[str, List[str]] = {}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        host = f"{request.url.scheme}://{request.url.host}:{request.url.port}"
+        hosts = self.hosts_by_request.setdefault(request.url.params.get("n", ""), [])
+        hosts.append(host)
+        if len(hosts) == 1:
+            await asyncio.sleep(self.delay_sec)
+        return httpx.Response(200, json={"status": "OK", "host": host})
+
+
+async def test_slow_get_is_hedged_to_another_host_within_budget():
+    init_with_hosts(
+        SupertokensConfig(
+            f"{HOST_1};{HOST_2}",
+            hedging=HedgingConfig(initial_delay_ms=50, max_hedge_ratio=0.5),
+        )
+    )
+    q = Querier.get_instance()
+    stub_core = FirstAttemptSlowStubCore(delay_sec=0.5)
+
+    # A losing attempt is cancelled before respx records it, so the stub core
+    # keeps track of which hosts were tried
+    with respx.mock(assert_all_called=False) as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+        mocker.route(url__startswith=HOST_2).mock(side_effect=stub_core.handle)
+
+        async def send(n: int):
+            start = time.perf_counter()
+            res = await q.send_get_request(NormalisedURLPath("/api"), {"n": n}, None)
+            return res["host"], time.perf_counter() - start
+
+        # The first request has only earned half a hedge, so it isn't hedged
+        _, duration = await send(0)
+        assert duration >= 0.5
+        assert len(stub_core.hosts_by_request["0"]) == 1
+
+        # The second one is hedged to the other host, which answers first
+        host, duration = await send(1)
+        assert duration < 0.4
+        first_host, hedge_host = stub_core.hosts_by_request["1"]
+        assert hedge_host != first_host
+        assert host == hedge_host
+
+        # POST requests are never hedged
+        await q.send_post_request(NormalisedURLPath("/api"), {}, None)
+        assert len(stub_core.hosts_by_request[""]) == 1
+
+
+class FakeClock:
+    """
+    A clock that moves forward only once every request sent through `gather`
+    is sleeping on it, to when the first of them wakes up. This keeps the rate
+    limiter tests independent of how fast they run.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.pending_requests = 0
+        self.sleepers: List[Tuple[float, int, "asyncio.Future[None]"]] = []
+        self.sleeps = 0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        waiter = asyncio.get_running_loop().create_future()
+        self.sleeps += 1
+        heapq.heappush(self.sleepers, (self.now + max(delay, 0), self.sleeps, waiter))
+        self.__advance()
+        await waiter
+
+    async def gather(self, *coros: Awaitable[Any], return_exceptions: bool = False):
+        async def track(coro: Awaitable[Any]):
+            try:
+                return await coro
+            finally:
+                self.pending_requests -= 1
+                self.__advance()
+
+        self.pending_requests += len(coros)
+        return await asyncio.gather(
+            *[track(c) for c in coros], return_exceptions=return_exceptions
+        )
+
+    def __advance(self):
+        if len(self.sleepers) == 0 or len(self.sleepers) < self.pending_requests:
+            return
+        wake_time, _, waiter = heapq.heappop(self.sleepers)
+        self.now = max(self.now, wake_time)
+        waiter.set_result(None)
+
+
+@fixture
+def fake_clock(monkeypatch: MonkeyPatch) -> Iterator[FakeClock]:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    yield clock
+    # The rate limiters are process wide
+    Querier.reset()
+
+
+class RateLimitedStubCore:
+    def __init__(self, clock: FakeClock, rate_per_sec: float, burst: int):
+        self.clock = clock
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill_time = clock.monotonic()
+        self.rate_limited_responses = 0
+        self.queue_depths: List[int] = []
+
+    async def handle(self, _: httpx.Request) -> httpx.Response:
+        self.queue_depths.append(Querier.get_rate_limiter_metrics()[HOST_1].queue_depth)
+        now = self.clock.monotonic()
+        self.tokens = min(
+            self.tokens + (now - self.last_refill_time) * self.rate_per_sec,
+            self.burst,
+        )
+        self.last_refill_time = now
+        if self.tokens < 1:
+            self.rate_limited_responses += 1
+            return httpx.Response(429, json={})
+        self.tokens -= 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"status": "OK"})
+
+
+async def test_rate_limiter_learns_the_core_rate_limit(fake_clock: FakeClock):
+    init_with_hosts(
+        SupertokensConfig(
+            HOST_1,
+            rate_limiter=RateLimiterConfig(additive_increase_per_sec=5),
+        )
+    )
+    q = Querier.get_instance()
+    stub_core = RateLimitedStubCore(fake_clock, rate_per_sec=20, burst=5)
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        results = await fake_clock.gather(
+            *[
+                q.send_get_request(NormalisedURLPath("/api"), {"i": i}, None)
+                for i in range(40)
+            ]
+        )
+
+    assert all(r["status"] == "OK" for r in results)
+
+    metrics = Querier.get_rate_limiter_metrics()[HOST_1]
+    assert metrics.rate_per_sec is not None
+    assert metrics.rate_limited_responses == stub_core.rate_limited_responses
+    # Without the rate limiter, the core responds with a 429 160 times, and 15
+    # of these requests run out of retries
+    assert stub_core.rate_limited_responses <= 25
+    assert metrics.shed_requests == 0
+    assert max(stub_core.queue_depths) > 0
+    assert metrics.queue_depth == 0
+
+
+async def test_rate_limiter_sheds_requests_that_cannot_be_sent_in_time(
+    fake_clock: FakeClock,
+):
+    init_with_hosts(
+        SupertokensConfig(
+            HOST_1,
+            rate_limiter=RateLimiterConfig(max_rate_per_sec=10, max_queue_wait_ms=250),
+        )
+    )
+    q = Querier.get_instance()
+    stub_core = RateLimitedStubCore(fake_clock, rate_per_sec=100, burst=100)
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        results = await fake_clock.gather(
+            *[
+                q.send_get_request(NormalisedURLPath("/api"), {"i": i}, None)
+                for i in range(6)
+            ],
+            return_exceptions=True,
+        )
+
+    # One request can be sent straight away and two more within 250ms
+    assert [isinstance(r, RateLimitExceededError) for r in results] == [
+        False,
+        False,
+        False,
+        True,
+        True,
+        True,
+    ]
+    assert Querier.get_rate_limiter_metrics()[HOST_1].shed_requests == 3
+
+
+async def test_rate_limiter_takes_back_the_token_of_a_cancelled_request():
+    limiter = AdaptiveRateLimiter(
+        RateLimiterConfig(max_rate_per_sec=1, max_queue_wait_ms=1500)
+    )
+    await limiter.acquire()
+
+    # This one has to wait a second for its token, but is cancelled
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    assert limiter.get_metrics().queue_depth == 0
+
+    # So the next one also only has to wait a second, instead of being shed
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    assert limiter.get_metrics().queue_depth == 1
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    assert limiter.get_metrics().shed_requests == 0
+
+
+class ConcurrencyTrackingStubCore:
+    def __init__(self, delay_sec: float):
+        self.delay_sec = delay_sec
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.timeouts: List[Dict[str, float]] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.timeouts.append(request.extensions["timeout"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_sec)
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(200, json={"status": "OK"})
+
+
+async def test_cached_and_shared_gets_do_not_use_rate_limiter_tokens():
+    init_with_hosts(
+        SupertokensConfig(
+            HOST_1,
+            rate_limiter=RateLimiterConfig(
+                min_rate_per_sec=1, max_rate_per_sec=1, max_queue_wait_ms=0
+            ),
+            bulkhead=BulkheadConfig(max_in_flight_per_host=1, max_queue_wait_ms=0),
+        )
+    )
+    q = Querier.get_instance()
+    stub_core = ConcurrencyTrackingStubCore(delay_sec=0.05)
+    user_context: Dict[str, Any] = {}
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        # Only one of these is sent, and the others wait for it without a
+        # token or a slot of their own
+        results = await asyncio.gather(
+            q.send_get_request(NormalisedURLPath("/api"), None, user_context),
+            *[
+                q.send_get_request(NormalisedURLPath("/api"), None, {})
+                for _ in range(4)
+            ],
+        )
+        assert all(r["status"] == "OK" for r in results)
+
+        # A cache hit isn't sent either
+        res = await q.send_get_request(NormalisedURLPath("/api"), None, user_context)
+        assert res["status"] == "OK"
+
+    assert stub_core.calls == 1
+    assert Querier.get_rate_limiter_metrics()[HOST_1].shed_requests == 0
+
+
+async def test_bulkhead_limits_requests_in_flight_and_fails_fast_past_deadline():
+    init_with_hosts(
+        SupertokensConfig(HOST_1, bulkhead=BulkheadConfig(max_in_flight_per_host=2))
+    )
+    q = Querier.get_instance()
+    stub_core = ConcurrencyTrackingStubCore(delay_sec=0.2)
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        results = await asyncio.gather(
+            *[q.send_post_request(NormalisedURLPath("/api"), {}, {}) for _ in range(4)]
+        )
+        assert all(r["status"] == "OK" for r in results)
+        assert stub_core.max_in_flight == 2
+
+        async def send_with_deadline():
+            user_context = set_core_call_deadline_in_user_context({}, 50)
+            start = time.perf_counter()
+            try:
+                await q.send_post_request(NormalisedURLPath("/api"), {}, user_context)
+                assert False
+            except DeadlineExceededError:
+                return time.perf_counter() - start
+
+        # The request waiting for a slot fails at its deadline instead of
+        # waiting for the slow requests ahead of it
+        _, _, duration = await asyncio.gather(
+            q.send_post_request(NormalisedURLPath("/api"), {}, {}),
+            q.send_post_request(NormalisedURLPath("/api"), {}, {}),
+            send_with_deadline(),
+        )
+        assert duration < 0.15
+        assert stub_core.calls == 6
+
+    # A request whose deadline has passed is not sent at all
+    user_context = set_core_call_deadline_in_user_context({}, -1)
+    try:
+        await q.send_get_request(NormalisedURLPath("/api"), None, user_context)
+        assert False
+    except DeadlineExceededError:
+        pass
+    assert stub_core.calls == 6
+
+
+async def test_bulkhead_hands_a_slot_to_a_request_on_another_threads_loop():
+    bulkhead = Bulkhead(BulkheadConfig(max_in_flight_per_host=1))
+    await bulkhead.acquire(None)
+
+    def send_from_another_thread():
+        async def send():
+            await bulkhead.acquire(None)
+            bulkhead.release()
+
+        asyncio.run(send())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread = executor.submit(send_from_another_thread)
+        while bulkhead.queue_depth == 0:
+            await asyncio.sleep(0.01)
+
+        bulkhead.release()
+        # The other loop would otherwise only notice the slot when its request
+        # times out, 10 seconds later
+        await asyncio.wait_for(asyncio.wrap_future(other_thread), 2)
+
+    assert bulkhead.in_flight == 0
+    assert bulkhead.queue_depth == 0
+
+
+async def test_request_timeout_uses_path_override_and_deadline():
+    init_with_hosts(
+        SupertokensConfig(
+            HOST_1,
+            request_timeout_ms=10000,
+            path_timeouts_ms={"/recipe/session": 2000},
+        )
+    )
+    q = Querier.get_instance()
+    stub_core = ConcurrencyTrackingStubCore(delay_sec=0)
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        await q.send_post_request(NormalisedURLPath("/public/recipe/session"), {}, None)
+        user_context = set_core_call_deadline_in_user_context({}, 500)
+        await q.send_post_request(
+            NormalisedURLPath("/public/recipe/session"), {}, user_context
+        )
+
+    assert stub_core.timeouts[0]["read"] == 10
+    assert stub_core.timeouts[1]["read"] == 2
+    assert 0 < stub_core.timeouts[2]["read"] <= 0.5
+
+
+class APIVersionStubCore:
+    def __init__(self):
+        self.api_version_calls = 0
+        self.api_versions_sent: List[Optional[str]] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/apiversion":
+            self.api_version_calls += 1
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"versions": SUPPORTED_CDI_VERSIONS})
+        self.api_versions_sent.append(request.headers.get("cdi-version"))
+        return httpx.Response(200, json={"status": "OK"})
+
+
+async def test_concurrent_requests_negotiate_the_api_version_once():
+    init_with_hosts(SupertokensConfig(HOST_1), negotiate_api_version=True)
+    q = Querier.get_instance()
+    stub_core = APIVersionStubCore()
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        results = await asyncio.gather(
+            *[q.send_post_request(NormalisedURLPath("/api"), {}, {}) for _ in range(10)]
+        )
+
+    assert all(r["status"] == "OK" for r in results)
+    assert stub_core.api_version_calls == 1
+    assert stub_core.api_versions_sent == [SUPPORTED_CDI_VERSIONS[-1]] * 10
+
+
+async def test_negotiating_the_api_version_does_not_need_a_bulkhead_slot():
+    init_with_hosts(
+        SupertokensConfig(
+            HOST_1,
+            bulkhead=BulkheadConfig(max_in_flight_per_host=1, max_queue_wait_ms=500),
+        ),
+        negotiate_api_version=True,
+    )
+    q = Querier.get_instance()
+    stub_core = APIVersionStubCore()
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        Querier.api_version = None
+        await q.send_delete_request(NormalisedURLPath("/api"), None, None)
+
+    assert stub_core.api_version_calls == 2
+    assert stub_core.api_versions_sent == [SUPPORTED_CDI_VERSIONS[-1]] * 2
+
+
+async def test_api_version_is_warmed_on_init_and_shared_through_a_file(
+    tmp_path: Path,
+):
+    stub_core = APIVersionStubCore()
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        init_with_hosts(
+            SupertokensConfig(
+                HOST_1,
+                warm_api_version_on_init=True,
+                api_version_cache_dir=str(tmp_path),
+            ),
+            negotiate_api_version=True,
+        )
+        # With an event loop running, the version is fetched in the background
+        assert Querier.api_version is None
+        # The background task is referenced until it is done
+        gc.collect()
+        for _ in range(100):
+            if Querier.api_version is not None:
+                break
+            await asyncio.sleep(0.05)
+        assert Querier.api_version == SUPPORTED_CDI_VERSIONS[-1]
+        await Querier.get_instance().send_post_request(
+            NormalisedURLPath("/api"), {}, {}
+        )
+        assert stub_core.api_version_calls == 1
+
+        # A new process on the same host reads it from the file
+        init_with_hosts(
+            SupertokensConfig(HOST_1, api_version_cache_dir=str(tmp_path)),
+            negotiate_api_version=True,
+        )
+        await Querier.get_instance().send_post_request(
+            NormalisedURLPath("/api"), {}, {}
+        )
+        assert stub_core.api_version_calls == 1
+        assert stub_core.api_versions_sent == [SUPPORTED_CDI_VERSIONS[-1]] * 2
+
+
+async def test_identical_concurrent_gets_are_sent_once_across_requests():
+    init_with_hosts(SupertokensConfig(HOST_1))
+    q = Querier.get_instance()
+    stub_core = ConcurrencyTrackingStubCore(delay_sec=0.1)
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        # Each call has its own user_context, like separate API requests
+        results = await asyncio.gather(
+            *[
+                q.send_get_request(NormalisedURLPath("/api"), {"a": "1"}, {})
+                for _ in range(20)
+            ],
+            q.send_get_request(NormalisedURLPath("/api"), {"a": "2"}, {}),
+        )
+        assert all(r["status"] == "OK" for r in results)
+        assert stub_core.calls == 2
+
+        # Nothing is cached once the request completes
+        await q.send_get_request(NormalisedURLPath("/api"), {"a": "1"}, {})
+        assert stub_core.calls == 3
+
+        # A GET made after a write doesn't wait for one sent before it
+        first_get = asyncio.ensure_future(
+            q.send_get_request(NormalisedURLPath("/api"), {"a": "1"}, {})
+        )
+        await asyncio.sleep(0.02)
+        await q.send_post_request(NormalisedURLPath("/api"), {}, {})
+        await asyncio.gather(
+            first_get,
+            q.send_get_request(NormalisedURLPath("/api"), {"a": "1"}, {}),
+        )
+        assert stub_core.calls == 6
+
+
+async def test_get_waiting_for_a_shared_get_can_be_cancelled():
+    init_with_hosts(SupertokensConfig(HOST_1))
+    q = Querier.get_instance()
+    stub_core = ConcurrencyTrackingStubCore(delay_sec=0.1)
+
+    def send_get():
+        return asyncio.ensure_future(
+            q.send_get_request(NormalisedURLPath("/api"), {"a": "1"}, {})
+        )
+
+    with respx.mock() as mocker:
+        mocker.route(url__startswith=HOST_1).mock(side_effect=stub_core.handle)
+
+        # When the request being waited for is cancelled, the waiting one is
+        # sent instead
+        first_get, second_get = send_get(), send_get()
+        await asyncio.sleep(0.02)
+        first_get.cancel()
+        assert (await second_get)["status"] == "OK"
+        assert stub_core.calls == 2
+
+        # Unless it is cancelled too
+        first_get, second_get = send_get(), send_get()
+        await asyncio.sleep(0.02)
+        first_get.cancel()
+        second_get.cancel()
+        await asyncio.gather(first_get, second_get, return_exceptions=True)
+        assert first_get.cancelled() and second_get.cancelled()
+        assert stub_core.calls == 3
+
+
+async def test_slow_core_requests_are_logged_with_the_timing_breakdown(
+    caplog: LogCaptureFixture,
+):
+    init_with_hosts(SupertokensConfig(HOST_1))
+    q = Querier.get_instance()
+    stub_cores = StubCores(down_hosts=[], delays_sec={HOST_1: 0.3})
+    # Well above how long a request to the stub core takes on a loaded machine
+    slow_request_logger = SlowRequestLogger(threshold_ms=200)
+    add_timing_hook(slow_request_logger)
+
+    try:
+        with respx.mock() as mocker:
+            mocker.route(url__startswith=HOST_1).mock(side_effect=stub_cores.handle)
+
+            user_context: Dict[str, Any] = {}
+            stub_cores.delays_sec = {HOST_1: 0}
+            await q.send_get_request(NormalisedURLPath("/fast"), None, user_context)
+            stub_cores.delays_sec = {HOST_1: 0.3}
+            with caplog.at_level(logging.WARNING):
+                await q.send_post_request(NormalisedURLPath("/slow"), {}, user_context)
+    finally:
+        remove_timing_hook(slow_request_logger)
+
+    spans = get_timing_spans(user_context)
+    assert [(s.name, s.attributes["path"], s.attributes["method"]) for s in spans] == [
+        ("core_request", "/fast", "GET"),
+        ("core_request", "/slow", "POST"),
+    ]
+    assert spans[1].attributes["host"] == HOST_1
+    assert spans[1].attributes["status"] == 200
+    assert spans[1].duration_ms >= 300
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "Slow core_request" in warnings[0].getMessage()
+    assert warnings[0].getMessage().count("core_request=") == 2
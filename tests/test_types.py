@@ -0,0 +1,97 @@
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Tuple
+
+from supertokens_python.types import LoginMethod, User
+
+
+def get_user_json(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"user-{i}",
+        "isPrimaryUser": False,
+        "tenantIds": ["public"],
+        "emails": [f"user{i}@example.com"],
+        "phoneNumbers": [],
+        "thirdParty": [{"id": "google", "userId": f"google-{i}"}],
+        "loginMethods": [
+            {
+                "recipeId": "emailpassword",
+                "recipeUserId": f"user-{i}",
+                "tenantIds": ["public"],
+                "email": f"user{i}@example.com",
+                "timeJoined": 1700000000000,
+                "verified": True,
+            },
+            {
+                "recipeId": "thirdparty",
+                "recipeUserId": f"user-tp-{i}",
+                "tenantIds": ["public"],
+                "email": f"user{i}@example.com",
+                "thirdParty": {"id": "google", "userId": f"google-{i}"},
+                "timeJoined": 1700000000000,
+                "verified": True,
+            },
+        ],
+        "timeJoined": 1700000000000,
+    }
+
+
+def test_user_json_round_trip():
+    user_json = get_user_json(1)
+    user = User.from_json(user_json)
+
+    assert user.to_json() == user_json
+    assert User.from_json(user.to_json()) == user
+    assert user.login_methods[1].third_party is not None
+    assert user.login_methods[1].third_party.user_id == "google-1"
+    assert user.login_methods[0].third_party is None
+
+
+def test_user_and_login_method_have_no_instance_dict():
+    user = User.from_json(get_user_json(1))
+
+    assert not hasattr(user, "__dict__")
+    assert not hasattr(user.login_methods[0], "__dict__")
+    assert not hasattr(user.login_methods[0].recipe_user_id, "__dict__")
+
+
+def copy_with_instance_dicts(obj: Any) -> Any:
+    # The same objects as the ones User.from_json builds, but each with a
+    # __dict__, as they were before they had __slots__
+    if isinstance(obj, list):
+        return [copy_with_instance_dicts(o) for o in obj]  # type: ignore
+    slots = [s for c in type(obj).__mro__ for s in getattr(c, "__slots__", [])]
+    if len(slots) == 0:
+        return obj
+    return SimpleNamespace(
+        **{s: copy_with_instance_dicts(getattr(obj, s)) for s in slots}
+    )
+
+
+def get_allocated_bytes(f: Callable[[], Any]) -> Tuple[Any, int]:
+    tracemalloc.start()
+    try:
+        result = f()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, allocated
+
+
+def test_memory_for_materialising_users():
+    # Shaped like a user pagination response from the core
+    response = {"users": [get_user_json(i) for i in range(10_000)]}
+
+    users, allocated = get_allocated_bytes(
+        lambda: [User.from_json(u) for u in response["users"]]
+    )
+    # Strings are shared with the response in both cases, so this compares
+    # the cost of the objects and lists. The numbers depend on the
+    # interpreter, but the objects with a __dict__ are always bigger.
+    _, allocated_with_dicts = get_allocated_bytes(
+        lambda: copy_with_instance_dicts(users)
+    )
+
+    assert len(users) == 10_000
+    assert isinstance(users[-1].login_methods[0], LoginMethod)
+    assert allocated < 0.8 * allocated_with_dicts
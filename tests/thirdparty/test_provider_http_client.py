@@ -0,0 +1,141 @@
+import asyncio
+from typing import List
+
+import httpx
+import respx
+from pytest import fixture, mark
+
+from supertokens_python import Supertokens
+from supertokens_python.recipe.thirdparty.providers.utils import (
+    ProviderHTTPClientConfig,
+    ProviderRequestTiming,
+    close_provider_http_clients,
+    do_get_request,
+    do_post_request,
+    get_provider_http_client,
+    set_provider_http_client_config,
+)
+
+pytestmark = mark.asyncio
+
+respx_mock = respx.MockRouter
+
+
+@fixture(autouse=True)
+def reset_http_client_config():
+    set_provider_http_client_config(ProviderHTTPClientConfig())
+    yield
+    set_provider_http_client_config(ProviderHTTPClientConfig())
+
+
+async def test_client_is_reused_per_host():
+    github_client = get_provider_http_client("https://api.github.com/user")
+    assert get_provider_http_client("https://api.github.com/user/emails") is (
+        github_client
+    )
+    assert get_provider_http_client("https://github.com/login") is not github_client
+
+
+async def test_clients_are_closed_when_the_pool_is_reset():
+    client = get_provider_http_client("https://api.github.com/user")
+    set_provider_http_client_config(ProviderHTTPClientConfig(timeout=5.0))
+    await asyncio.sleep(0.01)
+    assert client.is_closed
+    assert get_provider_http_client("https://api.github.com/user") is not client
+
+    client = get_provider_http_client("https://api.github.com/user")
+    Supertokens.reset()
+    await asyncio.sleep(0.01)
+    assert client.is_closed
+
+    client = get_provider_http_client("https://api.github.com/user")
+    await close_provider_http_clients()
+    assert client.is_closed
+
+
+async def test_provider_timeout_and_timing_hook():
+    timings: List[ProviderRequestTiming] = []
+    timeouts: List[float] = []
+
+    set_provider_http_client_config(
+        ProviderHTTPClientConfig(
+            timeout=30.0,
+            provider_timeouts={"github": 5.0},
+            on_request_complete=timings.append,
+        )
+    )
+
+    def side_effect(request: httpx.Request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"id": 1})
+
+    with respx_mock() as mocker:
+        mocker.get("https://api.github.com/user").mock(side_effect=side_effect)
+        mocker.post("https://github.com/login/oauth/access_token").mock(
+            side_effect=side_effect
+        )
+
+        assert await do_get_request(
+            "https://api.github.com/user", {"a": "b"}, provider_id="github"
+        ) == {"id": 1}
+        status, body = await do_post_request(
+            "https://github.com/login/oauth/access_token", {"code": "c"}
+        )
+        assert status == 200
+        assert body == {"id": 1}
+
+    assert timeouts == [5.0, 30.0]
+    assert [(t.provider_id, t.method, t.endpoint, t.status_code) for t in timings] == [
+        ("github", "GET", "https://api.github.com/user", 200),
+        (None, "POST", "https://github.com/login/oauth/access_token", 200),
+    ]
+    assert all(t.duration_ms >= 0 for t in timings)
+
+
+async def test_cookies_are_not_kept_between_requests():
+    cookies_sent: List[str] = []
+
+    def side_effect(request: httpx.Request):
+        cookies_sent.append(request.headers.get("cookie", ""))
+        return httpx.Response(
+            200, json={"id": 1}, headers={"set-cookie": "session=user-1; Path=/"}
+        )
+
+    with respx_mock() as mocker:
+        mocker.post("https://github.com/login/oauth/access_token").mock(
+            side_effect=side_effect
+        )
+
+        # Two users signing in one after the other
+        for _ in range(2):
+            await do_post_request(
+                "https://github.com/login/oauth/access_token", {"code": "c"}
+            )
+
+    assert cookies_sent == ["", ""]
+
+
+async def test_failing_timing_hook_does_not_fail_the_request():
+    def on_request_complete(_: ProviderRequestTiming):
+        raise Exception("hook failed")
+
+    set_provider_http_client_config(
+        ProviderHTTPClientConfig(on_request_complete=on_request_complete)
+    )
+
+    with respx_mock() as mocker:
+        mocker.get("https://api.github.com/user").mock(
+            return_value=httpx.Response(200, json={"id": 1})
+        )
+        mocker.get("https://api.github.com/down").mock(
+            side_effect=httpx.ConnectError("connection refused")
+        )
+
+        assert await do_get_request("https://api.github.com/user") == {"id": 1}
+
+        # The provider's error isn't replaced by the hook's
+        try:
+            await do_get_request("https://api.github.com/down")
+            assert False
+        except httpx.ConnectError:
+            pass
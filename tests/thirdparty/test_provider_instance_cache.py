@@ -0,0 +1,85 @@
+from typing import Any, Dict, Optional
+
+from pytest import fixture, mark
+
+from supertokens_python.recipe.thirdparty.provider import (
+    Provider,
+    ProviderClientConfig,
+    ProviderConfig,
+    ProviderConfigForClient,
+    ProviderInput,
+)
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    clear_provider_instance_cache,
+    get_provider_instance_for_tenant,
+)
+
+pytestmark = mark.asyncio
+
+
+@fixture(autouse=True)
+def reset_provider_instance_cache():
+    clear_provider_instance_cache()
+    yield
+    clear_provider_instance_cache()
+
+
+def custom_provider_config(client_id: str) -> ProviderConfig:
+    return ProviderConfig(
+        third_party_id="custom",
+        clients=[ProviderClientConfig(client_id=client_id)],
+        authorization_endpoint="https://example.com/oauth/authorize",
+        token_endpoint="https://example.com/oauth/token",
+    )
+
+
+async def get_provider(core_configs: Any, static_inputs: Any) -> Optional[Provider]:
+    return await get_provider_instance_for_tenant(
+        "public", core_configs, static_inputs, True, "custom", None, {}
+    )
+
+
+async def test_static_provider_instance_is_reused():
+    static_inputs = [ProviderInput(custom_provider_config("static-client"))]
+
+    provider = await get_provider([], static_inputs)
+    assert provider is not None
+    assert provider.config.client_id == "static-client"
+    assert await get_provider([], static_inputs) is provider
+
+    clear_provider_instance_cache("public")
+    assert await get_provider([], static_inputs) is not provider
+
+
+async def test_core_config_change_invalidates_provider_instance():
+    provider = await get_provider([custom_provider_config("core-client")], [])
+    assert provider is not None
+    assert await get_provider([custom_provider_config("core-client")], []) is provider
+
+    updated = await get_provider([custom_provider_config("updated-client")], [])
+    assert updated is not None
+    assert updated is not provider
+    assert updated.config.client_id == "updated-client"
+
+    assert await get_provider([ProviderConfig(third_party_id="other")], []) is None
+
+
+async def test_overridden_get_config_for_client_type_is_not_cached():
+    def override(original: Provider) -> Provider:
+        original_get_config = original.get_config_for_client_type
+
+        async def get_config_for_client_type(
+            client_type: Optional[str], user_context: Dict[str, Any]
+        ) -> ProviderConfigForClient:
+            return await original_get_config(client_type, user_context)
+
+        original.get_config_for_client_type = get_config_for_client_type
+        return original
+
+    static_inputs = [
+        ProviderInput(custom_provider_config("static-client"), override=override)
+    ]
+
+    provider = await get_provider([], static_inputs)
+    assert provider is not None
+    assert await get_provider([], static_inputs) is not provider
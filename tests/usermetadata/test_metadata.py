@@ -21,6 +21,7 @@ from supertokens_python.recipe import usermetadata
 from supertokens_python.recipe.usermetadata.asyncio import (
     clear_user_metadata,
     get_user_metadata,
+    get_users_metadata,
     update_user_metadata,
 )
 from supertokens_python.recipe.usermetadata.interfaces import (
@@ -196,3 +197,32 @@ async def test_recipe_override():
     assert res.metadata == {}
 
     assert override_used is True
+
+
+@mark.asyncio
+async def test_get_users_metadata_fetches_each_user_once():
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.supertokens.io",
+            website_domain="supertokens.io",
+        ),
+        framework="fastapi",
+        recipe_list=[usermetadata.init()],
+    )
+    start_st()
+
+    version = await Querier.get_instance().get_api_version()
+    if not is_version_gte(version, "2.13"):
+        # If the version less than 2.13, user metadata doesn't exist. So skip the test
+        skip()
+
+    await update_user_metadata("user1", {"first_name": "John"})
+    await update_user_metadata("user2", {"first_name": "Jane"})
+
+    res = await get_users_metadata(["user1", "user2", "user3", "user1"], 2)
+    assert list(res.keys()) == ["user1", "user2", "user3"]
+    assert res["user1"].metadata == {"first_name": "John"}
+    assert res["user2"].metadata == {"first_name": "Jane"}
+    assert res["user3"].metadata == {}